@@ -121,6 +121,67 @@ class ServiceBusConfig:
     worker_subscription_name: str = SERVICEBUS_WORKER_SUBSCRIPTION_NAME
 
 
+@dataclass(frozen=True)
+class PipelineConfig:
+    """Hold agent pipeline tuning settings for the worker."""
+
+    fused_review_max_tokens: int = field(
+        default_factory=lambda: int(_env("PIPELINE_FUSED_REVIEW_MAX_TOKENS", "2000"))
+    )
+    tool_result_max_chars: int = field(
+        default_factory=lambda: int(_env("PIPELINE_TOOL_RESULT_MAX_CHARS", "280"))
+    )
+    change_feed_max_in_flight: int = field(
+        default_factory=lambda: int(_env("PIPELINE_CHANGE_FEED_MAX_IN_FLIGHT", "100"))
+    )
+    change_feed_poll_min_seconds: float = field(
+        default_factory=lambda: float(
+            _env("PIPELINE_CHANGE_FEED_POLL_MIN_SECONDS", "1.0")
+        )
+    )
+    change_feed_poll_max_seconds: float = field(
+        default_factory=lambda: float(
+            _env("PIPELINE_CHANGE_FEED_POLL_MAX_SECONDS", "10.0")
+        )
+    )
+    change_feed_checkpoint_interval_seconds: float = field(
+        default_factory=lambda: float(
+            _env("PIPELINE_CHANGE_FEED_CHECKPOINT_INTERVAL_SECONDS", "5.0")
+        )
+    )
+    change_feed_checkpoint_max_items: int = field(
+        default_factory=lambda: int(
+            _env("PIPELINE_CHANGE_FEED_CHECKPOINT_MAX_ITEMS", "50")
+        )
+    )
+    link_concurrency: int = field(
+        default_factory=lambda: int(_env("PIPELINE_LINK_CONCURRENCY", "20"))
+    )
+    feedback_concurrency: int = field(
+        default_factory=lambda: int(_env("PIPELINE_FEEDBACK_CONCURRENCY", "4"))
+    )
+    publish_concurrency: int = field(
+        default_factory=lambda: int(_env("PIPELINE_PUBLISH_CONCURRENCY", "1"))
+    )
+    claim_ttl_seconds: float = field(
+        default_factory=lambda: float(_env("PIPELINE_CLAIM_TTL_SECONDS", "60.0"))
+    )
+    worker_heartbeat_ttl_seconds: float = field(
+        default_factory=lambda: float(
+            _env("PIPELINE_WORKER_HEARTBEAT_TTL_SECONDS", "60.0")
+        )
+    )
+    drain_timeout_seconds: float = field(
+        default_factory=lambda: float(_env("PIPELINE_DRAIN_TIMEOUT_SECONDS", "25.0"))
+    )
+    stage_timeout_seconds: float = field(
+        default_factory=lambda: float(_env("PIPELINE_STAGE_TIMEOUT_SECONDS", "300.0"))
+    )
+    run_timeout_seconds: float = field(
+        default_factory=lambda: float(_env("PIPELINE_RUN_TIMEOUT_SECONDS", "900.0"))
+    )
+
+
 @dataclass(frozen=True)
 class AppConfig:
     """Hold general application settings."""
@@ -134,6 +195,9 @@ class AppConfig:
     slow_repository_ms: int = field(
         default_factory=lambda: int(_env("APP_SLOW_REPOSITORY_MS", "250"))
     )
+    repository_retry_budget_ms: int = field(
+        default_factory=lambda: int(_env("APP_REPOSITORY_RETRY_BUDGET_MS", "5000"))
+    )
 
     @property
     def is_development(self) -> bool:
@@ -152,6 +216,7 @@ class Settings:
     monitor: MonitorConfig = field(default_factory=MonitorConfig)
     memory: FoundryMemoryConfig = field(default_factory=FoundryMemoryConfig)
     servicebus: ServiceBusConfig = field(default_factory=ServiceBusConfig)
+    pipeline: PipelineConfig = field(default_factory=PipelineConfig)
     app: AppConfig = field(default_factory=AppConfig)
 
 
@@ -3,15 +3,18 @@
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING, ClassVar, cast
+from typing import TYPE_CHECKING, Any, ClassVar, cast
 
 from azure.core.exceptions import ServiceRequestError
 from azure.cosmos import PartitionKey
 from azure.cosmos.aio import CosmosClient as AzureCosmosClient
 from azure.cosmos.aio import DatabaseProxy
 
+from curate_common.database.indexing import INDEXING_POLICIES, policy_matches
+
 if TYPE_CHECKING:
     from azure.core.credentials_async import AsyncTokenCredential
+    from azure.cosmos.aio import ContainerProxy
 
     from curate_common.config import CosmosConfig
 
@@ -33,13 +36,13 @@ class CosmosClient:
         self._credential: AsyncTokenCredential | None = None
         self._database: DatabaseProxy | None = None
 
-    _CONTAINERS: ClassVar[list[tuple[str, str]]] = [
-        ("editions", "/id"),
-        ("links", "/id"),
-        ("feedback", "/edition_id"),
-        ("agent_runs", "/edition_id"),
-        ("revisions", "/edition_id"),
-        ("metadata", "/id"),
+    _CONTAINERS: ClassVar[list[tuple[str, str, dict[str, Any]]]] = [
+        ("editions", "/id", INDEXING_POLICIES["editions"]),
+        ("links", "/id", INDEXING_POLICIES["links"]),
+        ("feedback", "/edition_id", INDEXING_POLICIES["feedback"]),
+        ("agent_runs", "/edition_id", INDEXING_POLICIES["agent_runs"]),
+        ("revisions", "/edition_id", INDEXING_POLICIES["revisions"]),
+        ("metadata", "/id", INDEXING_POLICIES["metadata"]),
     ]
 
     async def initialize(self) -> None:
@@ -60,10 +63,8 @@ class CosmosClient:
                 "DatabaseProxy",
                 await self._client.create_database_if_not_exists(self._config.database),
             )
-            for name, partition_key in self._CONTAINERS:
-                await db.create_container_if_not_exists(
-                    id=name, partition_key=PartitionKey(path=partition_key)
-                )
+            for name, partition_key, policy in self._CONTAINERS:
+                await self._ensure_container(db, name, partition_key, policy)
         except (ServiceRequestError, ConnectionError, OSError) as exc:
             msg = (
                 f"Unable to reach Cosmos DB at {self._config.endpoint} — "
@@ -77,6 +78,29 @@ class CosmosClient:
             self._config.database,
         )
 
+    @staticmethod
+    async def _ensure_container(
+        db: DatabaseProxy, name: str, partition_key: str, policy: dict[str, Any]
+    ) -> None:
+        """Create a container, replacing its indexing policy if it has drifted."""
+        container = cast(
+            "ContainerProxy",
+            await db.create_container_if_not_exists(
+                id=name,
+                partition_key=PartitionKey(path=partition_key),
+                indexing_policy=policy,
+            ),
+        )
+        properties = await container.read()
+        if policy_matches(properties.get("indexingPolicy"), policy):
+            return
+        await db.replace_container(
+            container,
+            partition_key=PartitionKey(path=partition_key),
+            indexing_policy=policy,
+        )
+        logger.info("Indexing policy reconciled — container=%s", name)
+
     async def close(self) -> None:
         """Close the underlying client."""
         if self._client:
@@ -0,0 +1,88 @@
+"""Declared Cosmos DB indexing policies for each container.
+
+Every container indexes everything except large bodies that are never
+filtered or sorted on. Article and edition content, agent run inputs and
+outputs, and revision snapshots are excluded, so writes do not pay to
+index them. Composite indexes cover the repositories' filtered
+``ORDER BY`` queries, which lead their ORDER BY with the equality-filtered
+property so the composite is used, and the ``(sort field, id)`` order of
+keyset-paginated list pages. ``CosmosClient.initialize`` applies
+these policies and reconciles existing containers whose policy has
+drifted.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+# Cosmos DB adds this exclusion to every policy on its own.
+_SYSTEM_EXCLUDED_PATH = '/"_etag"/?'
+
+
+def _policy(
+    *,
+    excluded: tuple[str, ...] = (),
+    included: tuple[str, ...] = (),
+    composites: tuple[tuple[tuple[str, str], ...], ...] = (),
+) -> dict[str, Any]:
+    """Build a consistent indexing policy that indexes ``/*`` by default."""
+    return {
+        "indexingMode": "consistent",
+        "automatic": True,
+        "includedPaths": [{"path": path} for path in (*included, "/*")],
+        "excludedPaths": [
+            {"path": path} for path in (*excluded, _SYSTEM_EXCLUDED_PATH)
+        ],
+        "compositeIndexes": [
+            [{"path": path, "order": order} for path, order in composite]
+            for composite in composites
+        ],
+    }
+
+
+INDEXING_POLICIES: dict[str, dict[str, Any]] = {
+    "links": _policy(
+        excluded=("/content/?", "/review/*"),
+        composites=((("/created_at", "descending"), ("/id", "descending")),),
+    ),
+    "editions": _policy(
+        # next_issue_number reads MAX(c.content.issue_number).
+        included=("/content/issue_number/?",),
+        excluded=("/content/*", "/link_sections/*"),
+        composites=(
+            (("/status", "ascending"), ("/published_at", "descending")),
+            (("/created_at", "descending"), ("/id", "descending")),
+        ),
+    ),
+    "feedback": _policy(),
+    "agent_runs": _policy(
+        excluded=("/input/*", "/output/*"),
+        composites=(
+            (("/stage", "ascending"), ("/started_at", "descending")),
+            (("/status", "ascending"), ("/started_at", "descending")),
+            (("/started_at", "descending"), ("/id", "descending")),
+        ),
+    ),
+    "revisions": _policy(excluded=("/content/*",)),
+    "metadata": _policy(excluded=("/feed_range/*",)),
+}
+
+
+def _normalized(policy: dict[str, Any]) -> tuple[object, ...]:
+    """Return the parts of a policy that matter for comparison."""
+    composites = frozenset(
+        tuple((index["path"], index.get("order", "ascending")) for index in composite)
+        for composite in policy.get("compositeIndexes") or []
+    )
+    return (
+        str(policy.get("indexingMode", "consistent")).lower(),
+        frozenset(path["path"] for path in policy.get("includedPaths") or []),
+        frozenset(path["path"] for path in policy.get("excludedPaths") or [])
+        | {_SYSTEM_EXCLUDED_PATH},
+        composites,
+    )
+
+
+def policy_matches(current: dict[str, Any] | None, declared: dict[str, Any]) -> bool:
+    """Return True when a container's current policy equals the declared one."""
+    return current is not None and _normalized(current) == _normalized(declared)
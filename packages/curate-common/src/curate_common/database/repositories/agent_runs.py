@@ -2,17 +2,61 @@
 
 from __future__ import annotations
 
+import json
+import logging
 from datetime import UTC, datetime
+from typing import TYPE_CHECKING
 
-from curate_common.database.repositories.base import BaseRepository
+from curate_common.database.repositories.base import (
+    DEFAULT_PAGE_SIZE,
+    BaseRepository,
+    Page,
+)
 from curate_common.models.agent_run import AgentRun, AgentRunStatus, AgentStage
 
+if TYPE_CHECKING:
+    from collections.abc import Collection
+
+logger = logging.getLogger(__name__)
+
+_RECOVERED_OUTPUT = {"error": "Recovered after process restart"}
+_STILL_RUNNING = f"FROM c WHERE c.status = {json.dumps(AgentRunStatus.RUNNING.value)}"
+
 
 class AgentRunRepository(BaseRepository[AgentRun]):
     """Provide data access for the agent_runs container."""
 
     container_name = "agent_runs"
     model_class = AgentRun
+    partition_field = "edition_id"
+
+    async def complete(self, run: AgentRun) -> AgentRun | None:
+        """Record a finished run's outcome with a partial update.
+
+        Only the status, completion time, output, and usage are written, and
+        only while the stored run is still running, so a run already closed
+        elsewhere (for example by orphan recovery) is left as it is. Returns
+        None in that case.
+        """
+        changes = {
+            "status": run.status,
+            "completed_at": run.completed_at or datetime.now(UTC),
+            "output": run.output,
+            "usage": run.usage,
+        }
+        completed = await self.patch(
+            run.id,
+            run.edition_id,
+            {name: value for name, value in changes.items() if value is not None},
+            condition=_STILL_RUNNING,
+        )
+        if completed is None:
+            logger.info(
+                "Run was no longer running — run=%s edition=%s",
+                run.id,
+                run.edition_id,
+            )
+        return completed
 
     async def list_by_edition(self, edition_id: str) -> list[AgentRun]:
         """Fetch all runs for a specific edition."""
@@ -20,19 +64,23 @@ class AgentRunRepository(BaseRepository[AgentRun]):
             "SELECT * FROM c WHERE c.edition_id = @edition_id"
             " AND NOT IS_DEFINED(c.deleted_at)",
             [{"name": "@edition_id", "value": edition_id}],
+            partition_key=edition_id,
         )
         return sorted(runs, key=lambda r: r.started_at or r.created_at, reverse=True)
 
-    async def get_by_trigger(self, trigger_id: str) -> list[AgentRun]:
-        """Fetch all runs triggered by a specific document."""
+    async def get_by_trigger(self, trigger_id: str, edition_id: str) -> list[AgentRun]:
+        """Fetch the runs a document triggered within an edition's partition."""
         return await self.query(
             "SELECT * FROM c WHERE c.trigger_id = @trigger_id"
             " AND NOT IS_DEFINED(c.deleted_at)",
             [{"name": "@trigger_id", "value": trigger_id}],
+            partition_key=edition_id,
         )
 
-    async def get_by_stage(self, trigger_id: str, stage: AgentStage) -> list[AgentRun]:
-        """Fetch runs for a specific stage and trigger."""
+    async def get_by_stage(
+        self, trigger_id: str, stage: AgentStage, edition_id: str
+    ) -> list[AgentRun]:
+        """Fetch runs for a specific stage and trigger within an edition."""
         return await self.query(
             "SELECT * FROM c"
             " WHERE c.trigger_id = @trigger_id"
@@ -42,16 +90,20 @@ class AgentRunRepository(BaseRepository[AgentRun]):
                 {"name": "@trigger_id", "value": trigger_id},
                 {"name": "@stage", "value": stage.value},
             ],
+            partition_key=edition_id,
         )
 
-    async def get_by_triggers(self, trigger_ids: list[str]) -> list[AgentRun]:
-        """Fetch all runs for a list of trigger IDs."""
+    async def get_by_triggers(
+        self, trigger_ids: list[str], edition_id: str
+    ) -> list[AgentRun]:
+        """Fetch the runs for a list of trigger IDs within an edition's partition."""
         if not trigger_ids:
             return []
         runs = await self.query(
             "SELECT * FROM c WHERE ARRAY_CONTAINS(@trigger_ids, c.trigger_id)"
             " AND NOT IS_DEFINED(c.deleted_at)",
             [{"name": "@trigger_ids", "value": trigger_ids}],
+            partition_key=edition_id,
         )
         return sorted(runs, key=lambda r: r.started_at or r.created_at, reverse=True)
 
@@ -64,13 +116,26 @@ class AgentRunRepository(BaseRepository[AgentRun]):
             [{"name": "@limit", "value": limit}],
         )
 
+    async def list_page(
+        self, *, page_size: int = DEFAULT_PAGE_SIZE, continuation: str | None = None
+    ) -> Page[AgentRun]:
+        """Fetch a page of agent runs across all triggers, most recent first."""
+        return await self.query_page(
+            AgentRun,
+            "SELECT * FROM c WHERE NOT IS_DEFINED(c.deleted_at)",
+            order_by="started_at",
+            page_size=page_size,
+            continuation=continuation,
+        )
+
     async def list_recent_by_stage(
         self, stage: AgentStage, limit: int = 5
     ) -> list[AgentRun]:
         """Fetch the most recent agent runs for a specific stage."""
         return await self.query(
             "SELECT TOP @limit * FROM c WHERE c.stage = @stage"
-            " AND NOT IS_DEFINED(c.deleted_at) ORDER BY c.started_at DESC",
+            " AND NOT IS_DEFINED(c.deleted_at)"
+            " ORDER BY c.stage ASC, c.started_at DESC",
             [
                 {"name": "@stage", "value": stage.value},
                 {"name": "@limit", "value": limit},
@@ -80,11 +145,14 @@ class AgentRunRepository(BaseRepository[AgentRun]):
     async def count_by_status(self, limit: int = 100) -> dict[str, int]:
         """Return recent run counts grouped by status."""
         counts: dict[str, int] = {}
-        async for item in self._container.query_items(
-            "SELECT TOP @limit c.status FROM c"
-            " WHERE NOT IS_DEFINED(c.deleted_at)"
-            " ORDER BY c.started_at DESC",
-            parameters=[{"name": "@limit", "value": limit}],
+        async for item in self._stream(
+            "count_by_status",
+            self._container.query_items(
+                "SELECT TOP @limit c.status FROM c"
+                " WHERE NOT IS_DEFINED(c.deleted_at)"
+                " ORDER BY c.started_at DESC",
+                parameters=[{"name": "@limit", "value": limit}],
+            ),
         ):
             status = item["status"]
             counts[status] = counts.get(status, 0) + 1
@@ -93,12 +161,15 @@ class AgentRunRepository(BaseRepository[AgentRun]):
     async def aggregate_token_usage(self, limit: int = 100) -> dict[str, int]:
         """Return total token usage across recent runs."""
         totals = {"input_tokens": 0, "output_tokens": 0, "total_tokens": 0}
-        async for item in self._container.query_items(
-            "SELECT TOP @limit c.usage FROM c"
-            " WHERE c.usage != null"
-            " AND NOT IS_DEFINED(c.deleted_at)"
-            " ORDER BY c.started_at DESC",
-            parameters=[{"name": "@limit", "value": limit}],
+        async for item in self._stream(
+            "aggregate_token_usage",
+            self._container.query_items(
+                "SELECT TOP @limit c.usage FROM c"
+                " WHERE c.usage != null"
+                " AND NOT IS_DEFINED(c.deleted_at)"
+                " ORDER BY c.started_at DESC",
+                parameters=[{"name": "@limit", "value": limit}],
+            ),
         ):
             usage = item.get("usage") or {}
             totals["input_tokens"] += usage.get("input_tokens", 0)
@@ -106,39 +177,51 @@ class AgentRunRepository(BaseRepository[AgentRun]):
             totals["total_tokens"] += usage.get("total_tokens", 0)
         return totals
 
-    async def recover_orphaned_runs(self) -> int:
-        """Transition any RUNNING runs without a completed_at to FAILED.
+    async def recover_orphaned_runs(self, live_workers: Collection[str] = ()) -> int:
+        """Transition RUNNING runs whose worker is gone to FAILED.
 
-        Called on startup to clean up runs orphaned by a prior crash.
+        Called at startup and then periodically to clean up runs orphaned
+        by a crashed worker. Runs owned by a worker in ``live_workers`` are
+        left alone so a replica does not fail its peers' healthy runs; runs
+        without a ``worker_id`` predate ownership and are always recovered.
+        Orphans are failed with bulk transactional batches per edition
+        partition, and a run that finished in the meantime is not overwritten.
         """
-        orphaned = await self.query(
-            "SELECT * FROM c WHERE c.status = @status"
+        result = await self.bulk_patch(
+            "c.status = @status"
             " AND NOT IS_DEFINED(c.completed_at)"
+            " AND (NOT IS_DEFINED(c.worker_id)"
+            " OR NOT ARRAY_CONTAINS(@live_workers, c.worker_id))"
             " AND NOT IS_DEFINED(c.deleted_at)",
-            [{"name": "@status", "value": AgentRunStatus.RUNNING.value}],
+            [
+                {"name": "@status", "value": AgentRunStatus.RUNNING.value},
+                {"name": "@live_workers", "value": list(live_workers)},
+            ],
+            {
+                "status": AgentRunStatus.FAILED,
+                "completed_at": datetime.now(UTC),
+                "output": _RECOVERED_OUTPUT,
+            },
+            condition=_STILL_RUNNING,
         )
-        for run in orphaned:
-            run.status = AgentRunStatus.FAILED
-            run.completed_at = datetime.now(UTC)
-            run.output = {"error": "Recovered after process restart"}
-            await self.update(run, run.edition_id)
-        return len(orphaned)
+        return result.succeeded
 
     async def clear_all(self) -> int:
         """Soft-delete all non-deleted agent runs. Return count cleared."""
-        runs = await self.query(
-            "SELECT * FROM c WHERE NOT IS_DEFINED(c.deleted_at)",
+        result = await self.bulk_patch(
+            "NOT IS_DEFINED(c.deleted_at)",
             [],
+            {"deleted_at": datetime.now(UTC)},
+            condition="FROM c WHERE NOT IS_DEFINED(c.deleted_at)",
         )
-        for run in runs:
-            await self.soft_delete(run, run.edition_id)
-        return len(runs)
+        return result.succeeded
 
     async def list_recent_failures(self, limit: int = 5) -> list[AgentRun]:
         """Fetch the most recent failed agent runs."""
         return await self.query(
             "SELECT TOP @limit * FROM c WHERE c.status = @status"
-            " AND NOT IS_DEFINED(c.deleted_at) ORDER BY c.started_at DESC",
+            " AND NOT IS_DEFINED(c.deleted_at)"
+            " ORDER BY c.status ASC, c.started_at DESC",
             [
                 {"name": "@status", "value": AgentRunStatus.FAILED.value},
                 {"name": "@limit", "value": limit},
@@ -2,27 +2,147 @@
 
 from __future__ import annotations
 
+import asyncio
+import base64
+import binascii
+import functools
+import json
 import logging
 import os
 import time
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, cast
 
+from azure.core.exceptions import HttpResponseError
 from azure.cosmos.exceptions import CosmosHttpResponseError
+from pydantic import BaseModel, TypeAdapter
 
+from curate_common.database.telemetry import (
+    OperationStats,
+    current_caller,
+    record_operation,
+    record_throttled_retry,
+)
 from curate_common.models.base import DocumentBase
 
 if TYPE_CHECKING:
+    from collections.abc import (
+        AsyncIterable,
+        AsyncIterator,
+        Awaitable,
+        Callable,
+        Mapping,
+    )
+
     from azure.cosmos.aio import ContainerProxy, DatabaseProxy
 
 logger = logging.getLogger(__name__)
 
+type WriteListener = Callable[[str, dict[str, Any]], None]
+
+_HTTP_NOT_FOUND = 404
+_HTTP_PRECONDITION_FAILED = 412
+# Throttled (429) and retry-with (449) responses were never executed, so any
+# request may be retried. A 503 may follow a write that was applied.
+_THROTTLED_STATUS = frozenset({429, 449})
+_RETRYABLE_STATUS = _THROTTLED_STATUS | {503}
+_RETRY_AFTER_HEADER = "x-ms-retry-after-ms"
+_RETRY_BACKOFF_SECONDS = 0.1
+# Cosmos DB accepts at most 10 operations in a single patch request.
+_MAX_PATCH_OPERATIONS = 10
+_JSON_VALUE: TypeAdapter[Any] = TypeAdapter(Any)
+# Cosmos DB transactional batches are limited to 100 operations.
+_MAX_BATCH_OPERATIONS = 100
+_BULK_CONCURRENCY = 8
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+
+@dataclass(frozen=True)
+class Page[M]:
+    """One page of query results and the cursor that resumes after it.
+
+    ``continuation`` is None on the last page.
+    """
+
+    items: list[M] = field(default_factory=list)
+    continuation: str | None = None
+
+
+@dataclass
+class BulkResult:
+    """Outcome of a bulk write: counts, RU consumed, and the ids that failed.
+
+    Documents that no longer match the write's condition are counted as
+    ``skipped``, not failed.
+    """
+
+    succeeded: int = 0
+    request_charge: float = 0.0
+    failed_ids: list[str] = field(default_factory=list)
+    skipped: int = 0
+
+    @property
+    def failed(self) -> int:
+        """Return the number of documents that were not written."""
+        return len(self.failed_ids)
+
+    def charge(self, headers: Mapping[str, Any], *_args: object) -> None:
+        """Add a response's request charge; usable as a ``response_hook``."""
+        self.request_charge += float(headers.get("x-ms-request-charge") or 0.0)
+
+
+def _retry_delay(exc: CosmosHttpResponseError, attempt: int) -> float:
+    """Return seconds to wait, as asked by the service or by backoff."""
+    header = (exc.headers or {}).get(_RETRY_AFTER_HEADER)
+    try:
+        return float(str(header)) / 1000
+    except ValueError:
+        return _RETRY_BACKOFF_SECONDS * 2**attempt
+
+
+def encode_cursor(sort_value: object, item_id: str) -> str:
+    """Return an opaque page cursor for the last row of a keyset page."""
+    raw = json.dumps([sort_value, item_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> tuple[object, str]:
+    """Return the ``(sort_value, id)`` a page cursor encodes.
+
+    Raises ``ValueError`` when the cursor was not made by ``encode_cursor``.
+    """
+    try:
+        sort_value, item_id = json.loads(base64.urlsafe_b64decode(cursor))
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError) as exc:
+        msg = f"Malformed page cursor: {cursor!r}"
+        raise ValueError(msg) from exc
+    if not isinstance(item_id, str):
+        msg = f"Malformed page cursor: {cursor!r}"
+        raise ValueError(msg)  # noqa: TRY004
+    return sort_value, item_id
+
+
+def projection(model: type[BaseModel], **expressions: str) -> str:
+    """Return a SELECT list projecting the fields of ``model`` from ``c``.
+
+    Each field reads the document property of the same name unless
+    ``expressions`` maps it to another Cosmos SQL expression.
+    """
+    return ", ".join(
+        f"{expressions[name]} AS {name}" if name in expressions else f"c.{name}"
+        for name in model.model_fields
+    )
+
 
 class BaseRepository[T: DocumentBase]:
     """Generic async repository for a Cosmos DB container."""
 
     container_name: str
     model_class: type[T]
+    partition_field: str = "id"
 
     def __init__(self, database: DatabaseProxy) -> None:
         """Initialize the repository with a Cosmos DB database reference."""
@@ -30,6 +150,21 @@ class BaseRepository[T: DocumentBase]:
             self.container_name
         )
         self._slow_operation_ms = int(os.environ.get("APP_SLOW_REPOSITORY_MS", "250"))
+        self._retry_budget_ms = int(
+            os.environ.get("APP_REPOSITORY_RETRY_BUDGET_MS", "5000")
+        )
+        self._write_listeners: list[WriteListener] = []
+
+    def add_write_listener(self, listener: WriteListener) -> None:
+        """Register a callback invoked with each document version written."""
+        self._write_listeners.append(listener)
+
+    def _notify_write(self, document: object) -> None:
+        """Pass a written document, as returned by Cosmos DB, to listeners."""
+        if not isinstance(document, dict):
+            return
+        for listener in self._write_listeners:
+            listener(self.container_name, cast("dict[str, Any]", document))
 
     def _log_operation(
         self,
@@ -40,9 +175,17 @@ class BaseRepository[T: DocumentBase]:
         outcome: str | None = None,
         result_count: int | None = None,
         parameter_count: int | None = None,
+        stats: OperationStats | None = None,
     ) -> None:
         duration_ms = (time.monotonic() - started_at) * 1000
-        details: list[str] = []
+        stats = stats or OperationStats()
+        record_operation(self.container_name, operation, stats, duration_ms)
+        details: list[str] = [
+            f"ru={stats.request_charge:.2f}",
+            f"caller={current_caller()}",
+        ]
+        if stats.activity_id is not None:
+            details.append(f"activity_id={stats.activity_id}")
         if item_id is not None:
             details.append(f"item_id={item_id}")
         if outcome is not None:
@@ -51,7 +194,10 @@ class BaseRepository[T: DocumentBase]:
             details.append(f"results={result_count}")
         if parameter_count is not None:
             details.append(f"params={parameter_count}")
-        detail_text = " ".join(details) if details else "details=none"
+        if stats.query_metrics:
+            retrieved = stats.query_metrics.get("retrievedDocumentCount", 0)
+            details.append(f"retrieved={retrieved:.0f}")
+        detail_text = " ".join(details)
         message = "Repository operation — container=%s op=%s duration_ms=%.0f %s"
         if duration_ms >= self._slow_operation_ms:
             logger.warning(
@@ -70,12 +216,75 @@ class BaseRepository[T: DocumentBase]:
             detail_text,
         )
 
+    async def _call[R](
+        self,
+        operation: str,
+        request: Callable[[], Awaitable[R]],
+        *,
+        retry_on: frozenset[int] = _RETRYABLE_STATUS,
+    ) -> R:
+        """Run a Cosmos DB request, retrying throttled or unavailable responses.
+
+        A response whose status is in ``retry_on`` is retried after the delay
+        the service asks for in ``x-ms-retry-after-ms``, or an exponential
+        backoff when it gives none, until the per-call retry budget would be
+        exceeded. The last error is then raised.
+        """
+        deadline = time.monotonic() + self._retry_budget_ms / 1000
+        attempt = 0
+        while True:
+            try:
+                return await request()
+            except CosmosHttpResponseError as exc:
+                if exc.status_code not in retry_on:
+                    raise
+                delay = _retry_delay(exc, attempt)
+                if time.monotonic() + delay > deadline:
+                    raise
+                attempt += 1
+                record_throttled_retry(self.container_name, operation, exc.status_code)
+                logger.warning(
+                    "Repository request throttled, retrying — container=%s op=%s"
+                    " status=%d retry_after_ms=%.0f attempt=%d",
+                    self.container_name,
+                    operation,
+                    exc.status_code,
+                    delay * 1000,
+                    attempt,
+                )
+                await asyncio.sleep(delay)
+
+    async def _stream[R](
+        self, operation: str, rows: AsyncIterable[R]
+    ) -> AsyncIterator[R]:
+        """Yield query results, fetching each page through ``_call``.
+
+        A throttled page is requested again from where the query left off,
+        so results already yielded are not repeated.
+        """
+        iterator = aiter(rows)
+        while True:
+            try:
+                row = await self._call(operation, functools.partial(anext, iterator))
+            except StopAsyncIteration:
+                return
+            yield row
+
     async def create(self, item: T) -> T:
         """Create a new document."""
         started_at = time.monotonic()
+        stats = OperationStats()
         body = item.model_dump(mode="json", exclude_none=True)
-        await self._container.create_item(body=body)
-        self._log_operation("create", started_at, item_id=item.id, outcome="created")
+        self._notify_write(
+            await self._call(
+                "create",
+                lambda: self._container.create_item(body=body, response_hook=stats),
+                retry_on=_THROTTLED_STATUS,
+            )
+        )
+        self._log_operation(
+            "create", started_at, item_id=item.id, outcome="created", stats=stats
+        )
         logger.debug(
             "Document created — container=%s id=%s", self.container_name, item.id
         )
@@ -84,38 +293,277 @@ class BaseRepository[T: DocumentBase]:
     async def get(self, item_id: str, partition_key: str) -> T | None:
         """Read a single document by id and partition key.
 
-        Returns None if soft-deleted.
+        Returns None if the document does not exist or is soft-deleted.
+        Throttled reads are retried; any other error is raised rather than
+        mistaken for a missing document.
         """
         started_at = time.monotonic()
+        stats = OperationStats()
         try:
-            data: dict[str, Any] = await self._container.read_item(
-                item=item_id, partition_key=partition_key
+            data: dict[str, Any] = await self._call(
+                "get",
+                lambda: self._container.read_item(
+                    item=item_id, partition_key=partition_key, response_hook=stats
+                ),
             )
-        except CosmosHttpResponseError:
-            self._log_operation("get", started_at, item_id=item_id, outcome="not_found")
-            return None
-        if data.get("deleted_at") is not None:
+        except CosmosHttpResponseError as exc:
+            if exc.status_code != _HTTP_NOT_FOUND:
+                raise
+            stats(exc.headers or {})
             self._log_operation(
-                "get", started_at, item_id=item_id, outcome="soft_deleted"
+                "get", started_at, item_id=item_id, outcome="not_found", stats=stats
             )
             return None
-        self._log_operation("get", started_at, item_id=item_id, outcome="found")
+        outcome = "found" if data.get("deleted_at") is None else "soft_deleted"
+        self._log_operation(
+            "get", started_at, item_id=item_id, outcome=outcome, stats=stats
+        )
+        if outcome == "soft_deleted":
+            return None
         return self.model_class.model_validate(data)
 
     async def update(self, item: T, _partition_key: str) -> T:
         """Replace an existing document, updating the timestamp."""
         started_at = time.monotonic()
+        stats = OperationStats()
         item.updated_at = datetime.now(UTC)
         body = item.model_dump(mode="json", exclude_none=True)
         # The SDK extracts the partition key from the document body automatically;
         # passing it as a kwarg leaks it through the HTTP pipeline to aiohttp.
-        await self._container.replace_item(item=item.id, body=body)
-        self._log_operation("update", started_at, item_id=item.id, outcome="updated")
+        self._notify_write(
+            await self._call(
+                "update",
+                lambda: self._container.replace_item(
+                    item=item.id, body=body, response_hook=stats
+                ),
+            )
+        )
+        self._log_operation(
+            "update", started_at, item_id=item.id, outcome="updated", stats=stats
+        )
         logger.debug(
             "Document updated — container=%s id=%s", self.container_name, item.id
         )
         return item
 
+    async def patch(
+        self,
+        item_id: str,
+        partition_key: str,
+        changes: Mapping[str, Any],
+        *,
+        condition: str | None = None,
+    ) -> T | None:
+        """Apply field changes as a partial update, bumping the timestamp.
+
+        Only the changed fields are sent. A None value removes the field, as
+        ``update`` omits None fields, so the field must be present in the
+        stored document. ``condition`` is a filter predicate
+        (``FROM c WHERE ...``) the stored document must match. Returns the
+        updated document, or None when it is missing or fails the condition.
+        """
+        started_at = time.monotonic()
+        stats = OperationStats()
+        operations = self._patch_operations(changes)
+        kwargs: dict[str, Any] = (
+            {} if condition is None else {"filter_predicate": condition}
+        )
+        try:
+            data = await self._call(
+                "patch",
+                lambda: self._container.patch_item(
+                    item=item_id,
+                    partition_key=partition_key,
+                    patch_operations=operations,
+                    response_hook=stats,
+                    **kwargs,
+                ),
+            )
+        except CosmosHttpResponseError as exc:
+            if exc.status_code == _HTTP_NOT_FOUND:
+                outcome = "not_found"
+            elif exc.status_code == _HTTP_PRECONDITION_FAILED:
+                outcome = "condition_failed"
+            else:
+                raise
+            stats(exc.headers or {})
+            self._log_operation(
+                "patch", started_at, item_id=item_id, outcome=outcome, stats=stats
+            )
+            return None
+        self._notify_write(data)
+        self._log_operation(
+            "patch", started_at, item_id=item_id, outcome="patched", stats=stats
+        )
+        return self.model_class.model_validate(data)
+
+    def _patch_operations(self, changes: Mapping[str, Any]) -> list[dict[str, Any]]:
+        """Compile field changes into Cosmos DB patch operations."""
+        unknown = set(changes) - set(self.model_class.model_fields)
+        if unknown:
+            msg = f"Unknown {self.model_class.__name__} fields: {sorted(unknown)}"
+            raise ValueError(msg)
+        fields = {**changes, "updated_at": datetime.now(UTC)}
+        if len(fields) > _MAX_PATCH_OPERATIONS:
+            msg = f"A patch is limited to {_MAX_PATCH_OPERATIONS} operations"
+            raise ValueError(msg)
+        return [
+            {"op": "remove", "path": f"/{name}"}
+            if value is None
+            else {
+                "op": "set",
+                "path": f"/{name}",
+                "value": _JSON_VALUE.dump_python(value, mode="json"),
+            }
+            for name, value in fields.items()
+        ]
+
+    async def bulk_patch(
+        self,
+        where: str,
+        parameters: list[dict[str, Any]] | None,
+        changes: Mapping[str, Any],
+        *,
+        condition: str | None = None,
+        concurrency: int = _BULK_CONCURRENCY,
+    ) -> BulkResult:
+        """Apply the same field changes to every document matching ``where``.
+
+        Matching ids are streamed from the query and grouped by partition.
+        Each full group of up to 100 documents is written as one
+        transactional batch while the query is still being read, with at
+        most ``concurrency`` writes in flight. A batch that fails is retried
+        one document at a time, so a single bad document does not fail its
+        neighbours. ``condition`` guards each write as in ``patch``.
+        """
+        started_at = time.monotonic()
+        operations = self._patch_operations(changes)
+        result = BulkResult()
+        slots = asyncio.Semaphore(max(concurrency, 1))
+        pending: dict[str, list[str]] = {}
+        params = parameters or []
+        query = (
+            f"SELECT c.id, c.{self.partition_field} AS pk"  # noqa: S608 - field name
+            f" FROM c WHERE {where}"
+        )
+
+        async def flush(partition_key: str, item_ids: list[str]) -> None:
+            try:
+                await self._write_chunk(
+                    partition_key, item_ids, operations, condition, result
+                )
+            finally:
+                slots.release()
+
+        async with asyncio.TaskGroup() as group:
+            async for row in self._stream(
+                "bulk_patch",
+                self._container.query_items(
+                    query=query, parameters=params, response_hook=result.charge
+                ),
+            ):
+                chunk = pending.setdefault(str(row["pk"]), [])
+                chunk.append(str(row["id"]))
+                if len(chunk) == _MAX_BATCH_OPERATIONS:
+                    await slots.acquire()
+                    group.create_task(
+                        flush(str(row["pk"]), pending.pop(str(row["pk"])))
+                    )
+            for partition_key, item_ids in pending.items():
+                await slots.acquire()
+                group.create_task(flush(partition_key, item_ids))
+
+        self._log_operation(
+            "bulk_patch",
+            started_at,
+            outcome="partial" if result.failed_ids else "ok",
+            result_count=result.succeeded,
+            parameter_count=len(params),
+            stats=OperationStats(request_charge=result.request_charge),
+        )
+        logger.info(
+            "Bulk patch finished — container=%s succeeded=%d skipped=%d failed=%d"
+            " ru=%.1f",
+            self.container_name,
+            result.succeeded,
+            result.skipped,
+            result.failed,
+            result.request_charge,
+        )
+        return result
+
+    async def _write_chunk(
+        self,
+        partition_key: str,
+        item_ids: list[str],
+        operations: list[dict[str, Any]],
+        condition: str | None,
+        result: BulkResult,
+    ) -> None:
+        """Patch one partition's documents, batching when there are several."""
+        options: dict[str, Any] = (
+            {} if condition is None else {"filter_predicate": condition}
+        )
+        if len(item_ids) > 1:
+            try:
+                await self._call(
+                    "bulk_patch",
+                    lambda: self._container.execute_item_batch(
+                        batch_operations=[
+                            ("patch", (item_id, operations), options)
+                            for item_id in item_ids
+                        ],
+                        partition_key=partition_key,
+                        response_hook=result.charge,
+                    ),
+                )
+            except HttpResponseError as exc:
+                # A condition miss fails the whole batch but is expected.
+                logger.log(
+                    logging.DEBUG
+                    if exc.status_code == _HTTP_PRECONDITION_FAILED
+                    else logging.WARNING,
+                    "Bulk batch failed, retrying individually — container=%s"
+                    " partition=%s items=%d",
+                    self.container_name,
+                    partition_key,
+                    len(item_ids),
+                )
+            else:
+                result.succeeded += len(item_ids)
+                return
+        for item_id in item_ids:
+            try:
+                await self._call(
+                    "bulk_patch",
+                    functools.partial(
+                        self._container.patch_item,
+                        item=item_id,
+                        partition_key=partition_key,
+                        patch_operations=operations,
+                        response_hook=result.charge,
+                        **options,
+                    ),
+                )
+            except HttpResponseError as exc:
+                if (
+                    condition is not None
+                    and exc.status_code == _HTTP_PRECONDITION_FAILED
+                ):
+                    # The document changed since the query and no longer
+                    # matches the condition; there is nothing to write.
+                    result.skipped += 1
+                    continue
+                logger.warning(
+                    "Bulk patch failed — container=%s id=%s",
+                    self.container_name,
+                    item_id,
+                    exc_info=True,
+                )
+                result.failed_ids.append(item_id)
+            else:
+                result.succeeded += 1
+
     async def soft_delete(self, item: T, partition_key: str) -> T:
         """Soft-delete a document by setting deleted_at."""
         logger.debug(
@@ -125,23 +573,156 @@ class BaseRepository[T: DocumentBase]:
         return await self.update(item, partition_key)
 
     async def query(
-        self, query: str, parameters: list[dict[str, Any]] | None = None
+        self,
+        query: str,
+        parameters: list[dict[str, Any]] | None = None,
+        *,
+        partition_key: str | None = None,
     ) -> list[T]:
-        """Run a parameterized query, filtering out soft-deleted documents."""
+        """Run a parameterized query, filtering out soft-deleted documents.
+
+        Passing ``partition_key`` scopes the query to that logical partition
+        instead of fanning out across the container.
+        """
         started_at = time.monotonic()
+        stats = OperationStats()
         params = parameters or []
-        results = [
-            self.model_class.model_validate(item)
-            async for item in self._container.query_items(
-                query=query, parameters=params
-            )
-            if item.get("deleted_at") is None
-        ]
+        scope: dict[str, Any] = (
+            {} if partition_key is None else {"partition_key": partition_key}
+        )
+
+        async def read() -> list[T]:
+            return [
+                self.model_class.model_validate(item)
+                async for item in self._container.query_items(
+                    query=query,
+                    parameters=params,
+                    populate_query_metrics=True,
+                    response_hook=stats,
+                    **scope,
+                )
+                if item.get("deleted_at") is None
+            ]
+
+        results = await self._call("query", read)
         self._log_operation(
             "query",
             started_at,
             outcome="ok",
             result_count=len(results),
             parameter_count=len(params),
+            stats=stats,
+        )
+        return results
+
+    async def query_projection[S: BaseModel](
+        self,
+        model: type[S],
+        query: str,
+        parameters: list[dict[str, Any]] | None = None,
+    ) -> list[S]:
+        """Run a parameterized projection query, returning rows as ``model``.
+
+        Projected rows do not carry ``deleted_at``, so the query itself must
+        exclude soft-deleted documents.
+        """
+        started_at = time.monotonic()
+        stats = OperationStats()
+        params = parameters or []
+
+        async def read() -> list[S]:
+            return [
+                model.model_validate(item)
+                async for item in self._container.query_items(
+                    query=query,
+                    parameters=params,
+                    populate_query_metrics=True,
+                    response_hook=stats,
+                )
+            ]
+
+        results = await self._call("query_projection", read)
+        self._log_operation(
+            "query_projection",
+            started_at,
+            outcome="ok",
+            result_count=len(results),
+            parameter_count=len(params),
+            stats=stats,
         )
         return results
+
+    async def query_page[S: BaseModel](
+        self,
+        model: type[S],
+        query: str,
+        parameters: list[dict[str, Any]] | None = None,
+        *,
+        order_by: str = "created_at",
+        page_size: int = DEFAULT_PAGE_SIZE,
+        continuation: str | None = None,
+    ) -> Page[S]:
+        """Run a parameterized query for one page of rows as ``model``.
+
+        ``query`` is a SELECT with a WHERE clause, returning ``id`` and
+        ``order_by``; rows come newest first with ``id`` breaking ties. Pages
+        are keyset-paginated: the continuation encodes the last row's
+        ``(order_by, id)`` and the next page filters on it, because the
+        SDK's continuation tokens are not supported for cross-partition
+        ORDER BY queries. Soft-deleted documents are filtered when the query
+        returns ``deleted_at``; projections must exclude them in the query.
+        """
+        started_at = time.monotonic()
+        stats = OperationStats()
+        params = [
+            *(parameters or []),
+            {"name": "@page_limit", "value": page_size + 1},
+        ]
+        keyset = ""
+        if continuation is not None:
+            try:
+                sort_value, last_id = decode_cursor(continuation)
+            except ValueError:
+                logger.warning("Ignoring malformed page cursor — %s", continuation)
+            else:
+                keyset = (
+                    f" AND (c.{order_by} < @cursor_value"
+                    f" OR (c.{order_by} = @cursor_value AND c.id < @cursor_id))"
+                )
+                params += [
+                    {"name": "@cursor_value", "value": sort_value},
+                    {"name": "@cursor_id", "value": last_id},
+                ]
+        paged_query = (
+            f"{query}{keyset} ORDER BY c.{order_by} DESC, c.id DESC"
+            " OFFSET 0 LIMIT @page_limit"
+        )
+
+        async def read() -> list[dict[str, Any]]:
+            return [
+                item
+                async for item in self._container.query_items(
+                    query=paged_query,
+                    parameters=params,
+                    populate_query_metrics=True,
+                    response_hook=stats,
+                )
+            ]
+
+        rows = await self._call("query_page", read)
+        token = None
+        if len(rows) > page_size:
+            rows = rows[:page_size]
+            token = encode_cursor(rows[-1][order_by], rows[-1]["id"])
+        items = [
+            model.model_validate(row) for row in rows if row.get("deleted_at") is None
+        ]
+        self._log_operation(
+            "query_page",
+            started_at,
+            outcome="last" if token is None else "more",
+            result_count=len(items),
+            parameter_count=len(params),
+            stats=stats,
+        )
+        return Page(items, token)
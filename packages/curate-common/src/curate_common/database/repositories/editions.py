@@ -2,8 +2,19 @@
 
 from __future__ import annotations
 
-from curate_common.database.repositories.base import BaseRepository
-from curate_common.models.edition import Edition, EditionStatus
+from curate_common.database.repositories.base import (
+    DEFAULT_PAGE_SIZE,
+    BaseRepository,
+    Page,
+    projection,
+)
+from curate_common.models.edition import Edition, EditionStatus, EditionSummary
+
+_SUMMARY_FIELDS = projection(
+    EditionSummary,
+    title="c.content.title",
+    link_count="ARRAY_LENGTH(c.link_ids)",
+)
 
 
 class EditionRepository(BaseRepository[Edition]):
@@ -25,11 +36,16 @@ class EditionRepository(BaseRepository[Edition]):
         )
         return results[0] if results else None
 
-    async def list_all(self) -> list[Edition]:
-        """Return all active editions ordered by creation date descending."""
-        return await self.query(
-            "SELECT * FROM c WHERE NOT IS_DEFINED(c.deleted_at)"
-            " ORDER BY c.created_at DESC",
+    async def list_page(
+        self, *, page_size: int = DEFAULT_PAGE_SIZE, continuation: str | None = None
+    ) -> Page[EditionSummary]:
+        """Return a page of active edition summaries, newest first."""
+        return await self.query_page(
+            EditionSummary,
+            f"SELECT {_SUMMARY_FIELDS} FROM c"  # noqa: S608 - model field names
+            " WHERE NOT IS_DEFINED(c.deleted_at)",
+            page_size=page_size,
+            continuation=continuation,
         )
 
     async def list_unpublished(self) -> list[Edition]:
@@ -49,17 +65,20 @@ class EditionRepository(BaseRepository[Edition]):
         return await self.query(
             "SELECT * FROM c WHERE c.status = @status"
             " AND NOT IS_DEFINED(c.deleted_at)"
-            " ORDER BY c.published_at DESC",
+            " ORDER BY c.status ASC, c.published_at DESC",
             [{"name": "@status", "value": EditionStatus.PUBLISHED.value}],
         )
 
     async def next_issue_number(self) -> int:
         """Return the next sequential issue number for a new edition."""
         current_max = 0
-        async for value in self._container.query_items(
-            "SELECT VALUE MAX(c.content.issue_number) FROM c"
-            " WHERE NOT IS_DEFINED(c.deleted_at)"
-            " AND IS_NUMBER(c.content.issue_number)",
+        async for value in self._stream(
+            "next_issue_number",
+            self._container.query_items(
+                "SELECT VALUE MAX(c.content.issue_number) FROM c"
+                " WHERE NOT IS_DEFINED(c.deleted_at)"
+                " AND IS_NUMBER(c.content.issue_number)",
+            ),
         ):
             if value is not None:
                 current_max = int(value)  # ty: ignore[invalid-argument-type]
@@ -68,8 +87,11 @@ class EditionRepository(BaseRepository[Edition]):
     async def count_by_status(self) -> dict[str, int]:
         """Return the number of active editions grouped by status."""
         counts: dict[str, int] = {}
-        async for item in self._container.query_items(
-            "SELECT c.status FROM c WHERE NOT IS_DEFINED(c.deleted_at)",
+        async for item in self._stream(
+            "count_by_status",
+            self._container.query_items(
+                "SELECT c.status FROM c WHERE NOT IS_DEFINED(c.deleted_at)",
+            ),
         ):
             status = item["status"]
             counts[status] = counts.get(status, 0) + 1
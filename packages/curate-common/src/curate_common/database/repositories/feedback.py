@@ -13,6 +13,7 @@ class FeedbackRepository(BaseRepository[Feedback]):
 
     container_name = "feedback"
     model_class = Feedback
+    partition_field = "edition_id"
 
     async def get_by_edition(self, edition_id: str) -> list[Feedback]:
         """Fetch all active feedback for a given edition."""
@@ -20,6 +21,7 @@ class FeedbackRepository(BaseRepository[Feedback]):
             "SELECT * FROM c WHERE c.edition_id = @edition_id"
             " AND NOT IS_DEFINED(c.deleted_at)",
             [{"name": "@edition_id", "value": edition_id}],
+            partition_key=edition_id,
         )
 
     async def get_unresolved(self, edition_id: str) -> list[Feedback]:
@@ -29,14 +31,18 @@ class FeedbackRepository(BaseRepository[Feedback]):
             " AND c.resolved = false"
             " AND NOT IS_DEFINED(c.deleted_at)",
             [{"name": "@edition_id", "value": edition_id}],
+            partition_key=edition_id,
         )
 
     async def count_all_unresolved(self) -> int:
         """Return the total number of unresolved feedback across all editions."""
         total = 0
-        async for item in self._container.query_items(
-            "SELECT VALUE COUNT(1) FROM c"
-            " WHERE c.resolved = false AND NOT IS_DEFINED(c.deleted_at)",
+        async for item in self._stream(
+            "count_all_unresolved",
+            self._container.query_items(
+                "SELECT VALUE COUNT(1) FROM c"
+                " WHERE c.resolved = false AND NOT IS_DEFINED(c.deleted_at)",
+            ),
         ):
             total = cast("int", item)
         return total
@@ -2,21 +2,38 @@
 
 from __future__ import annotations
 
+import json
 from datetime import UTC, datetime, timedelta
-from typing import Any, cast
+from typing import TYPE_CHECKING, Any, cast
 
 from azure.core import MatchConditions
 from azure.cosmos.exceptions import CosmosHttpResponseError
 
-from curate_common.database.repositories.base import BaseRepository
-from curate_common.models.link import Link, LinkStatus
+from curate_common.database.repositories.base import (
+    DEFAULT_PAGE_SIZE,
+    BaseRepository,
+    Page,
+    projection,
+)
+from curate_common.models.link import Link, LinkStatus, LinkSummary
+
+if TYPE_CHECKING:
+    from azure.cosmos.aio import DatabaseProxy
 
 _CLAIM_FIELD = "processing_claimed_at"
+_OWNER_FIELD = "processing_owner"
+_HTTP_NOT_FOUND = 404
 _HTTP_PRECONDITION_FAILED = 412
-_CLAIM_TTL = timedelta(minutes=15)
+_CLAIM_TTL = timedelta(seconds=60)
+_SUMMARY_FIELDS = projection(LinkSummary)
+_RESUMABLE_STATUSES = frozenset(
+    {LinkStatus.SUBMITTED, LinkStatus.FETCHING, LinkStatus.REVIEWED}
+)
 
 
-def _is_active_claim(claimed_at_raw: object, *, now: datetime) -> bool:
+def is_active_claim(
+    claimed_at_raw: object, *, now: datetime, ttl: timedelta = _CLAIM_TTL
+) -> bool:
     """Return True when a durable claim marker is still active."""
     if isinstance(claimed_at_raw, str):
         try:
@@ -25,29 +42,71 @@ def _is_active_claim(claimed_at_raw: object, *, now: datetime) -> bool:
             return False
         if claimed_at.tzinfo is None:
             claimed_at = claimed_at.replace(tzinfo=UTC)
-        return now - claimed_at < _CLAIM_TTL
+        return now - claimed_at < ttl
     return claimed_at_raw is not None
 
 
+def _owned_by(owner_id: str) -> str:
+    """Return a patch filter predicate matching claims held by ``owner_id``."""
+    return f"FROM c WHERE c.{_OWNER_FIELD} = {json.dumps(owner_id)}"
+
+
+def _in_progress() -> str:
+    """Return a patch filter predicate matching links the pipeline may still run."""
+    statuses = json.dumps(sorted(status.value for status in _RESUMABLE_STATUSES))
+    return (
+        f"FROM c WHERE ARRAY_CONTAINS({statuses}, c.status)"
+        " AND NOT IS_DEFINED(c.deleted_at)"
+    )
+
+
 class LinkRepository(BaseRepository[Link]):
-    """Provide data access for the links container."""
+    """Provide data access for the links container.
+
+    Links are claimed by one worker at a time for processing. A claim records
+    the worker's instance id and is kept alive by heartbeats; once it goes a
+    full ``claim_ttl`` without renewal it is considered abandoned and can be
+    requeued by any worker.
+    """
 
     container_name = "links"
     model_class = Link
 
-    async def list_all(self) -> list[Link]:
-        """Fetch all active links across all editions."""
-        return await self.query(
-            "SELECT * FROM c WHERE NOT IS_DEFINED(c.deleted_at)"
-            " ORDER BY c.created_at DESC",
+    def __init__(
+        self, database: DatabaseProxy, *, claim_ttl: timedelta = _CLAIM_TTL
+    ) -> None:
+        """Initialize the repository with the claim expiry window."""
+        super().__init__(database)
+        self._claim_ttl = claim_ttl
+
+    @property
+    def claim_ttl(self) -> timedelta:
+        """Return how long a claim stays active without a heartbeat."""
+        return self._claim_ttl
+
+    async def list_page(
+        self, *, page_size: int = DEFAULT_PAGE_SIZE, continuation: str | None = None
+    ) -> Page[LinkSummary]:
+        """Fetch a page of active link summaries across all editions."""
+        return await self.query_page(
+            LinkSummary,
+            f"SELECT {_SUMMARY_FIELDS} FROM c"  # noqa: S608 - model field names
+            " WHERE NOT IS_DEFINED(c.deleted_at)",
+            page_size=page_size,
+            continuation=continuation,
         )
 
-    async def list_unattached(self) -> list[Link]:
-        """Fetch links not yet associated with any edition."""
-        return await self.query(
-            "SELECT * FROM c WHERE NOT IS_DEFINED(c.edition_id)"
-            " AND NOT IS_DEFINED(c.deleted_at)"
-            " ORDER BY c.created_at DESC",
+    async def list_unattached(
+        self, *, page_size: int = DEFAULT_PAGE_SIZE, continuation: str | None = None
+    ) -> Page[LinkSummary]:
+        """Fetch a page of summaries of links not associated with any edition."""
+        return await self.query_page(
+            LinkSummary,
+            f"SELECT {_SUMMARY_FIELDS} FROM c"  # noqa: S608 - model field names
+            " WHERE NOT IS_DEFINED(c.edition_id)"
+            " AND NOT IS_DEFINED(c.deleted_at)",
+            page_size=page_size,
+            continuation=continuation,
         )
 
     async def get_by_edition(self, edition_id: str) -> list[Link]:
@@ -70,14 +129,12 @@ class LinkRepository(BaseRepository[Link]):
             ],
         )
 
-    async def claim_submitted(self, link_id: str) -> Link | None:
-        """Atomically claim a submitted link for processing."""
-        try:
-            data = cast(
-                "dict[str, Any]",
-                await self._container.read_item(item=link_id, partition_key=link_id),
-            )
-        except CosmosHttpResponseError:
+    async def claim_submitted(
+        self, link_id: str, owner_id: str | None = None
+    ) -> Link | None:
+        """Atomically claim a submitted link for processing by ``owner_id``."""
+        data = await self._read_document("claim_submitted", link_id)
+        if data is None:
             return None
 
         now = datetime.now(UTC)
@@ -86,7 +143,7 @@ class LinkRepository(BaseRepository[Link]):
             data.get("deleted_at") is not None
             or data.get("edition_id") is None
             or data.get("status") != LinkStatus.SUBMITTED.value
-            or _is_active_claim(data.get(_CLAIM_FIELD), now=now)
+            or is_active_claim(data.get(_CLAIM_FIELD), now=now, ttl=self._claim_ttl)
         ):
             return None
         etag = data.get("_etag")
@@ -94,45 +151,333 @@ class LinkRepository(BaseRepository[Link]):
             return None
 
         link = self.model_class.model_validate(data)
-        body = {
-            **link.model_dump(mode="json", exclude_none=True),
-            _CLAIM_FIELD: now.isoformat(),
-        }
+        link.processing_claimed_at = now
+        link.processing_owner = owner_id
+        body = link.model_dump(mode="json", exclude_none=True)
+
+        try:
+            claimed = await self._call(
+                "claim_submitted",
+                lambda: self._container.replace_item(
+                    item=link.id,
+                    body=body,
+                    etag=etag,
+                    match_condition=MatchConditions.IfNotModified,
+                ),
+            )
+        except CosmosHttpResponseError as exc:
+            if exc.status_code == _HTTP_PRECONDITION_FAILED:
+                return None
+            raise
+
+        self._notify_write(claimed)
+        return link
+
+    async def renew_claim(self, link_id: str, owner_id: str) -> bool:
+        """Refresh a claim's heartbeat, returning False if ``owner_id`` lost it.
+
+        A claim is also lost once the link is deleted, disassociated, or
+        stopped by an editor, so the pipeline working on it can be cancelled.
+        """
+        try:
+            renewed = await self._call(
+                "renew_claim",
+                lambda: self._container.patch_item(
+                    item=link_id,
+                    partition_key=link_id,
+                    patch_operations=[
+                        {
+                            "op": "set",
+                            "path": f"/{_CLAIM_FIELD}",
+                            "value": datetime.now(UTC).isoformat(),
+                        }
+                    ],
+                    filter_predicate=_owned_by(owner_id)
+                    + " AND NOT IS_DEFINED(c.deleted_at)"
+                    " AND IS_STRING(c.edition_id)"
+                    " AND NOT IS_DEFINED(c.cancel_requested_at)",
+                ),
+            )
+        except CosmosHttpResponseError as exc:
+            if exc.status_code in {_HTTP_NOT_FOUND, _HTTP_PRECONDITION_FAILED}:
+                return False
+            raise
+        self._notify_write(renewed)
+        return True
+
+    async def clear_claim(self, link_id: str, owner_id: str) -> None:
+        """Drop a finished link's claim if ``owner_id`` still holds it."""
+        try:
+            cleared = await self._call(
+                "clear_claim",
+                lambda: self._container.patch_item(
+                    item=link_id,
+                    partition_key=link_id,
+                    patch_operations=[
+                        {"op": "set", "path": f"/{_CLAIM_FIELD}", "value": None},
+                        {"op": "set", "path": f"/{_OWNER_FIELD}", "value": None},
+                    ],
+                    filter_predicate=_owned_by(owner_id),
+                ),
+            )
+        except CosmosHttpResponseError as exc:
+            if exc.status_code in {_HTTP_NOT_FOUND, _HTTP_PRECONDITION_FAILED}:
+                return
+            raise
+        self._notify_write(cleared)
+
+    async def request_cancel(self, link_id: str) -> bool:
+        """Stop a link's pipeline, marking it failed so it can be retried.
+
+        The worker processing the link sees the change and cancels its
+        in-flight work. Returns False when the link is no longer in progress.
+        """
+        try:
+            cancelled = await self._call(
+                "request_cancel",
+                lambda: self._container.patch_item(
+                    item=link_id,
+                    partition_key=link_id,
+                    patch_operations=[
+                        {
+                            "op": "set",
+                            "path": "/status",
+                            "value": LinkStatus.FAILED.value,
+                        },
+                        {
+                            "op": "set",
+                            "path": "/cancel_requested_at",
+                            "value": datetime.now(UTC).isoformat(),
+                        },
+                    ],
+                    filter_predicate=_in_progress(),
+                ),
+            )
+        except CosmosHttpResponseError as exc:
+            if exc.status_code in {_HTTP_NOT_FOUND, _HTTP_PRECONDITION_FAILED}:
+                return False
+            raise
+        self._notify_write(cancelled)
+        return True
+
+    async def release_claim(
+        self, link_id: str, owner_id: str | None = None
+    ) -> LinkStatus | None:
+        """Hand a claimed link back so another worker can resume it immediately.
+
+        The claim marker is removed and an unfinished link is returned to
+        ``submitted``, keeping its fetched content and review so the next
+        claim resumes after the last completed stage. When ``owner_id`` is
+        given, a claim held by another worker is left alone. Returns the
+        stage the link had reached, or None when there was no claim to release.
+        """
+        data = await self._read_document("release_claim", link_id)
+        if data is None:
+            return None
+        if owner_id is not None and data.get(_OWNER_FIELD) not in {None, owner_id}:
+            return None
+        return await self._release(data)
+
+    async def requeue_expired_claims(self) -> int:
+        """Release every claim whose heartbeat has lapsed. Return count requeued.
+
+        Only the claim fields are read, and each release is a patch guarded by
+        the etag read, so a claim renewed in the meantime is left alone.
+        Requeued links are rewritten, so the change feed delivers them to a
+        live worker without waiting for their original event to be redelivered.
+        """
+        cutoff = datetime.now(UTC) - self._claim_ttl
+
+        async def read() -> list[dict[str, Any]]:
+            return [
+                item
+                async for item in self._container.query_items(
+                    "SELECT c.id, c._etag, c.status, c.edition_id,"
+                    " c.processing_owner, c.processing_claimed_at FROM c"
+                    " WHERE IS_STRING(c.processing_claimed_at)"
+                    " AND c.processing_claimed_at < @cutoff"
+                    " AND ARRAY_CONTAINS(@statuses, c.status)"
+                    " AND NOT IS_DEFINED(c.deleted_at)",
+                    parameters=[
+                        {"name": "@cutoff", "value": cutoff.isoformat()},
+                        {
+                            "name": "@statuses",
+                            "value": [status.value for status in _RESUMABLE_STATUSES],
+                        },
+                    ],
+                )
+            ]
+
+        requeued = 0
+        for item in await self._call("requeue_expired_claims", read):
+            if await self._requeue(item["id"], item["_etag"]):
+                requeued += 1
+        return requeued
+
+    async def _requeue(self, link_id: str, etag: str) -> bool:
+        """Resubmit a link with a lapsed claim unless it changed since ``etag``."""
+        try:
+            await self._call(
+                "requeue_expired_claims",
+                lambda: self._container.patch_item(
+                    item=link_id,
+                    partition_key=link_id,
+                    patch_operations=[
+                        {
+                            "op": "set",
+                            "path": "/status",
+                            "value": LinkStatus.SUBMITTED.value,
+                        },
+                        {"op": "set", "path": f"/{_CLAIM_FIELD}", "value": None},
+                        {"op": "set", "path": f"/{_OWNER_FIELD}", "value": None},
+                        {
+                            "op": "set",
+                            "path": "/updated_at",
+                            "value": datetime.now(UTC).isoformat(),
+                        },
+                    ],
+                    etag=etag,
+                    match_condition=MatchConditions.IfNotModified,
+                ),
+            )
+        except CosmosHttpResponseError as exc:
+            if exc.status_code in {_HTTP_NOT_FOUND, _HTTP_PRECONDITION_FAILED}:
+                return False
+            raise
+        # As with _release, write listeners are not told, so the change
+        # reaches this worker's own prefilter.
+        return True
+
+    async def _release(self, data: dict[str, Any]) -> LinkStatus | None:
+        """Clear a claim and resubmit an unfinished link, guarded by its etag."""
+        etag = data.get("_etag")
+        if (
+            data.get(_CLAIM_FIELD) is None
+            or data.get("deleted_at") is not None
+            or not isinstance(etag, str)
+        ):
+            return None
+
+        link = self.model_class.model_validate(data)
+        stage = link.status
+        if stage in _RESUMABLE_STATUSES:
+            link.status = LinkStatus.SUBMITTED
+        link.processing_claimed_at = None
+        link.processing_owner = None
+        link.updated_at = datetime.now(UTC)
 
         try:
-            await self._container.replace_item(
-                item=link.id,
-                body=body,
-                etag=etag,
-                match_condition=MatchConditions.IfNotModified,
+            await self._call(
+                "release_claim",
+                lambda: self._container.replace_item(
+                    item=link.id,
+                    body=link.model_dump(mode="json", exclude_none=True),
+                    etag=etag,
+                    match_condition=MatchConditions.IfNotModified,
+                ),
             )
         except CosmosHttpResponseError as exc:
             if exc.status_code == _HTTP_PRECONDITION_FAILED:
                 return None
             raise
+        # Deliberately not passed to write listeners: the change must reach
+        # the change feed consumers, including this worker's own prefilter.
+        return stage
 
+    async def resubmit(self, link_id: str, owner_id: str | None = None) -> Link | None:
+        """Reset a link to submitted so the pipeline runs it again.
+
+        The title, content, and any stop request are cleared, as when an
+        editor retries a failed link. When ``owner_id`` is given the link is
+        claimed for it in the same write, so no other worker picks it up.
+        A deleted or unassociated link, or one a worker holds an active claim
+        on, is left alone. Returns the reset link, or None when it was left
+        alone or changed concurrently.
+        """
+        data = await self._read_document("resubmit", link_id)
+        if data is None:
+            return None
+        etag = data.get("_etag")
+        if (
+            data.get("deleted_at") is not None
+            or data.get("edition_id") is None
+            or is_active_claim(
+                data.get(_CLAIM_FIELD), now=datetime.now(UTC), ttl=self._claim_ttl
+            )
+            or not isinstance(etag, str)
+        ):
+            return None
+
+        link = self.model_class.model_validate(data)
+        link.status = LinkStatus.SUBMITTED
+        link.title = None
+        link.content = None
+        link.cancel_requested_at = None
+        link.updated_at = datetime.now(UTC)
+        link.processing_claimed_at = link.updated_at if owner_id else None
+        link.processing_owner = owner_id
+        try:
+            resubmitted = await self._call(
+                "resubmit",
+                lambda: self._container.replace_item(
+                    item=link.id,
+                    body=link.model_dump(mode="json", exclude_none=True),
+                    etag=etag,
+                    match_condition=MatchConditions.IfNotModified,
+                ),
+            )
+        except CosmosHttpResponseError as exc:
+            if exc.status_code == _HTTP_PRECONDITION_FAILED:
+                return None
+            raise
+        self._notify_write(resubmitted)
         return link
 
+    async def _read_document(
+        self, operation: str, link_id: str
+    ) -> dict[str, Any] | None:
+        """Read a link's raw document, with its etag, or None if it is missing."""
+        try:
+            return cast(
+                "dict[str, Any]",
+                await self._call(
+                    operation,
+                    lambda: self._container.read_item(
+                        item=link_id, partition_key=link_id
+                    ),
+                ),
+            )
+        except CosmosHttpResponseError as exc:
+            if exc.status_code == _HTTP_NOT_FOUND:
+                return None
+            raise
+
     async def associate(self, link: Link, edition_id: str) -> Link:
         """Associate a link with an edition."""
         link.edition_id = edition_id
         link.status = LinkStatus.SUBMITTED
+        link.cancel_requested_at = None
         return await self.update(link, link.id)
 
     async def disassociate(self, link: Link) -> Link:
-        """Remove a link's association with an edition."""
+        """Remove a link's association with an edition.
+
+        Fetched content and the review are kept so that a later re-association
+        can resume at the draft stage while the cached review is still valid.
+        """
         link.edition_id = None
         link.status = LinkStatus.SUBMITTED
-        link.title = None
-        link.content = None
-        link.review = None
+        link.cancel_requested_at = None
         return await self.update(link, link.id)
 
     async def count_all(self) -> int:
         """Return the total number of active links across all editions."""
         total = 0
-        async for item in self._container.query_items(
-            "SELECT VALUE COUNT(1) FROM c WHERE NOT IS_DEFINED(c.deleted_at)",
+        async for item in self._stream(
+            "count_all",
+            self._container.query_items(
+                "SELECT VALUE COUNT(1) FROM c WHERE NOT IS_DEFINED(c.deleted_at)",
+            ),
         ):
             total = cast("int", item)
         return total
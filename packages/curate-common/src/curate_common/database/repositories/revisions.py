@@ -2,15 +2,35 @@
 
 from __future__ import annotations
 
+import functools
+import time
+from typing import TYPE_CHECKING, Any, cast
+
+from azure.cosmos.exceptions import CosmosHttpResponseError
+
 from curate_common.database.repositories.base import BaseRepository
+from curate_common.database.telemetry import OperationStats
 from curate_common.models.revision import Revision
 
+if TYPE_CHECKING:
+    from azure.cosmos.aio import ContainerProxy, DatabaseProxy
+
+_HTTP_NOT_FOUND = 404
+_HTTP_CONFLICT = 409
+_COUNTER_PREFIX = "revision-sequence-"
+
 
 class RevisionRepository(BaseRepository[Revision]):
     """Provide data access for the revisions container."""
 
     container_name = "revisions"
     model_class = Revision
+    partition_field = "edition_id"
+
+    def __init__(self, database: DatabaseProxy) -> None:
+        """Initialize the repository and the sequence counter container."""
+        super().__init__(database)
+        self._counters: ContainerProxy = database.get_container_client("metadata")
 
     async def list_by_edition(self, edition_id: str) -> list[Revision]:
         """Return all revisions for an edition ordered by sequence ascending."""
@@ -19,6 +39,7 @@ class RevisionRepository(BaseRepository[Revision]):
             " AND NOT IS_DEFINED(c.deleted_at)"
             " ORDER BY c.sequence ASC",
             [{"name": "@edition_id", "value": edition_id}],
+            partition_key=edition_id,
         )
 
     async def get_latest(self, edition_id: str) -> Revision | None:
@@ -28,18 +49,91 @@ class RevisionRepository(BaseRepository[Revision]):
             " AND NOT IS_DEFINED(c.deleted_at)"
             " ORDER BY c.sequence DESC OFFSET 0 LIMIT 1",
             [{"name": "@edition_id", "value": edition_id}],
+            partition_key=edition_id,
         )
         return results[0] if results else None
 
     async def next_sequence(self, edition_id: str) -> int:
-        """Return the next sequence number for a new revision."""
+        """Atomically allocate the next sequence number for a new revision.
+
+        The counter lives in the ``metadata`` container and is advanced with a
+        single patch ``incr`` operation, so concurrent writers never receive the
+        same number. Editions created before the counter existed are seeded
+        once from the highest stored sequence.
+        """
+        started_at = time.monotonic()
+        stats = OperationStats()
+        doc_id = f"{_COUNTER_PREFIX}{edition_id}"
+        while True:
+            try:
+                counter = cast(
+                    "dict[str, Any]",
+                    await self._call(
+                        "next_sequence",
+                        lambda: self._counters.patch_item(
+                            item=doc_id,
+                            partition_key=doc_id,
+                            patch_operations=[
+                                {"op": "incr", "path": "/value", "value": 1}
+                            ],
+                            response_hook=stats,
+                        ),
+                    ),
+                )
+            except CosmosHttpResponseError as exc:
+                if exc.status_code != _HTTP_NOT_FOUND:
+                    raise
+            else:
+                self._log_operation(
+                    "next_sequence",
+                    started_at,
+                    item_id=doc_id,
+                    outcome="incremented",
+                    stats=stats,
+                )
+                return int(counter["value"])
+
+            sequence = await self._max_sequence(edition_id) + 1
+            try:
+                await self._call(
+                    "next_sequence",
+                    functools.partial(
+                        self._counters.create_item,
+                        body={
+                            "id": doc_id,
+                            "edition_id": edition_id,
+                            "value": sequence,
+                        },
+                        response_hook=stats,
+                    ),
+                )
+            except CosmosHttpResponseError as exc:
+                # Another writer seeded the counter first — increment theirs.
+                if exc.status_code != _HTTP_CONFLICT:
+                    raise
+                continue
+            self._log_operation(
+                "next_sequence",
+                started_at,
+                item_id=doc_id,
+                outcome="seeded",
+                stats=stats,
+            )
+            return sequence
+
+    async def _max_sequence(self, edition_id: str) -> int:
+        """Return the highest stored revision sequence for an edition."""
         current_max = 0
-        async for value in self._container.query_items(
-            "SELECT VALUE MAX(c.sequence) FROM c"
-            " WHERE c.edition_id = @edition_id"
-            " AND NOT IS_DEFINED(c.deleted_at)",
-            parameters=[{"name": "@edition_id", "value": edition_id}],
+        async for value in self._stream(
+            "next_sequence",
+            self._container.query_items(
+                "SELECT VALUE MAX(c.sequence) FROM c"
+                " WHERE c.edition_id = @edition_id"
+                " AND NOT IS_DEFINED(c.deleted_at)",
+                parameters=[{"name": "@edition_id", "value": edition_id}],
+                partition_key=edition_id,
+            ),
         ):
             if isinstance(value, int | float | str):
                 current_max = int(value)
-        return current_max + 1
+        return current_max
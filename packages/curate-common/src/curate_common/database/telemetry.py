@@ -0,0 +1,187 @@
+"""Request unit and latency telemetry for repository operations.
+
+Each repository call passes an ``OperationStats`` to the Cosmos DB SDK as its
+response hook, collecting the request charge, activity id, and query metrics
+of every response. ``record_operation`` publishes them as OpenTelemetry
+metrics attributed to the container, the operation, and the caller — the
+route or pipeline stage set with ``caller_scope``. Charges are also added to
+every ``track_request_charge`` scope in progress, which is how a pipeline
+pass attaches its RU total to the AgentRun that recorded it.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import functools
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from opentelemetry import metrics
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Iterator, Mapping
+
+_meter = metrics.get_meter(__name__)
+_request_charge = _meter.create_counter(
+    "curate.cosmos.request_charge",
+    unit="RU",
+    description="Request units consumed by repository operations.",
+)
+_duration = _meter.create_histogram(
+    "curate.cosmos.operation.duration",
+    unit="ms",
+    description="Wall-clock duration of repository operations.",
+)
+_throttled_retries = _meter.create_counter(
+    "curate.cosmos.throttled_retries",
+    unit="{retry}",
+    description="Repository requests retried after a throttled response.",
+)
+
+_CHARGE_HEADER = "x-ms-request-charge"
+_ACTIVITY_ID_HEADER = "x-ms-activity-id"
+_QUERY_METRICS_HEADER = "x-ms-documentdb-query-metrics"
+
+UNATTRIBUTED = "unattributed"
+
+_caller: ContextVar[str] = ContextVar("repository_caller", default=UNATTRIBUTED)
+_trackers: ContextVar[tuple[RequestCharge, ...]] = ContextVar(
+    "request_charge_trackers", default=()
+)
+
+
+def current_caller() -> str:
+    """Return the route or pipeline stage repository calls are attributed to."""
+    return _caller.get()
+
+
+def set_caller(caller: str) -> None:
+    """Attribute repository calls in the current context to ``caller``."""
+    _caller.set(caller)
+
+
+@contextlib.contextmanager
+def caller_scope(caller: str) -> Iterator[None]:
+    """Attribute repository calls made inside the block to ``caller``."""
+    token = _caller.set(caller)
+    try:
+        yield
+    finally:
+        _caller.reset(token)
+
+
+@dataclass
+class RequestCharge:
+    """Running RU total of the repository operations made inside a scope."""
+
+    request_charge: float = 0.0
+    operations: int = 0
+
+
+@contextlib.contextmanager
+def track_request_charge() -> Iterator[RequestCharge]:
+    """Sum the request charge of repository operations made inside the block.
+
+    Scopes nest: an operation is counted by every enclosing scope, including
+    operations made by tasks started inside the block.
+    """
+    tracker = RequestCharge()
+    token = _trackers.set((*_trackers.get(), tracker))
+    try:
+        yield tracker
+    finally:
+        _trackers.reset(token)
+
+
+@dataclass(frozen=True)
+class _ChargeScope:
+    """Decorator running a coroutine function inside caller and charge scopes."""
+
+    caller: str
+
+    def __call__[R](
+        self, handler: Callable[..., Awaitable[R]]
+    ) -> Callable[..., Awaitable[R]]:
+        @functools.wraps(handler)
+        async def wrapper(*args: object, **kwargs: object) -> R:
+            with caller_scope(self.caller), track_request_charge():
+                return await handler(*args, **kwargs)
+
+        return wrapper
+
+
+def track_request_charges(caller: str) -> _ChargeScope:
+    """Run a coroutine function inside ``caller_scope`` and a charge scope."""
+    return _ChargeScope(caller)
+
+
+def current_request_charge() -> RequestCharge | None:
+    """Return the innermost ``track_request_charge`` scope, if any."""
+    trackers = _trackers.get()
+    return trackers[-1] if trackers else None
+
+
+@dataclass
+class OperationStats:
+    """Response metadata collected from the requests of one operation.
+
+    Instances are passed to the SDK as ``response_hook``, which calls them
+    once per response — once per page for queries.
+    """
+
+    request_charge: float = 0.0
+    activity_id: str | None = None
+    query_metrics: dict[str, float] = field(default_factory=dict)
+
+    def __call__(self, headers: Mapping[str, Any], *_args: object) -> None:
+        """Add one response's charge, activity id, and query metrics."""
+        self.request_charge += float(headers.get(_CHARGE_HEADER) or 0.0)
+        self.activity_id = headers.get(_ACTIVITY_ID_HEADER) or self.activity_id
+        for name, value in _parse_query_metrics(headers.get(_QUERY_METRICS_HEADER)):
+            self.query_metrics[name] = self.query_metrics.get(name, 0.0) + value
+
+
+def _parse_query_metrics(header: str | None) -> Iterator[tuple[str, float]]:
+    """Yield the numeric ``name=value`` pairs of a query metrics header."""
+    for part in (header or "").split(";"):
+        name, _, value = part.partition("=")
+        if _is_number(value):
+            yield name.strip(), float(value)
+
+
+def _is_number(value: str) -> bool:
+    try:
+        float(value)
+    except ValueError:
+        return False
+    return True
+
+
+def record_operation(
+    container: str, operation: str, stats: OperationStats, duration_ms: float
+) -> None:
+    """Publish one operation's RU and duration and add its charge to scopes."""
+    attributes = {
+        "db.collection.name": container,
+        "db.operation.name": operation,
+        "curate.caller": _caller.get(),
+    }
+    _request_charge.add(stats.request_charge, attributes)
+    _duration.record(duration_ms, attributes)
+    for tracker in _trackers.get():
+        tracker.request_charge += stats.request_charge
+        tracker.operations += 1
+
+
+def record_throttled_retry(container: str, operation: str, status_code: int) -> None:
+    """Count a repository request retried after a throttled response."""
+    _throttled_retries.add(
+        1,
+        {
+            "db.collection.name": container,
+            "db.operation.name": operation,
+            "db.response.status_code": str(status_code),
+            "curate.caller": _caller.get(),
+        },
+    )
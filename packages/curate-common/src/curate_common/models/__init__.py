@@ -1,9 +1,9 @@
 """Data models for Cosmos DB document types."""
 
 from curate_common.models.agent_run import AgentRun, AgentRunStatus, AgentStage
-from curate_common.models.edition import Edition, EditionStatus
+from curate_common.models.edition import Edition, EditionStatus, EditionSummary
 from curate_common.models.feedback import Feedback
-from curate_common.models.link import Link, LinkStatus
+from curate_common.models.link import Link, LinkStatus, LinkSummary
 from curate_common.models.revision import Revision, RevisionSource
 
 __all__ = [
@@ -12,9 +12,11 @@ __all__ = [
     "AgentStage",
     "Edition",
     "EditionStatus",
+    "EditionSummary",
     "Feedback",
     "Link",
     "LinkStatus",
+    "LinkSummary",
     "Revision",
     "RevisionSource",
 ]
@@ -25,6 +25,7 @@ class AgentRunStatus(StrEnum):
     RUNNING = "running"
     COMPLETED = "completed"
     FAILED = "failed"
+    TIMED_OUT = "timed_out"
 
 
 class AgentRun(DocumentBase):
@@ -39,3 +40,4 @@ class AgentRun(DocumentBase):
     usage: dict | None = None
     started_at: datetime | None = None
     completed_at: datetime | None = None
+    worker_id: str | None = None
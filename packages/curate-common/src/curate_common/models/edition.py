@@ -5,7 +5,7 @@ from __future__ import annotations
 from datetime import datetime  # noqa: TC003 - required at runtime by Pydantic
 from enum import StrEnum
 
-from pydantic import Field
+from pydantic import BaseModel, Field
 
 from curate_common.models.base import DocumentBase
 
@@ -25,4 +25,20 @@ class Edition(DocumentBase):
     status: EditionStatus = EditionStatus.CREATED
     content: dict = Field(default_factory=dict)
     link_ids: list[str] = Field(default_factory=list)
+    link_sections: dict[str, list[str]] = Field(
+        default_factory=dict,
+        description="Content sections each link contributed to (set at draft time)",
+    )
     published_at: datetime | None = None
+
+
+class EditionSummary(BaseModel):
+    """The fields list views show for an edition, without its content."""
+
+    id: str
+    title: str | None = Field(default=None, description="Projected content title")
+    status: EditionStatus = EditionStatus.CREATED
+    link_count: int = Field(default=0, description="Number of associated links")
+    published_at: datetime | None = None
+    created_at: datetime
+    updated_at: datetime
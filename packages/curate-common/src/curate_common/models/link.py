@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
+from datetime import datetime  # noqa: TC003 - required at runtime by Pydantic
 from enum import StrEnum
 
-from pydantic import Field
+from pydantic import BaseModel, Field
 
 from curate_common.models.base import DocumentBase
 
@@ -31,3 +32,27 @@ class Link(DocumentBase):
         default=None,
         description="Associated edition (set when link is added to an edition)",
     )
+    processing_claimed_at: datetime | None = Field(
+        default=None,
+        description="Last heartbeat of the worker processing the link",
+    )
+    processing_owner: str | None = Field(
+        default=None,
+        description="Instance id of the worker holding the processing claim",
+    )
+    cancel_requested_at: datetime | None = Field(
+        default=None,
+        description="When an editor stopped the link's pipeline",
+    )
+
+
+class LinkSummary(BaseModel):
+    """The fields list views show for a link, without its content or review."""
+
+    id: str
+    url: str
+    title: str | None = None
+    status: LinkStatus = LinkStatus.SUBMITTED
+    edition_id: str | None = None
+    created_at: datetime
+    updated_at: datetime
@@ -0,0 +1,73 @@
+"""Link provenance for edition content — which sections each link contributed to.
+
+The draft stage records, per link, the content sections it touched. When a
+link is removed from an edition its material is stripped from those sections
+in place instead of discarding the whole edition and redrafting every link.
+"""
+
+from __future__ import annotations
+
+from typing import Any, cast
+
+# Sections holding one item per source link, matched by the item's ``url``.
+_ITEM_SECTIONS = ("signals", "toolkit")
+# Sections composed as a whole, attributed to the link whose draft changed them.
+_FEATURE_SECTIONS = ("deep_dive",)
+
+
+def _is_item_for(item: object, url: str) -> bool:
+    """Return True when a list-section item points at ``url``."""
+    return isinstance(item, dict) and cast("dict[str, Any]", item).get("url") == url
+
+
+def _references_url(items: object, url: str) -> bool:
+    """Return True when any item in a list section points at ``url``."""
+    return isinstance(items, list) and any(_is_item_for(item, url) for item in items)
+
+
+def attribute_sections(
+    previous: dict[str, Any], current: dict[str, Any], url: str
+) -> list[str]:
+    """Return the content sections a link's draft contributed to.
+
+    Item sections are attributed when they contain an entry for the link's URL;
+    feature sections are attributed when the draft changed them.
+    """
+    sections = [key for key in _ITEM_SECTIONS if _references_url(current.get(key), url)]
+    sections.extend(
+        key
+        for key in _FEATURE_SECTIONS
+        if current.get(key) and current.get(key) != previous.get(key)
+    )
+    return sections
+
+
+def remove_link_contribution(
+    content: dict[str, Any],
+    link_sections: dict[str, list[str]],
+    link_id: str,
+    url: str,
+) -> list[str]:
+    """Strip a link's material from edition content in place.
+
+    Item-section entries for the link's URL are always removed. A feature
+    section is only dropped when no remaining link is attributed to it, since
+    shared prose cannot be split per source. The link's provenance entry is
+    removed from ``link_sections``. Returns the sections that changed.
+    """
+    attributed = set(link_sections.pop(link_id, []))
+    changed: list[str] = []
+    for key in _ITEM_SECTIONS:
+        items = content.get(key)
+        if not isinstance(items, list) or not _references_url(items, url):
+            continue
+        content[key] = [item for item in items if not _is_item_for(item, url)]
+        changed.append(key)
+    for key in _FEATURE_SECTIONS:
+        if key not in attributed or key not in content:
+            continue
+        if any(key in sections for sections in link_sections.values()):
+            continue
+        del content[key]
+        changed.append(key)
+    return changed
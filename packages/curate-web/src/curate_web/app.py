@@ -14,7 +14,7 @@ from typing import TYPE_CHECKING
 import uvicorn
 from azure.core.exceptions import HttpResponseError, ServiceRequestError
 from azure.monitor.opentelemetry import configure_azure_monitor
-from fastapi import FastAPI, Request
+from fastapi import Depends, FastAPI, Request
 from fastapi.responses import HTMLResponse, Response
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
@@ -23,6 +23,7 @@ from starlette.middleware.sessions import SessionMiddleware
 
 from curate_common.config import Settings, load_settings
 from curate_common.database.repositories.editions import EditionRepository
+from curate_common.database.telemetry import set_caller
 from curate_common.events import ServiceBusPublisher
 from curate_common.health import check_emulators
 from curate_common.logging import configure_logging
@@ -117,6 +118,12 @@ def _install_request_diagnostics_middleware(app: FastAPI, settings: Settings) ->
                 logger.debug(message, *args)
 
 
+async def _attribute_repository_calls(request: Request) -> None:
+    """Attribute the request's repository calls to its route template."""
+    path = getattr(request.scope.get("route"), "path", request.url.path)
+    set_caller(f"{request.method} {path}")
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     """Manage application lifecycle — initialize DB and storage."""
@@ -222,6 +229,7 @@ def create_app() -> FastAPI:
         title="Curate — Editorial Dashboard",
         lifespan=lifespan,
         middleware=middleware,
+        dependencies=[Depends(_attribute_repository_calls)],
     )
     _install_request_diagnostics_middleware(app, settings)
 
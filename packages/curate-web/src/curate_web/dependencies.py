@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Annotated
+
+from fastapi import Query
 
 from curate_common.database.repositories.agent_runs import AgentRunRepository
+from curate_common.database.repositories.base import MAX_PAGE_SIZE
 from curate_common.database.repositories.editions import EditionRepository
 from curate_common.database.repositories.feedback import FeedbackRepository
 from curate_common.database.repositories.links import LinkRepository
@@ -13,6 +16,9 @@ from curate_common.database.repositories.revisions import RevisionRepository
 if TYPE_CHECKING:
     from curate_web.runtime import WebRuntime
 
+PageSize = Annotated[int, Query(ge=1, le=MAX_PAGE_SIZE)]
+Cursor = Annotated[str | None, Query(description="Continuation token of the page")]
+
 
 def get_agent_run_repository(runtime: WebRuntime) -> AgentRunRepository:
     """Return an agent-run repository bound to the runtime database."""
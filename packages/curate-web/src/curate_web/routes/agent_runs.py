@@ -5,8 +5,9 @@ from __future__ import annotations
 from fastapi import APIRouter, Depends, Request
 from fastapi.responses import HTMLResponse
 
+from curate_common.database.repositories.base import DEFAULT_PAGE_SIZE
 from curate_web.auth.middleware import require_authenticated_user
-from curate_web.dependencies import get_agent_run_repository
+from curate_web.dependencies import Cursor, PageSize, get_agent_run_repository
 from curate_web.runtime import get_runtime
 
 router = APIRouter(
@@ -17,12 +18,21 @@ router = APIRouter(
 
 
 @router.get("/recent", response_class=HTMLResponse)
-async def recent_runs(request: Request) -> HTMLResponse:
-    """Return recent agent runs as an HTML partial for the dashboard."""
+async def recent_runs(
+    request: Request,
+    page_size: PageSize = DEFAULT_PAGE_SIZE,
+    cursor: Cursor = None,
+) -> HTMLResponse:
+    """Return a page of recent agent runs as an HTML partial."""
     runtime = get_runtime(request)
     runs_repo = get_agent_run_repository(runtime)
-    runs = await runs_repo.list_recent(20)
+    page = await runs_repo.list_page(page_size=page_size, continuation=cursor)
     return runtime.templates.TemplateResponse(
         "partials/agent_run_item.html",
-        {"request": request, "runs": runs},
+        {
+            "request": request,
+            "runs": page.items,
+            "page_size": page_size,
+            "next_cursor": page.continuation,
+        },
     )
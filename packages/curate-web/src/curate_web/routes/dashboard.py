@@ -5,8 +5,14 @@ from __future__ import annotations
 from fastapi import APIRouter, Depends, Request
 from fastapi.responses import HTMLResponse, RedirectResponse
 
+from curate_common.database.repositories.base import DEFAULT_PAGE_SIZE
 from curate_web.auth.middleware import require_authenticated_user
-from curate_web.dependencies import get_agent_run_repository, get_edition_repository
+from curate_web.dependencies import (
+    Cursor,
+    PageSize,
+    get_agent_run_repository,
+    get_edition_repository,
+)
 from curate_web.runtime import get_runtime
 from curate_web.services.dashboard import get_dashboard_data
 
@@ -16,15 +22,21 @@ router = APIRouter(
 
 
 @router.get("/", response_class=HTMLResponse)
-async def dashboard(request: Request) -> HTMLResponse:
-    """Render the dashboard overview page."""
+async def dashboard(
+    request: Request,
+    page_size: PageSize = DEFAULT_PAGE_SIZE,
+    cursor: Cursor = None,
+) -> HTMLResponse:
+    """Render the dashboard overview page with one page of editions."""
     runtime = get_runtime(request)
     editions_repo = get_edition_repository(runtime)
     runs_repo = get_agent_run_repository(runtime)
-    data = await get_dashboard_data(editions_repo, runs_repo)
+    data = await get_dashboard_data(
+        editions_repo, runs_repo, page_size=page_size, cursor=cursor
+    )
     return runtime.templates.TemplateResponse(
         "dashboard.html",
-        {"request": request, **data},
+        {"request": request, "page_size": page_size, "cursor": cursor, **data},
     )
 
 
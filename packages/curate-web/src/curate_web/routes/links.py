@@ -1,4 +1,4 @@
-"""Store routes — global link library, submit, associate, delete."""
+"""Store routes — global link library, submit, associate, cancel, delete."""
 
 from __future__ import annotations
 
@@ -10,8 +10,14 @@ from fastapi import APIRouter, Depends, Form, Request
 from fastapi.responses import HTMLResponse, RedirectResponse
 
 import curate_web.services.links as link_svc
+from curate_common.database.repositories.base import DEFAULT_PAGE_SIZE
 from curate_web.auth.middleware import require_authenticated_user
-from curate_web.dependencies import get_edition_repository, get_link_repository
+from curate_web.dependencies import (
+    Cursor,
+    PageSize,
+    get_edition_repository,
+    get_link_repository,
+)
 from curate_web.runtime import get_runtime
 
 router = APIRouter(
@@ -24,17 +30,22 @@ logger = logging.getLogger(__name__)
 
 
 @router.get("/", response_class=HTMLResponse)
-async def list_store(request: Request) -> HTMLResponse:
-    """Render the global links store page."""
+async def list_store(
+    request: Request,
+    page_size: PageSize = DEFAULT_PAGE_SIZE,
+    cursor: Cursor = None,
+) -> HTMLResponse:
+    """Render one page of the global links store."""
     started_at = time.monotonic()
     runtime = get_runtime(request)
     links_repo = get_link_repository(runtime)
 
-    links = await links_repo.list_all()
+    page = await links_repo.list_page(page_size=page_size, continuation=cursor)
 
     logger.info(
-        "Store page loaded — links=%d duration_ms=%.0f",
-        len(links),
+        "Store page loaded — links=%d more=%s duration_ms=%.0f",
+        len(page.items),
+        page.continuation is not None,
         (time.monotonic() - started_at) * 1000,
     )
 
@@ -42,7 +53,10 @@ async def list_store(request: Request) -> HTMLResponse:
         "store.html",
         {
             "request": request,
-            "links": links,
+            "links": page.items,
+            "page_size": page_size,
+            "cursor": cursor,
+            "next_cursor": page.continuation,
         },
     )
 
@@ -110,6 +124,22 @@ async def retry_link(request: Request, link_id: str) -> RedirectResponse:
     return RedirectResponse("/store/", status_code=303)
 
 
+@router.post("/{link_id}/cancel")
+async def cancel_link(
+    request: Request,
+    link_id: str,
+    next: Annotated[str | None, Form()] = None,  # noqa: A002
+) -> RedirectResponse:
+    """Stop an in-progress link's pipeline."""
+    runtime = get_runtime(request)
+    links_repo = get_link_repository(runtime)
+
+    if await link_svc.cancel_link(link_id, links_repo):
+        logger.info("Link pipeline cancelled — link=%s", link_id)
+    redirect_url = next or "/store/"
+    return RedirectResponse(redirect_url, status_code=303)
+
+
 @router.post("/{link_id}/delete")
 async def delete_link(
     request: Request,
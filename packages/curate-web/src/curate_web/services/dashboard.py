@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any
 
+from curate_common.database.repositories.base import DEFAULT_PAGE_SIZE
+
 if TYPE_CHECKING:
     from curate_common.database.repositories.agent_runs import AgentRunRepository
     from curate_common.database.repositories.editions import EditionRepository
@@ -12,13 +14,17 @@ if TYPE_CHECKING:
 async def get_dashboard_data(
     editions_repo: EditionRepository,
     runs_repo: AgentRunRepository,
+    *,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    cursor: str | None = None,
 ) -> dict[str, Any]:
-    """Fetch editions and recent agent runs for the dashboard overview."""
-    editions = await editions_repo.list_all()
+    """Fetch a page of editions and recent agent runs for the dashboard."""
+    editions = await editions_repo.list_page(page_size=page_size, continuation=cursor)
     active_edition = await editions_repo.get_active()
     recent_runs = await runs_repo.list_recent(5)
     return {
-        "editions": editions,
+        "editions": editions.items,
+        "next_cursor": editions.continuation,
         "active_edition": active_edition,
         "recent_runs": recent_runs,
     }
@@ -7,6 +7,7 @@ import time
 from typing import TYPE_CHECKING, Any
 from uuid import uuid4
 
+from curate_common.database.repositories.base import DEFAULT_PAGE_SIZE
 from curate_common.events import PublishRequest
 from curate_common.models.edition import Edition
 from curate_web.services.agent_runs import group_runs_by_invocation
@@ -14,19 +15,26 @@ from curate_web.services.revisions import compute_diffs
 
 if TYPE_CHECKING:
     from curate_common.database.repositories.agent_runs import AgentRunRepository
+    from curate_common.database.repositories.base import Page
     from curate_common.database.repositories.editions import EditionRepository
     from curate_common.database.repositories.feedback import FeedbackRepository
     from curate_common.database.repositories.links import LinkRepository
     from curate_common.database.repositories.revisions import RevisionRepository
     from curate_common.events import EventPublisher
+    from curate_common.models.edition import EditionSummary
     from curate_common.models.link import Link
 
 logger = logging.getLogger(__name__)
 
 
-async def list_editions(editions_repo: EditionRepository) -> list[Edition]:
-    """Return all editions."""
-    return await editions_repo.list_all()
+async def list_editions(
+    editions_repo: EditionRepository,
+    *,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    cursor: str | None = None,
+) -> Page[EditionSummary]:
+    """Return a page of edition summaries, newest first."""
+    return await editions_repo.list_page(page_size=page_size, continuation=cursor)
 
 
 async def get_edition(
@@ -63,7 +71,9 @@ async def get_edition_detail(
 
     trigger_ids = [link.id for link in links]
     agent_runs = (
-        await agent_runs_repo.get_by_triggers(trigger_ids) if trigger_ids else []
+        await agent_runs_repo.get_by_triggers(trigger_ids, edition_id)
+        if trigger_ids
+        else []
     )
     links_by_id = {link.id: link for link in links}
 
@@ -98,7 +108,8 @@ async def get_workspace_data(
     started_at = time.monotonic()
     edition = await editions_repo.get(edition_id, edition_id)
     links: list[Link] = await links_repo.get_by_edition(edition_id) if edition else []
-    unattached_links = await links_repo.list_unattached()
+    unattached = await links_repo.list_unattached()
+    unattached_links = unattached.items
     agent_runs = await agent_runs_repo.list_by_edition(edition_id)
     feedback = await feedback_repo.get_by_edition(edition_id)
     links_by_id = {link.id: link for link in links}
@@ -147,6 +158,7 @@ async def get_workspace_data(
         "edition": edition,
         "links": links,
         "unattached_links": unattached_links,
+        "more_unattached": unattached.continuation is not None,
         "agent_runs": agent_runs,
         "feedback": feedback,
         "links_by_id": links_by_id,
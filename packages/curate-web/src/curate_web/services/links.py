@@ -1,4 +1,4 @@
-"""Link business logic — submit, associate, disassociate, retry, delete."""
+"""Link business logic — submit, associate, disassociate, retry, cancel, delete."""
 
 from __future__ import annotations
 
@@ -6,6 +6,7 @@ from typing import TYPE_CHECKING
 
 from curate_common.models.edition import EditionStatus
 from curate_common.models.link import Link, LinkStatus
+from curate_common.provenance import remove_link_contribution
 
 if TYPE_CHECKING:
     from curate_common.database.repositories.editions import EditionRepository
@@ -83,10 +84,19 @@ async def retry_link(
     link.status = LinkStatus.SUBMITTED
     link.title = None
     link.content = None
+    link.cancel_requested_at = None
     await links_repo.update(link, link_id)
     return True
 
 
+async def cancel_link(
+    link_id: str,
+    links_repo: LinkRepository,
+) -> bool:
+    """Stop a link's pipeline and mark it failed. Returns True if stopped."""
+    return await links_repo.request_cancel(link_id)
+
+
 async def delete_link(
     link_id: str,
     links_repo: LinkRepository,
@@ -94,6 +104,9 @@ async def delete_link(
 ) -> Edition | None:
     """Soft-delete a link and update its edition if associated.
 
+    Only the deleted link's material is stripped from the edition content,
+    so the remaining drafted links do not need to be redrafted.
+
     Returns the edition if applicable, None if link not found.
     """
     link = await links_repo.get(link_id, link_id)
@@ -107,14 +120,9 @@ async def delete_link(
         if edition:
             if link_id in edition.link_ids:
                 edition.link_ids.remove(link_id)
-                edition.content = {}
-                await editions_repo.update(edition, link.edition_id)
-
-                remaining = await links_repo.get_by_status(
-                    link.edition_id, LinkStatus.DRAFTED
+                remove_link_contribution(
+                    edition.content, edition.link_sections, link_id, link.url
                 )
-                for remaining_link in remaining:
-                    remaining_link.status = LinkStatus.REVIEWED
-                    await links_repo.update(remaining_link, remaining_link.id)
+                await editions_repo.update(edition, link.edition_id)
             return edition
     return None
@@ -0,0 +1,139 @@
+"""Pipeline and stage deadlines.
+
+A ``PipelineDeadline`` bounds a whole handler (a link, a piece of feedback,
+or a publish) and publishes its deadline and the per-stage timeout through a
+context variable. Sub-agent tools open a ``StageDeadline`` inside it, so each
+stage is bounded by whichever comes first: its own timeout or the end of the
+pipeline. Tool code such as HTTP fetches can cap its own timeouts with
+``remaining``. Expiry cancels the work in progress, including a pending LLM
+call, and surfaces as ``TimeoutError``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Self
+
+if TYPE_CHECKING:
+    from types import TracebackType
+
+
+@dataclass
+class _Scope:
+    """The deadline of the running pipeline, in event loop time."""
+
+    deadline: float | None
+    stage_timeout: float
+    expired_stages: list[str] = field(default_factory=list)
+
+
+_scope: contextvars.ContextVar[_Scope | None] = contextvars.ContextVar(
+    "pipeline_deadline", default=None
+)
+
+
+def remaining(default: float) -> float:
+    """Return ``default`` capped at the time left before the pipeline deadline."""
+    scope = _scope.get()
+    if scope is None or scope.deadline is None:
+        return default
+    left = scope.deadline - asyncio.get_running_loop().time()
+    return max(min(default, left), 0.0)
+
+
+class PipelineDeadline:
+    """Bounds a pipeline and sets the timeout for the stages nested in it.
+
+    A ``timeout`` or ``stage_timeout`` of zero or less disables that bound.
+    """
+
+    def __init__(self, timeout: float, *, stage_timeout: float) -> None:
+        """Initialize with the pipeline timeout and the per-stage timeout."""
+        self.timeout = timeout
+        self._stage_timeout = stage_timeout
+        self._scope = _Scope(None, stage_timeout)
+        self._timeout: asyncio.Timeout | None = None
+        self._token: contextvars.Token[_Scope | None] | None = None
+
+    @property
+    def expired(self) -> bool:
+        """Return True when the pipeline deadline has passed."""
+        return self._timeout is not None and self._timeout.expired()
+
+    @property
+    def expired_stages(self) -> list[str]:
+        """Return the stages that hit their own timeout, in order."""
+        return list(self._scope.expired_stages)
+
+    async def __aenter__(self) -> Self:
+        """Start the pipeline clock."""
+        when = (
+            asyncio.get_running_loop().time() + self.timeout
+            if self.timeout > 0
+            else None
+        )
+        self._scope = _Scope(when, self._stage_timeout)
+        self._token = _scope.set(self._scope)
+        self._timeout = asyncio.timeout_at(when)
+        await self._timeout.__aenter__()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        """Stop the clock, raising ``TimeoutError`` if the deadline passed."""
+        try:
+            if self._timeout is not None:
+                await self._timeout.__aexit__(exc_type, exc, tb)
+        finally:
+            if self._token is not None:
+                _scope.reset(self._token)
+
+
+class StageDeadline:
+    """Bounds one stage of the running pipeline."""
+
+    def __init__(self, stage: str) -> None:
+        """Initialize with the stage name recorded if it times out."""
+        self.stage = stage
+        self._timeout: asyncio.Timeout | None = None
+
+    @property
+    def expired(self) -> bool:
+        """Return True when the stage's own timeout has passed."""
+        return self._timeout is not None and self._timeout.expired()
+
+    async def __aenter__(self) -> Self:
+        """Start the stage clock."""
+        scope = _scope.get()
+        when = None
+        if scope is not None and scope.stage_timeout > 0:
+            when = asyncio.get_running_loop().time() + scope.stage_timeout
+            # The pipeline deadline already covers a stage that would outlive it.
+            if scope.deadline is not None and when >= scope.deadline:
+                when = None
+        self._timeout = asyncio.timeout_at(when)
+        await self._timeout.__aenter__()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        """Stop the clock, raising ``TimeoutError`` if the stage timed out."""
+        if self._timeout is None:
+            return
+        try:
+            await self._timeout.__aexit__(exc_type, exc, tb)
+        except TimeoutError:
+            scope = _scope.get()
+            if scope is not None:
+                scope.expired_stages.append(self.stage)
+            raise
@@ -11,6 +11,7 @@ from agent_framework import Agent, AgentResponse, tool
 
 from curate_common.models.link import Link, LinkStatus
 from curate_common.models.revision import Revision, RevisionSource
+from curate_common.provenance import attribute_sections
 from curate_worker.agents.middleware import TokenTrackingMiddleware
 from curate_worker.agents.prompts import load_prompt
 
@@ -123,6 +124,11 @@ class DraftAgent:
         for key in ("title", "issue_number"):
             if key in edition.content:
                 parsed_content[key] = edition.content[key]
+        link = await self._links_repo.get(link_id, link_id)
+        if link:
+            edition.link_sections[link_id] = attribute_sections(
+                edition.content, parsed_content, link.url
+            )
         edition.content = parsed_content
         if link_id not in edition.link_ids:
             edition.link_ids.append(link_id)
@@ -140,17 +146,31 @@ class DraftAgent:
             )
             await self._revisions_repo.create(revision)
 
-        link = await self._links_repo.get(link_id, link_id)
-        if link:
-            link.status = LinkStatus.DRAFTED
-            await self._links_repo.update(link, link_id)
+        self._draft_saved = True
+        # The link may have been deleted, disassociated, or stopped while it
+        # was drafted; it is then left as the editor's change put it.
+        if link and not await self._links_repo.patch(
+            link_id,
+            link_id,
+            {"status": LinkStatus.DRAFTED},
+            condition="FROM c WHERE NOT IS_DEFINED(c.deleted_at)"
+            " AND NOT IS_DEFINED(c.cancel_requested_at)"
+            " AND IS_STRING(c.edition_id)",
+        ):
+            logger.info(
+                "Draft saved but link withdrawn — edition=%s link=%s",
+                edition_id,
+                link_id,
+            )
+            return json.dumps(
+                {"status": "withdrawn", "edition_id": edition_id, "link_id": link_id}
+            )
 
         logger.debug(
             "Draft saved — edition=%s link=%s status=drafted",
             edition_id,
             link_id,
         )
-        self._draft_saved = True
         return json.dumps({"status": "drafted", "edition_id": edition_id})
 
     async def run_guardrailed(self, task: str) -> AgentResponse[None]:
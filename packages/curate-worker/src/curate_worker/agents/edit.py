@@ -136,12 +136,15 @@ class EditAgent:
         edition_id: Annotated[str, "The edition partition key"],
     ) -> str:
         """Mark a feedback item as resolved."""
-        feedback = await self._feedback_repo.get(feedback_id, edition_id)
+        feedback = await self._feedback_repo.patch(
+            feedback_id,
+            edition_id,
+            {"resolved": True},
+            condition="FROM c WHERE NOT IS_DEFINED(c.deleted_at)",
+        )
         if not feedback:
             logger.warning("resolve_feedback: feedback %s not found", feedback_id)
             return json.dumps({"error": "Feedback not found"})
-        feedback.resolved = True
-        await self._feedback_repo.update(feedback, edition_id)
         logger.debug(
             "Feedback resolved — feedback=%s edition=%s",
             feedback_id,
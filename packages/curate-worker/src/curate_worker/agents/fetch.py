@@ -2,15 +2,18 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 import time
+from html.parser import HTMLParser
 from typing import TYPE_CHECKING, Annotated
 
 import httpx
 from agent_framework import Agent, tool
 
 from curate_common.models.link import Link, LinkStatus
+from curate_worker.agents.deadlines import remaining
 from curate_worker.agents.middleware import TokenTrackingMiddleware
 from curate_worker.agents.prompts import load_prompt
 
@@ -21,6 +24,96 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+_FETCH_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (compatible; Curate/1.0; +https://github.com/ljtill/curate)",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+}
+_FETCH_TIMEOUT_SECONDS = 30.0
+_MAX_PAGE_BYTES = 2_000_000
+_SKIPPED_TAGS = frozenset({"script", "style", "noscript", "nav", "header", "footer"})
+
+
+class _PageTextParser(HTMLParser):
+    """Collect the page title and visible text, skipping boilerplate elements."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.title = ""
+        self.chunks: list[str] = []
+        self._skip_depth = 0
+        self._in_title = False
+
+    def handle_starttag(
+        self,
+        tag: str,
+        attrs: list[tuple[str, str | None]],  # noqa: ARG002
+    ) -> None:
+        if tag in _SKIPPED_TAGS:
+            self._skip_depth += 1
+        elif tag == "title":
+            self._in_title = True
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag in _SKIPPED_TAGS and self._skip_depth:
+            self._skip_depth -= 1
+        elif tag == "title":
+            self._in_title = False
+
+    def handle_data(self, data: str) -> None:
+        text = data.strip()
+        if not text:
+            return
+        if self._in_title:
+            self.title += text
+        elif not self._skip_depth:
+            self.chunks.append(text)
+
+
+def extract_page_text(html: str) -> tuple[str, str]:
+    """Return ``(title, text)`` extracted from raw HTML."""
+    parser = _PageTextParser()
+    parser.feed(html)
+    parser.close()
+    return parser.title, " ".join(parser.chunks)
+
+
+async def fetch_page(url: str) -> str:
+    """Fetch the raw body of a URL, raising ``httpx.HTTPError`` on failure.
+
+    The HTTP timeout is capped at the time left before the pipeline deadline,
+    and bodies are truncated after ``_MAX_PAGE_BYTES``.
+    """
+    async with (
+        httpx.AsyncClient(
+            follow_redirects=True,
+            timeout=remaining(_FETCH_TIMEOUT_SECONDS),
+            headers=_FETCH_HEADERS,
+        ) as http,
+        http.stream("GET", url) as response,
+    ):
+        response.raise_for_status()
+        body = bytearray()
+        async for chunk in response.aiter_bytes():
+            body += chunk
+            if len(body) >= _MAX_PAGE_BYTES:
+                logger.debug("Page truncated — url=%s bytes=%d", url, len(body))
+                del body[_MAX_PAGE_BYTES:]
+                break
+        return _decode(bytes(body), response.charset_encoding)
+
+
+def _decode(body: bytes, charset: str | None) -> str:
+    try:
+        return body.decode(charset or "utf-8", errors="replace")
+    except LookupError:
+        return body.decode("utf-8", errors="replace")
+
+
+async def read_page(url: str) -> tuple[str, str]:
+    """Fetch a URL and return its ``(title, text)``, parsed off the event loop."""
+    html = await fetch_page(url)
+    return await asyncio.to_thread(extract_page_text, html)
+
 
 class FetchAgent:
     """Fetches URL content and updates the link document."""
@@ -32,6 +125,7 @@ class FetchAgent:
     ) -> None:
         """Initialize the fetch agent with LLM client and link repository."""
         self._links_repo = links_repo
+        self._pages: dict[str, tuple[str, str]] = {}
         middleware = [
             TokenTrackingMiddleware(),
         ]
@@ -49,27 +143,29 @@ class FetchAgent:
         """Return the inner Agent framework instance."""
         return self._agent  # ty: ignore[invalid-return-type]
 
-    @staticmethod
+    def remember_page(self, url: str, title: str, text: str) -> None:
+        """Serve ``url`` from already extracted text the next time it is fetched."""
+        self._pages[url] = (title, text)
+
+    def forget_page(self, url: str) -> None:
+        """Drop a remembered page that was not fetched."""
+        self._pages.pop(url, None)
+
     @tool
-    async def fetch_url(url: Annotated[str, "The URL to fetch content from"]) -> str:
+    async def fetch_url(
+        self, url: Annotated[str, "The URL to fetch content from"]
+    ) -> str:
         """Fetch the raw HTML content of a URL."""
+        page = self._pages.pop(url, None)
+        if page is not None:
+            logger.debug("URL served from extracted text: %s", url)
+            title, text = page
+            return f"Title: {title}\n\n{text}"
         logger.debug("Fetching URL: %s", url)
-        headers = {
-            "User-Agent": "Mozilla/5.0 (compatible; Curate/1.0; +https://github.com/ljtill/curate)",
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-        }
         try:
-            async with httpx.AsyncClient(
-                follow_redirects=True, timeout=30.0, headers=headers
-            ) as http:
-                response = await http.get(url)
-                response.raise_for_status()
-                logger.debug(
-                    "URL fetched successfully: %s (%d bytes)",
-                    url,
-                    len(response.text),
-                )
-                return response.text
+            text = await fetch_page(url)
+            logger.debug("URL fetched successfully: %s (%d bytes)", url, len(text))
+            return text  # noqa: TRY300
         except (
             httpx.ConnectError,
             httpx.ConnectTimeout,
@@ -0,0 +1,151 @@
+"""Fused review agent — extracts and reviews short articles in one call."""
+
+from __future__ import annotations
+
+import logging
+import time
+from typing import TYPE_CHECKING
+
+import httpx
+from agent_framework import Agent
+from pydantic import BaseModel, Field, ValidationError
+
+from curate_common.models.link import Link, LinkStatus
+from curate_worker.agents.fetch import read_page
+from curate_worker.agents.middleware import TokenTrackingMiddleware
+from curate_worker.agents.prompts import load_prompt, prompt_version
+
+if TYPE_CHECKING:
+    from agent_framework import AgentResponse, BaseChatClient
+
+    from curate_common.database.repositories.links import LinkRepository
+
+logger = logging.getLogger(__name__)
+
+_CHARS_PER_TOKEN = 4
+
+
+class FusedReviewResult(BaseModel):
+    """Structured output of a fused fetch + review call."""
+
+    title: str
+    content: str
+    insights: list[str]
+    category: str
+    relevance_score: int = Field(ge=1, le=10)
+    justification: str
+
+
+def estimate_tokens(text: str) -> int:
+    """Return a rough token count for ``text`` (about four characters a token)."""
+    return len(text) // _CHARS_PER_TOKEN
+
+
+class FusedReviewAgent:
+    """Extracts and reviews short articles in a single structured LLM call.
+
+    Used ahead of the orchestrator for submitted links: when the cleaned page
+    text fits under ``max_tokens`` the separate fetch and review conversations
+    are skipped and the link is written straight to ``reviewed``.
+    """
+
+    def __init__(
+        self,
+        client: BaseChatClient,
+        links_repo: LinkRepository,
+        *,
+        max_tokens: int,
+    ) -> None:
+        """Initialize the fused review agent with LLM client and link repository."""
+        self._links_repo = links_repo
+        self._max_tokens = max_tokens
+        middleware = [
+            TokenTrackingMiddleware(),
+        ]
+        self._agent = Agent(
+            client=client,
+            instructions=load_prompt("fused_review"),
+            name="fused-review-agent",
+            description="Extracts and reviews short articles in a single call.",
+            middleware=middleware,
+        )
+
+    @property
+    def agent(self) -> Agent:
+        """Return the inner Agent framework instance."""
+        return self._agent  # ty: ignore[invalid-return-type]
+
+    @property
+    def enabled(self) -> bool:
+        """Return True when the fused path is configured."""
+        return self._max_tokens > 0
+
+    async def extract(self, link: Link) -> tuple[str, str] | None:
+        """Fetch a link and return its page title and text.
+
+        Returns None when the fused path is disabled or the fetch fails — the
+        fetch agent then retries the URL and reports the failure itself.
+        """
+        if not self.enabled:
+            return None
+        try:
+            return await read_page(link.url)
+        except httpx.HTTPError as exc:
+            logger.debug(
+                "Fused review skipped — link=%s fetch failed: %s", link.id, exc
+            )
+            return None
+
+    def fits(self, link: Link, text: str) -> bool:
+        """Return True when extracted text is short enough for a fused review."""
+        tokens = estimate_tokens(text)
+        if text and tokens <= self._max_tokens:
+            return True
+        logger.debug(
+            "Fused review skipped — link=%s tokens=%d threshold=%d",
+            link.id,
+            tokens,
+            self._max_tokens,
+        )
+        return False
+
+    async def run(self, link: Link, title: str, text: str) -> AgentResponse | None:
+        """Review extracted page text in one call and save the link as reviewed.
+
+        Content, review, and the ``reviewed`` status are written in a single
+        update. Returns None when the model's structured output is unusable.
+        """
+        logger.info("Fused review started — link=%s", link.id)
+        t0 = time.monotonic()
+        message = (
+            f"Extract and review this article.\n"
+            f"URL: {link.url}\nPage title: {title}\n\n{text}"
+        )
+        response = await self._agent.run(
+            message, options={"response_format": FusedReviewResult}
+        )
+        try:
+            result = response.value if response else None
+        except ValidationError:
+            logger.warning("Fused review returned invalid output — link=%s", link.id)
+            return None
+        if not isinstance(result, FusedReviewResult):
+            return None
+
+        link.title = result.title or title
+        link.content = result.content
+        link.review = {
+            "insights": result.insights,
+            "category": result.category,
+            "relevance_score": result.relevance_score,
+            "justification": result.justification,
+            "prompt_version": prompt_version("fused_review"),
+        }
+        link.status = LinkStatus.REVIEWED
+        await self._links_repo.update(link, link.id)
+        logger.info(
+            "Fused review completed — link=%s duration_ms=%.0f",
+            link.id,
+            (time.monotonic() - t0) * 1000,
+        )
+        return response
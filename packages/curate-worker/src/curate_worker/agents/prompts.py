@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import hashlib
 import logging
 from functools import lru_cache
 from pathlib import Path
@@ -33,3 +34,13 @@ def load_prompt(stage: str) -> str:
     text = path.read_text(encoding="utf-8")
     logger.debug("Prompt loaded — stage=%s path=%s", stage, path)
     return text
+
+
+@lru_cache(maxsize=16)
+def prompt_version(stage: str) -> str:
+    """Return a short content hash identifying the current prompt for a stage.
+
+    Stored alongside agent output so cached results can be invalidated when
+    the prompt that produced them changes.
+    """
+    return hashlib.sha256(load_prompt(stage).encode("utf-8")).hexdigest()[:12]
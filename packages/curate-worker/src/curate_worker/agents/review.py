@@ -11,7 +11,7 @@ from agent_framework import Agent, tool
 
 from curate_common.models.link import Link, LinkStatus
 from curate_worker.agents.middleware import TokenTrackingMiddleware
-from curate_worker.agents.prompts import load_prompt
+from curate_worker.agents.prompts import load_prompt, prompt_version
 
 if TYPE_CHECKING:
     from agent_framework import BaseChatClient
@@ -95,6 +95,7 @@ class ReviewAgent:
             "category": category,
             "relevance_score": relevance_score,
             "justification": justification,
+            "prompt_version": prompt_version("review"),
         }
         link.status = LinkStatus.REVIEWED
         try:
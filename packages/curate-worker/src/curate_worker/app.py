@@ -2,20 +2,33 @@
 
 from __future__ import annotations
 
+import argparse
 import asyncio
 import logging
 import signal
+from datetime import UTC, datetime
 
 from agent_framework.observability import create_resource, enable_instrumentation
 from azure.monitor.opentelemetry import configure_azure_monitor
 
 from curate_common.config import load_settings
 from curate_common.database.repositories.editions import EditionRepository
+from curate_common.database.repositories.feedback import FeedbackRepository
 from curate_common.events import ServiceBusPublisher
 from curate_common.health import check_emulators
 from curate_common.logging import configure_logging
 from curate_worker.events import ServiceBusCommandConsumer
+from curate_worker.pipeline.leases import new_owner_id
+from curate_worker.pipeline.replay import (
+    REPLAY_CONTAINERS,
+    ChangeFeedReplayer,
+    ReplayOptions,
+    replay_handlers,
+)
 from curate_worker.startup import (
+    create_heartbeat,
+    create_links_repo,
+    create_orchestrator,
     init_chat_client,
     init_database,
     init_memory,
@@ -72,10 +85,11 @@ async def run() -> None:
         render_fn=renderer.render_edition,
         upload_fn=storage.upload_html,
         context_providers=context_providers,
+        pipeline_config=settings.pipeline,
     )
     command_consumer = ServiceBusCommandConsumer(
         settings.servicebus,
-        on_publish=processor.orchestrator.handle_publish,
+        on_publish=processor.handle_publish,
     )
     await command_consumer.start()
 
@@ -98,8 +112,151 @@ async def run() -> None:
     logger.info("Worker shutdown complete")
 
 
-def main() -> None:
+async def replay(options: ReplayOptions) -> None:
+    """Replay a window of change feed items through the pipeline handlers."""
+    settings = load_settings()
+    configure_logging(settings.app.log_level, log_file="worker.log")
+
+    try:
+        cosmos = await init_database(settings)
+    except ConnectionError as exc:
+        logger.error(str(exc))  # noqa: TRY400
+        return
+
+    if options.dry_run:
+        await ChangeFeedReplayer(cosmos.database, {}).run(options)
+        await cosmos.close()
+        return
+
+    chat_client = init_chat_client(settings)
+    if chat_client is None:
+        logger.error("Cannot replay without a configured LLM provider")
+        await cosmos.close()
+        return
+
+    editions_repo = EditionRepository(cosmos.database)
+    storage, renderer = await init_storage(settings, editions_repo)
+    event_publisher = ServiceBusPublisher(
+        settings.servicebus,
+        topic_name=settings.servicebus.event_topic_name,
+    )
+    owner_id = new_owner_id()
+    links_repo = create_links_repo(cosmos, settings.pipeline)
+    orchestrator = create_orchestrator(
+        chat_client,
+        cosmos,
+        editions_repo,
+        event_publisher,
+        links_repo=links_repo,
+        feedback_repo=FeedbackRepository(cosmos.database),
+        owner_id=owner_id,
+        render_fn=renderer.render_edition,
+        upload_fn=storage.upload_html,
+        context_providers=await init_memory(settings),
+        pipeline_config=settings.pipeline,
+    )
+    # Keep the replay's runs safe from orphan recovery by other workers.
+    heartbeat = create_heartbeat(cosmos, owner_id, settings.pipeline)
+    await heartbeat.beat()
+    heartbeat.start()
+    try:
+        await ChangeFeedReplayer(
+            cosmos.database,
+            replay_handlers(orchestrator, links_repo, editions_repo),
+        ).run(options)
+    finally:
+        await heartbeat.stop()
+        await event_publisher.close()
+        await storage.close()
+        await cosmos.close()
+
+
+def _parse_timestamp(value: str) -> datetime:
+    """Parse an ISO 8601 timestamp, treating naive values as UTC."""
+    parsed = datetime.fromisoformat(value)
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=UTC)
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse worker command-line arguments."""
+    parser = argparse.ArgumentParser(
+        prog="curate-worker", description="Curate agent pipeline worker."
+    )
+    commands = parser.add_subparsers(dest="command")
+    replay_parser = commands.add_parser(
+        "replay",
+        help="Replay change feed items through the pipeline handlers",
+    )
+    source = replay_parser.add_mutually_exclusive_group(required=True)
+    source.add_argument(
+        "--since",
+        type=_parse_timestamp,
+        help="ISO 8601 timestamp to replay changes from (naive values are UTC)",
+    )
+    source.add_argument(
+        "--continuation",
+        help="Change feed continuation token reported by an earlier replay",
+    )
+    replay_parser.add_argument(
+        "--container",
+        action="append",
+        choices=REPLAY_CONTAINERS,
+        dest="containers",
+        help="Container to replay (repeatable, default: all)",
+    )
+    replay_parser.add_argument(
+        "--status",
+        action="append",
+        dest="statuses",
+        help="Only replay items in this status (repeatable; feedback is "
+        "'open' or 'resolved')",
+    )
+    replay_parser.add_argument(
+        "--rate",
+        type=float,
+        default=1.0,
+        help="Maximum items started per second, 0 for unlimited (default: 1)",
+    )
+    replay_parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=2,
+        help="Maximum items processed at once (default: 2)",
+    )
+    replay_parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Report matching items without processing them",
+    )
+    args = parser.parse_args(argv)
+    if (
+        args.command == "replay"
+        and args.continuation
+        and len(args.containers or REPLAY_CONTAINERS) != 1
+    ):
+        parser.error("--continuation requires exactly one --container")
+    return args
+
+
+def replay_options(args: argparse.Namespace) -> ReplayOptions:
+    """Build replay options from parsed arguments."""
+    return ReplayOptions(
+        containers=tuple(args.containers or REPLAY_CONTAINERS),
+        start_time=args.since,
+        continuation=args.continuation,
+        statuses=frozenset(args.statuses or ()),
+        rate=args.rate,
+        concurrency=args.concurrency,
+        dry_run=args.dry_run,
+    )
+
+
+def main(argv: list[str] | None = None) -> None:
     """Entry point for the worker process."""
+    args = parse_args(argv)
+    if args.command == "replay":
+        asyncio.run(replay(replay_options(args)))
+        return
     asyncio.run(run())
 
 
@@ -8,14 +8,21 @@ from __future__ import annotations
 import asyncio
 import contextlib
 import logging
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime, timedelta
 from typing import TYPE_CHECKING, Any
 
 from azure.core.exceptions import (
-    ResourceNotFoundError,
     ServiceRequestError,
     ServiceResponseError,
 )
 
+from curate_worker.pipeline.checkpoints import CheckpointManager
+from curate_worker.pipeline.lanes import Lane, LaneScheduler
+from curate_worker.pipeline.leases import LeaseManager, new_owner_id
+from curate_worker.pipeline.prefilter import ChangeFilter
+
 _CONNECTIVITY_ERRORS = (ServiceRequestError, ConnectionError, OSError)
 
 if TYPE_CHECKING:
@@ -23,10 +30,91 @@ if TYPE_CHECKING:
 
     from azure.cosmos.aio import ContainerProxy, DatabaseProxy
 
+    from curate_common.config import PipelineConfig
+    from curate_worker.pipeline.claims import ClaimSweeper
+    from curate_worker.pipeline.heartbeat import WorkerHeartbeat
+    from curate_worker.pipeline.leases import Lease
     from curate_worker.pipeline.orchestrator import PipelineOrchestrator
 
 logger = logging.getLogger(__name__)
-_MAX_CONCURRENT_HANDLERS = 25
+_DEFAULT_LANE_LIMITS = {Lane.LINK: 20, Lane.FEEDBACK: 4, Lane.PUBLISH: 1}
+_MAX_PAGE_SIZE = 100
+_DEFAULT_MAX_IN_FLIGHT = 100
+_DEFAULT_POLL_MIN_SECONDS = 1.0
+_DEFAULT_POLL_MAX_SECONDS = 10.0
+_DEFAULT_CHECKPOINT_INTERVAL_SECONDS = 5.0
+_DEFAULT_CHECKPOINT_MAX_ITEMS = 50
+_DEFAULT_DRAIN_TIMEOUT_SECONDS = 25.0
+_ERROR_BACKOFF_MAX_SECONDS = 30.0
+_FEED_CONTAINERS = ("links", "feedback")
+_FEED_LANES = {"links": Lane.LINK, "feedback": Lane.FEEDBACK}
+
+
+def _lease_start_time(lease: Lease) -> datetime | None:
+    """Return the time a lease without a continuation should start reading from."""
+    return datetime.fromisoformat(lease.start_time) if lease.start_time else None
+
+
+class _Page:
+    """A change feed page whose continuation is committed once its items finish."""
+
+    __slots__ = ("pending", "token")
+
+    def __init__(self) -> None:
+        self.pending = 0
+        self.token: str | None = None
+
+
+@dataclass
+class _PollOutcome:
+    """What one poll of a container's leased ranges returned."""
+
+    items: int = 0
+    saturated: bool = False
+
+
+class RangeCursor:
+    """Track the read and committed positions of one feed range.
+
+    ``read_token`` is where the next poll resumes. ``committed_token`` only
+    advances past a page once every handler dispatched from it — and from all
+    earlier pages — has finished, so checkpointing it never skips unfinished
+    work and a crash re-delivers at least once.
+    """
+
+    def __init__(self, token: str | None) -> None:
+        """Initialize both positions at a persisted continuation token."""
+        self.read_token = token
+        self.committed_token = token
+        self.last_read = 0
+        self.saturated = False
+        self._pages: deque[_Page] = deque()
+
+    def begin_read(self) -> None:
+        """Reset the per-read counters before polling the range."""
+        self.last_read = 0
+        self.saturated = False
+
+    def open_page(self) -> _Page:
+        """Start tracking a page being dispatched."""
+        page = _Page()
+        self._pages.append(page)
+        return page
+
+    def close_page(self, page: _Page, token: str | None) -> None:
+        """Record the continuation that follows a fully dispatched page."""
+        page.token = token
+        self.read_token = token or self.read_token
+        self._advance()
+
+    def item_done(self, page: _Page) -> None:
+        """Mark one handler from ``page`` as finished."""
+        page.pending -= 1
+        self._advance()
+
+    def _advance(self) -> None:
+        while self._pages and self._pages[0].token and not self._pages[0].pending:
+            self.committed_token = self._pages.popleft().token
 
 
 class ChangeFeedProcessor:
@@ -35,19 +123,102 @@ class ChangeFeedProcessor:
     Runs as a background task within the FastAPI lifespan. Handlers are
     dispatched as background tasks so the poll loop stays responsive and
     does not block the event loop during long-running agent processing.
+
+    Each container's feed is consumed per feed range under a lease held in
+    the ``metadata`` container, so several worker replicas split the feed
+    between them and checkpoint their ranges independently.
+
+    At most ``change_feed_max_in_flight`` handlers per container are pending
+    at once; when a container's window is full the processor stops paging it
+    until handlers finish, and each range's checkpoint only moves past items
+    whose handlers completed. Leases are renewed by a separate maintenance
+    task, so a container stalled on a full window keeps its ranges.
+
+    Handlers run in priority lanes (``lanes.py``): links, feedback, and
+    publishing each have their own concurrency pool, so a link backlog never
+    delays editor feedback, and slots are shared fairly across editions.
+
+    Each container is polled by its own loop with an adaptive cadence: it
+    re-polls immediately after a full page, waits the minimum interval after
+    a partial one, and backs off exponentially to a ceiling while the feed is
+    empty. Errors back off separately per container.
+
+    Range checkpoints are write-behind: a token is only written when it has
+    changed, on an interval or after enough items complete, and once more
+    synchronously on ``stop``. Due flushes are written by the same
+    maintenance task that renews leases.
+
+    ``stop`` drains: intake stops at once, in-flight handlers get until the
+    drain deadline to finish, and only the stragglers are cancelled. A
+    cancelled link handler releases its claim so another replica resumes it.
     """
 
     def __init__(
-        self, database: DatabaseProxy, orchestrator: PipelineOrchestrator
+        self,
+        database: DatabaseProxy,
+        orchestrator: PipelineOrchestrator,
+        *,
+        owner_id: str | None = None,
+        config: PipelineConfig | None = None,
+        claim_sweeper: ClaimSweeper | None = None,
+        heartbeat: WorkerHeartbeat | None = None,
     ) -> None:
         """Initialize the change feed processor with database and orchestrator."""
         self._database = database
         self._orchestrator = orchestrator
+        self._owner_id = owner_id or new_owner_id()
+        self._leases: LeaseManager | None = None
+        self._claim_sweeper = claim_sweeper
+        self._heartbeat = heartbeat
         self._running = False
         self._task: asyncio.Task | None = None
+        self._maintenance_task: asyncio.Task | None = None
         self._handler_tasks: set[asyncio.Task] = set()
-        self._handler_semaphore = asyncio.Semaphore(_MAX_CONCURRENT_HANDLERS)
-        self._metadata: ContainerProxy | None = None
+        self._lanes = LaneScheduler(
+            {
+                Lane.LINK: config.link_concurrency,
+                Lane.FEEDBACK: config.feedback_concurrency,
+                Lane.PUBLISH: config.publish_concurrency,
+            }
+            if config
+            else _DEFAULT_LANE_LIMITS
+        )
+        self._feed_in_flight: dict[str, int] = dict.fromkeys(_FEED_CONTAINERS, 0)
+        self._max_in_flight = (
+            config.change_feed_max_in_flight if config else _DEFAULT_MAX_IN_FLIGHT
+        )
+        self._poll_min = (
+            config.change_feed_poll_min_seconds if config else _DEFAULT_POLL_MIN_SECONDS
+        )
+        self._poll_max = (
+            config.change_feed_poll_max_seconds if config else _DEFAULT_POLL_MAX_SECONDS
+        )
+        self._checkpoint_interval = (
+            config.change_feed_checkpoint_interval_seconds
+            if config
+            else _DEFAULT_CHECKPOINT_INTERVAL_SECONDS
+        )
+        self._checkpoint_max_items = (
+            config.change_feed_checkpoint_max_items
+            if config
+            else _DEFAULT_CHECKPOINT_MAX_ITEMS
+        )
+        self._drain_timeout = (
+            config.drain_timeout_seconds if config else _DEFAULT_DRAIN_TIMEOUT_SECONDS
+        )
+        self._checkpoints: CheckpointManager | None = None
+        self._cursors: dict[str, RangeCursor] = {}
+        self._range_leases: dict[str, Lease] = {}
+        self._filter = (
+            ChangeFilter(
+                owner_id=self._owner_id,
+                claim_ttl=timedelta(seconds=config.claim_ttl_seconds),
+            )
+            if config
+            else ChangeFilter(owner_id=self._owner_id)
+        )
+        self._capacity = asyncio.Event()
+        self._flush_wakeup = asyncio.Event()
         self._connectivity_warned = False
 
     @property
@@ -65,68 +236,211 @@ class ChangeFeedProcessor:
         """Return the pipeline orchestrator."""
         return self._orchestrator
 
+    @property
+    def change_filter(self) -> ChangeFilter:
+        """Return the prefilter that drops non-actionable items and echoes."""
+        return self._filter
+
+    @property
+    def lanes(self) -> LaneScheduler:
+        """Return the scheduler granting handlers their lane slots."""
+        return self._lanes
+
+    @property
+    def last_checkpoint_age(self) -> float | None:
+        """Return seconds since a range checkpoint was last written."""
+        return self._checkpoints.last_checkpoint_age if self._checkpoints else None
+
+    @property
+    def owner_id(self) -> str:
+        """Return the lease owner id of this processor."""
+        return self._owner_id
+
     async def start(self) -> None:
         """Start polling the change feed in a background task."""
-        self._metadata = self._database.get_container_client("metadata")
+        self._leases = LeaseManager(
+            self._database.get_container_client("metadata"), self._owner_id
+        )
+        self._checkpoints = CheckpointManager(
+            self._leases,
+            interval=self._checkpoint_interval,
+            max_items=self._checkpoint_max_items,
+        )
         self._running = True
         self._task = asyncio.create_task(self._poll_loop())
+        self._maintenance_task = asyncio.create_task(self._maintenance_loop())
+        if self._claim_sweeper:
+            self._claim_sweeper.start()
+        if self._heartbeat:
+            self._heartbeat.start()
         logger.info("Change feed processor started")
 
     async def stop(self) -> None:
-        """Stop the change feed processor gracefully."""
+        """Stop intake, drain in-flight handlers, and hand back leases."""
         self._running = False
+        if self._claim_sweeper:
+            await self._claim_sweeper.stop()
         if self._task:
             self._task.cancel()
             with contextlib.suppress(asyncio.CancelledError):
                 await self._task
+        await self._drain()
         for task in list(self._handler_tasks):
             task.cancel()
         if self._handler_tasks:
             await asyncio.gather(*self._handler_tasks, return_exceptions=True)
             self._handler_tasks.clear()
+        if self._maintenance_task:
+            self._maintenance_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._maintenance_task
+            self._maintenance_task = None
+        if self._leases:
+            try:
+                await self._flush_checkpoints()
+                await self._leases.release_all()
+            except Exception:  # noqa: BLE001
+                logger.warning("Failed to release change feed leases", exc_info=True)
+        if self._heartbeat:
+            await self._heartbeat.stop()
         logger.info("Change feed processor stopped")
 
-    async def _load_token(self, container_name: str) -> str | None:
-        """Load a persisted continuation token from the metadata container."""
-        if not self._metadata:
-            return None
-        doc_id = f"change-feed-token-{container_name}"
-        try:
-            doc = await self._metadata.read_item(doc_id, partition_key=doc_id)
-            return doc.get("token")
-        except ResourceNotFoundError:
-            return None
-        except Exception:  # noqa: BLE001
-            logger.warning("Failed to load continuation token for %s", container_name)
-            return None
-
-    async def _save_token(self, container_name: str, token: str | None) -> None:
-        """Persist a continuation token to the metadata container."""
-        if not self._metadata or not token:
+    async def _drain(self) -> None:
+        """Wait up to the drain deadline for in-flight handlers to finish."""
+        pending = set(self._handler_tasks)
+        if not pending or self._drain_timeout <= 0:
             return
-        doc_id = f"change-feed-token-{container_name}"
-        try:
-            await self._metadata.upsert_item(
-                {"id": doc_id, "token": token, "container": container_name}
+        logger.info(
+            "Change feed draining — in_flight=%d timeout_s=%.0f",
+            len(pending),
+            self._drain_timeout,
+        )
+        _, unfinished = await asyncio.wait(pending, timeout=self._drain_timeout)
+        if unfinished:
+            logger.warning(
+                "Change feed drain deadline passed — cancelling %d handlers",
+                len(unfinished),
             )
-        except Exception:  # noqa: BLE001
-            logger.warning("Failed to save continuation token for %s", container_name)
+
+    async def _poll_leases(
+        self,
+        container: ContainerProxy,
+        handler: Callable[[dict[str, Any]], Awaitable[object]],
+        name: str,
+    ) -> _PollOutcome:
+        """Poll every feed range this worker leases and buffer its checkpoint."""
+        outcome = _PollOutcome()
+        if not self._leases:
+            return outcome
+        owned = await self._leases.owned(container, name)
+        self._forget_ranges(name, keep={lease.id for lease in owned})
+        for lease in owned:
+            cursor = self._cursors.get(lease.id)
+            if cursor is None:
+                cursor = self._cursors[lease.id] = RangeCursor(lease.continuation)
+            self._range_leases[lease.id] = lease
+            cursor.begin_read()
+            if self._room(name) <= 0:
+                outcome.saturated = True
+            else:
+                await self.process_feed(
+                    container,
+                    cursor.read_token,
+                    handler,
+                    feed_range=lease.feed_range,
+                    start_time=_lease_start_time(lease),
+                    cursor=cursor,
+                )
+                outcome.items += cursor.last_read
+                outcome.saturated = outcome.saturated or cursor.saturated
+            if self._checkpoints:
+                self._checkpoints.record(lease, cursor.committed_token)
+        return outcome
+
+    async def _maintenance_loop(self) -> None:
+        """Renew leases and flush due checkpoints, independently of polling.
+
+        Wakes on a timer, or early once enough items have completed for a
+        checkpoint flush. Runs until ``stop`` cancels it after draining, so
+        leases stay held while in-flight handlers finish.
+        """
+        if not self._leases:
+            return
+        containers = {
+            name: self._database.get_container_client(name) for name in _FEED_CONTAINERS
+        }
+        tick = min(self._leases.renew_interval / 2, self._checkpoint_interval)
+        while True:
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._flush_wakeup.wait(), tick)
+            self._flush_wakeup.clear()
+            for name, container in containers.items():
+                try:
+                    await self._leases.owned(container, name)
+                except Exception:  # noqa: BLE001
+                    logger.warning(
+                        "Lease renewal failed for %s change feed", name, exc_info=True
+                    )
+            try:
+                await self._flush_checkpoints(force=False)
+            except Exception:  # noqa: BLE001
+                logger.warning("Change feed checkpoint flush failed", exc_info=True)
+
+    def _forget_ranges(self, name: str, keep: set[str]) -> None:
+        """Drop read state for a container's ranges this worker no longer leases."""
+        for lease_id, lease in list(self._range_leases.items()):
+            if lease.container == name and lease_id not in keep:
+                self._cursors.pop(lease_id, None)
+                self._range_leases.pop(lease_id, None)
+                if self._checkpoints:
+                    self._checkpoints.forget(lease_id)
+
+    async def _flush_checkpoints(self, *, force: bool = True) -> None:
+        """Write every range's committed position, now or when a flush is due.
+
+        Ranges whose lease turns out to be lost stop being tracked.
+        """
+        if not self._checkpoints:
+            return
+        for lease_id, lease in list(self._range_leases.items()):
+            cursor = self._cursors.get(lease_id)
+            if cursor:
+                self._checkpoints.record(lease, cursor.committed_token)
+        if force:
+            lost = await self._checkpoints.flush()
+        else:
+            lost = await self._checkpoints.maybe_flush()
+        for lease_id in lost:
+            self._cursors.pop(lease_id, None)
+            self._range_leases.pop(lease_id, None)
+
+    @property
+    def in_flight(self) -> int:
+        """Return the number of dispatched handlers that have not finished."""
+        return len(self._handler_tasks)
+
+    def _room(self, container_name: str) -> int:
+        """Return how many more handlers a container's window can take."""
+        return self._max_in_flight - self._feed_in_flight.get(container_name, 0)
+
+    async def handle_publish(self, edition_id: str) -> None:
+        """Run a publish approval in the publish lane."""
+        async with self._lanes.slot(Lane.PUBLISH, edition_id):
+            await self._orchestrator.handle_publish(edition_id)
 
     async def _poll_feed_safely(
         self,
         container: ContainerProxy,
-        token: str | None,
-        handler: Callable[[dict[str, Any]], Awaitable[None]],
+        handler: Callable[[dict[str, Any]], Awaitable[object]],
         name: str,
         consecutive_errors: int,
-    ) -> tuple[str | None, bool]:
-        """Poll a single feed, returning (token, had_error).
+    ) -> _PollOutcome | None:
+        """Poll a single container's leased ranges, returning None on error.
 
         Connectivity errors are logged once; other errors use standard logging.
         """
         try:
-            token = await self.process_feed(container, token, handler)
-            await self._save_token(name, token)
+            return await self._poll_leases(container, handler, name)
         except _CONNECTIVITY_ERRORS:
             if not self._connectivity_warned:
                 logger.warning(
@@ -134,65 +448,79 @@ class ChangeFeedProcessor:
                     "retrying with backoff"
                 )
                 self._connectivity_warned = True
-            return token, True
+            return None
         except Exception as exc:
             if consecutive_errors == 0:
                 logger.exception("Error processing %s change feed", name)
             else:
                 logger.warning("Error processing %s change feed: %s", name, exc)
-            return token, True
-        return token, False
+            return None
 
     async def _poll_loop(self) -> None:
-        """Continuously poll change feeds for links and feedback."""
-        links_container: ContainerProxy = self._database.get_container_client("links")
-        feedback_container: ContainerProxy = self._database.get_container_client(
-            "feedback"
+        """Run an independent poll loop for each change feed container."""
+        handlers = {
+            "links": self._orchestrator.handle_link_change,
+            "feedback": self._orchestrator.handle_feedback_change,
+        }
+        await asyncio.gather(
+            *(self._poll_container(name, handlers[name]) for name in _FEED_CONTAINERS)
         )
 
-        links_token = await self._load_token("links")
-        feedback_token = await self._load_token("feedback")
-
+    async def _poll_container(
+        self,
+        name: str,
+        handler: Callable[[dict[str, Any]], Awaitable[object]],
+    ) -> None:
+        """Poll one container's feed with adaptive cadence and its own backoff."""
+        container: ContainerProxy = self._database.get_container_client(name)
         consecutive_errors = 0
+        idle_delay = self._poll_min
 
         while self._running:
-            links_token, links_err = await self._poll_feed_safely(
-                links_container,
-                links_token,
-                self._orchestrator.handle_link_change,
-                "links",
-                consecutive_errors,
+            outcome = await self._poll_feed_safely(
+                container, handler, name, consecutive_errors
             )
-            feedback_token, feedback_err = await self._poll_feed_safely(
-                feedback_container,
-                feedback_token,
-                self._orchestrator.handle_feedback_change,
-                "feedback",
-                consecutive_errors,
-            )
-
-            if links_err or feedback_err:
+            if outcome is None:
                 consecutive_errors += 1
-                backoff = min(1.0 * (2**consecutive_errors), 30.0)
+                backoff = min(2.0**consecutive_errors, _ERROR_BACKOFF_MAX_SECONDS)
                 await asyncio.sleep(backoff)
-            else:
-                if consecutive_errors > 0:
+                continue
+            if consecutive_errors > 0:
+                if self._connectivity_warned:
                     logger.info(
                         "Cosmos DB connection restored — change feed polling resumed"
                     )
                     self._connectivity_warned = False
                 consecutive_errors = 0
-                await asyncio.sleep(1.0)
+
+            if outcome.saturated:
+                idle_delay = self._poll_min
+                await self._wait_for_capacity(name)
+            elif outcome.items:
+                idle_delay = self._poll_min
+                await asyncio.sleep(idle_delay)
+            else:
+                await asyncio.sleep(idle_delay)
+                idle_delay = min(idle_delay * 2, self._poll_max)
+
+    async def _wait_for_capacity(self, container_name: str) -> None:
+        """Wait until a container's window has room, or the idle ceiling passes."""
+        while self._running and self._room(container_name) <= 0:
+            self._capacity.clear()
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._capacity.wait(), self._poll_max)
+        await asyncio.sleep(0)
 
     async def _safe_handle(
         self,
-        handler: Callable[[dict[str, Any]], Awaitable[None]],
+        handler: Callable[[dict[str, Any]], Awaitable[object]],
         item: dict[str, Any],
         item_id: str,
+        lane: Lane,
     ) -> None:
-        """Run a handler in a background task with error logging."""
+        """Run a handler in its lane in a background task with error logging."""
         try:
-            async with self._handler_semaphore:
+            async with self._lanes.slot(lane, item.get("edition_id")):
                 await handler(item)
         except Exception:
             logger.exception("Failed to process change feed item %s", item_id)
@@ -201,36 +529,97 @@ class ChangeFeedProcessor:
         self,
         container: ContainerProxy,
         continuation_token: str | None,
-        handler: Callable[[dict[str, Any]], Awaitable[None]],
+        handler: Callable[[dict[str, Any]], Awaitable[object]],
+        *,
+        feed_range: dict[str, Any] | None = None,
+        start_time: datetime | None = None,
+        cursor: RangeCursor | None = None,
     ) -> str | None:
         """Read a batch of changes from a container's change feed.
 
-        Processes them sequentially.
+        Without a continuation token the read is scoped to ``feed_range`` and
+        starts at ``start_time`` (or now); the token already encodes both.
+        Paging stops once the in-flight window is full, and dispatched items
+        are tracked on ``cursor`` so its committed position trails completion.
+        Returns the token to resume reading from.
         """
-        query_kwargs: dict[str, Any] = {"max_item_count": 100}
+        cursor = cursor or RangeCursor(continuation_token)
+        page_size = min(_MAX_PAGE_SIZE, self._room(container.id))
+        if page_size <= 0:
+            return continuation_token
+        query_kwargs: dict[str, Any] = {"max_item_count": page_size}
         if continuation_token:
             query_kwargs["continuation"] = continuation_token
+        else:
+            if feed_range is not None:
+                query_kwargs["feed_range"] = feed_range
+            if start_time is not None:
+                query_kwargs["start_time"] = start_time
 
         response = container.query_items_change_feed(**query_kwargs)
         page_iterator = response.by_page()
 
         try:
             async for page in page_iterator:
-                async for item in page:
-                    item_id = item.get("id", "unknown")
+                tracked = cursor.open_page()
+                items = [item async for item in page]
+                self._cancel_withdrawn(container.id, items)
+                for item in self._filter.select(container.id, items):
+                    self._dispatch(handler, item, container.id, cursor, tracked)
+                count = len(items)
+                cursor.close_page(tracked, page_iterator.continuation_token)  # type: ignore[union-attr]
+                cursor.last_read += count
+                cursor.saturated = count >= page_size
+                if self._room(container.id) < page_size:
+                    cursor.saturated = True
                     logger.debug(
-                        "Change feed dispatching item=%s container=%s",
-                        item_id,
+                        "Change feed window full container=%s in_flight=%d",
                         container.id,
+                        self._feed_in_flight.get(container.id, 0),
                     )
-                    task = asyncio.create_task(
-                        self._safe_handle(handler, item, item_id)
-                    )
-                    self._handler_tasks.add(task)
-                    task.add_done_callback(self._handler_tasks.discard)
+                    break
         except ServiceResponseError as exc:
             if "Expected HTTP/" in str(exc):
-                return continuation_token
+                return cursor.read_token
             raise
 
-        return page_iterator.continuation_token or continuation_token  # type: ignore[union-attr]
+        return cursor.read_token
+
+    def _cancel_withdrawn(self, container_id: str, items: list[dict[str, Any]]) -> None:
+        """Cancel in-flight pipelines for links a page shows were withdrawn."""
+        for item_id, reason in self._filter.withdrawn(container_id, items):
+            self._orchestrator.cancel_link(item_id, reason)
+
+    def _dispatch(
+        self,
+        handler: Callable[[dict[str, Any]], Awaitable[object]],
+        item: dict[str, Any],
+        container_id: str,
+        cursor: RangeCursor,
+        page: _Page,
+    ) -> None:
+        """Start a handler task for an item and track it against its page."""
+        item_id = item.get("id", "unknown")
+        logger.debug(
+            "Change feed dispatching item=%s container=%s", item_id, container_id
+        )
+        page.pending += 1
+        lane = _FEED_LANES.get(container_id, Lane.LINK)
+        task = asyncio.create_task(self._safe_handle(handler, item, item_id, lane))
+        self._handler_tasks.add(task)
+        self._feed_in_flight[container_id] = (
+            self._feed_in_flight.get(container_id, 0) + 1
+        )
+
+        def _done(finished: asyncio.Task) -> None:
+            self._handler_tasks.discard(finished)
+            self._feed_in_flight[container_id] -= 1
+            self._capacity.set()
+            if not finished.cancelled():
+                cursor.item_done(page)
+                if self._checkpoints:
+                    self._checkpoints.item_completed()
+                    if self._checkpoints.due:
+                        self._flush_wakeup.set()
+
+        task.add_done_callback(_done)
@@ -0,0 +1,129 @@
+"""Write-behind checkpointing of change feed continuation tokens.
+
+Range positions are recorded in memory on every poll but only written to
+their lease documents when a token has changed and either the flush interval
+has elapsed or enough items have completed since the last flush. The
+processor checks for a due flush on a timer of its own, so a poll loop
+stalled on back-pressure does not hold checkpoints back. ``flush`` is also
+called synchronously when the processor stops.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+import weakref
+from typing import TYPE_CHECKING
+
+from opentelemetry import metrics
+from opentelemetry.metrics import Observation
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from opentelemetry.metrics import CallbackOptions
+
+    from curate_worker.pipeline.leases import Lease, LeaseManager
+
+logger = logging.getLogger(__name__)
+
+_meter = metrics.get_meter(__name__)
+_managers: weakref.WeakSet[CheckpointManager] = weakref.WeakSet()
+
+
+def _observe_age(_options: CallbackOptions) -> Iterable[Observation]:
+    """Report the oldest checkpoint age across the live checkpoint managers."""
+    ages = [
+        age
+        for manager in list(_managers)
+        if (age := manager.last_checkpoint_age) is not None
+    ]
+    return [Observation(max(ages))] if ages else []
+
+
+_meter.create_observable_gauge(
+    "curate.change_feed.checkpoint_age",
+    callbacks=[_observe_age],
+    unit="s",
+    description="Seconds since a change feed checkpoint was last written.",
+)
+
+
+class CheckpointManager:
+    """Buffers per-range continuation tokens and writes them in batches."""
+
+    def __init__(
+        self,
+        leases: LeaseManager,
+        *,
+        interval: float,
+        max_items: int,
+    ) -> None:
+        """Initialize with the lease manager and flush thresholds."""
+        self._leases = leases
+        self._interval = interval
+        self._max_items = max_items
+        self._pending: dict[str, tuple[Lease, str]] = {}
+        self._written: dict[str, str | None] = {}
+        self._items_since_flush = 0
+        self._last_flush = time.monotonic()
+        self._last_checkpoint_at: float | None = None
+        _managers.add(self)
+
+    @property
+    def last_checkpoint_age(self) -> float | None:
+        """Return seconds since the last checkpoint write, or None if none yet."""
+        if self._last_checkpoint_at is None:
+            return None
+        return time.monotonic() - self._last_checkpoint_at
+
+    def record(self, lease: Lease, token: str | None) -> None:
+        """Note a range's committed position; buffered until the next flush."""
+        if not token:
+            return
+        if self._written.setdefault(lease.id, lease.continuation) == token:
+            self._pending.pop(lease.id, None)
+            return
+        self._pending[lease.id] = (lease, token)
+
+    def item_completed(self) -> None:
+        """Count a finished handler towards the item-count flush threshold."""
+        self._items_since_flush += 1
+
+    def forget(self, lease_id: str) -> None:
+        """Drop buffered state for a lease this worker no longer holds."""
+        self._pending.pop(lease_id, None)
+        self._written.pop(lease_id, None)
+
+    @property
+    def due(self) -> bool:
+        """Return True once the interval has elapsed or the item threshold is met."""
+        return (
+            time.monotonic() - self._last_flush >= self._interval
+            or self._items_since_flush >= self._max_items
+        )
+
+    async def maybe_flush(self) -> set[str]:
+        """Flush when the interval has elapsed or the item threshold is reached."""
+        return await self.flush() if self.due else set()
+
+    async def flush(self) -> set[str]:
+        """Write every changed token now, returning ids of leases found lost."""
+        pending, self._pending = self._pending, {}
+        self._items_since_flush = 0
+        self._last_flush = time.monotonic()
+        lost: set[str] = set()
+        for lease_id, (lease, token) in pending.items():
+            if await self._leases.checkpoint(lease, token):
+                self._written[lease_id] = token
+                self._last_checkpoint_at = time.monotonic()
+            else:
+                lost.add(lease_id)
+                self._written.pop(lease_id, None)
+        if pending:
+            logger.debug(
+                "Change feed checkpoints flushed — written=%d lost=%d",
+                len(pending) - len(lost),
+                len(lost),
+            )
+        return lost
@@ -0,0 +1,165 @@
+"""Link claim heartbeats and the sweeper that requeues abandoned claims.
+
+A worker keeps its claim on a link alive by renewing it every third of the
+claim TTL while the pipeline runs. If the worker dies the heartbeats stop, and
+the sweeper on any live worker releases the claim once the TTL passes,
+returning the link to ``submitted`` so the change feed hands it on. The same
+sweep fails the agent runs a dead worker left RUNNING once its worker
+heartbeat has expired, which may be well after the peers that outlived it
+started up.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+from typing import TYPE_CHECKING, Self
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from types import TracebackType
+
+    from curate_common.database.repositories.agent_runs import AgentRunRepository
+    from curate_common.database.repositories.links import LinkRepository
+    from curate_worker.pipeline.heartbeat import WorkerHeartbeat
+
+logger = logging.getLogger(__name__)
+
+
+class ClaimHeartbeat:
+    """Renews one link's processing claim in the background.
+
+    ``on_lost`` is called once if a renewal finds the claim gone, so the
+    pipeline holding it can stop.
+    """
+
+    def __init__(
+        self,
+        links_repo: LinkRepository,
+        link_id: str,
+        owner_id: str,
+        *,
+        interval: float,
+        on_lost: Callable[[], object] | None = None,
+    ) -> None:
+        """Initialize with the claimed link, its owner, and the renewal interval."""
+        self._links_repo = links_repo
+        self._link_id = link_id
+        self._owner_id = owner_id
+        self._interval = interval
+        self._on_lost = on_lost
+        self._stopped = asyncio.Event()
+        self._task: asyncio.Task | None = None
+        self.lost = False
+
+    async def __aenter__(self) -> Self:
+        """Start renewing the claim."""
+        self._task = asyncio.create_task(self._beat())
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        """Stop renewing the claim."""
+        self._stopped.set()
+        if self._task:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+
+    async def _beat(self) -> None:
+        while not self._stopped.is_set():
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._stopped.wait(), self._interval)
+                return
+            try:
+                renewed = await self._links_repo.renew_claim(
+                    self._link_id, self._owner_id
+                )
+            except Exception:  # noqa: BLE001
+                logger.warning(
+                    "Claim heartbeat failed for link %s", self._link_id, exc_info=True
+                )
+                continue
+            if not renewed:
+                self.lost = True
+                logger.warning(
+                    "Claim on link %s lost — owner=%s", self._link_id, self._owner_id
+                )
+                if self._on_lost:
+                    self._on_lost()
+                return
+
+
+class ClaimSweeper:
+    """Periodically requeues lapsed link claims and fails orphaned runs.
+
+    Runs are only recovered when ``runs_repo`` and ``heartbeat`` are given;
+    runs owned by a worker whose heartbeat is still live are left alone.
+    """
+
+    def __init__(
+        self,
+        links_repo: LinkRepository,
+        *,
+        interval: float,
+        runs_repo: AgentRunRepository | None = None,
+        heartbeat: WorkerHeartbeat | None = None,
+    ) -> None:
+        """Initialize with the repositories, the heartbeat, and the interval."""
+        self._links_repo = links_repo
+        self._runs_repo = runs_repo
+        self._heartbeat = heartbeat
+        self._interval = interval
+        self._stopped = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        """Start sweeping in a background task."""
+        self._stopped.clear()
+        self._task = asyncio.create_task(self._loop())
+
+    async def stop(self) -> None:
+        """Stop sweeping."""
+        self._stopped.set()
+        if self._task:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    async def sweep(self) -> int:
+        """Requeue abandoned claims once, returning how many were released."""
+        requeued = await self._links_repo.requeue_expired_claims()
+        if requeued:
+            logger.info("Requeued %d links with expired claims", requeued)
+        return requeued
+
+    async def recover_runs(self) -> int:
+        """Fail runs left RUNNING by stopped workers, returning how many."""
+        if self._runs_repo is None or self._heartbeat is None:
+            return 0
+        recovered = await self._runs_repo.recover_orphaned_runs(
+            live_workers=await self._heartbeat.live_workers()
+        )
+        if recovered:
+            logger.info("Recovered %d orphaned agent runs", recovered)
+        return recovered
+
+    async def _loop(self) -> None:
+        while not self._stopped.is_set():
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._stopped.wait(), self._interval)
+                return
+            try:
+                await self.sweep()
+            except Exception:  # noqa: BLE001
+                logger.warning("Claim sweep failed", exc_info=True)
+            try:
+                await self.recover_runs()
+            except Exception:  # noqa: BLE001
+                logger.warning("Orphaned run recovery failed", exc_info=True)
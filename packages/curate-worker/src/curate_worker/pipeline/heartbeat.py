@@ -0,0 +1,101 @@
+"""Worker liveness heartbeats for replica-aware recovery.
+
+Every worker keeps a ``worker-heartbeat-*`` document in the ``metadata``
+container, renewed every third of its TTL. Agent runs record the id of the
+worker that started them, so orphaned-run recovery only fails runs whose
+worker has stopped renewing its heartbeat.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import time
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING
+
+from azure.cosmos.exceptions import CosmosHttpResponseError
+
+if TYPE_CHECKING:
+    from azure.cosmos.aio import ContainerProxy
+
+logger = logging.getLogger(__name__)
+
+_HEARTBEAT_PREFIX = "worker-heartbeat-"
+_DEFAULT_HEARTBEAT_TTL = 60.0
+
+
+class WorkerHeartbeat:
+    """Publishes this worker's liveness and lists the live workers."""
+
+    def __init__(
+        self,
+        metadata: ContainerProxy,
+        owner_id: str,
+        *,
+        ttl: float = _DEFAULT_HEARTBEAT_TTL,
+    ) -> None:
+        """Initialize with the metadata container and this worker's id."""
+        self._metadata = metadata
+        self._owner_id = owner_id
+        self._ttl = ttl
+        self._stopped = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+    @property
+    def document_id(self) -> str:
+        """Return the id of this worker's heartbeat document."""
+        return f"{_HEARTBEAT_PREFIX}{self._owner_id}"
+
+    async def beat(self) -> None:
+        """Write this worker's heartbeat now."""
+        await self._metadata.upsert_item(
+            body={
+                "id": self.document_id,
+                "type": "worker",
+                "owner": self._owner_id,
+                "heartbeat_at": datetime.now(UTC).isoformat(),
+                "expires_at": time.time() + self._ttl,
+            }
+        )
+
+    async def live_workers(self) -> set[str]:
+        """Return the ids of workers whose heartbeat has not expired."""
+        return {
+            item["owner"]
+            async for item in self._metadata.query_items(
+                "SELECT c.owner FROM c WHERE c.type = 'worker' AND c.expires_at > @now",
+                parameters=[{"name": "@now", "value": time.time()}],
+            )
+        }
+
+    def start(self) -> None:
+        """Start renewing the heartbeat in a background task."""
+        self._stopped.clear()
+        self._task = asyncio.create_task(self._loop())
+
+    async def stop(self) -> None:
+        """Stop renewing and remove the heartbeat so peers see the exit at once."""
+        self._stopped.set()
+        if self._task:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        try:
+            await self._metadata.delete_item(
+                self.document_id, partition_key=self.document_id
+            )
+        except CosmosHttpResponseError:
+            logger.debug("Worker heartbeat %s already removed", self.document_id)
+
+    async def _loop(self) -> None:
+        while not self._stopped.is_set():
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._stopped.wait(), self._ttl / 3)
+                return
+            try:
+                await self.beat()
+            except Exception:  # noqa: BLE001
+                logger.warning("Worker heartbeat failed", exc_info=True)
@@ -0,0 +1,109 @@
+"""Priority lanes for pipeline work.
+
+Each workload class runs in its own concurrency pool, so a bulk link import
+can never occupy the slots that editor feedback and publishing rely on. Within
+a lane, waiting work is granted slots round-robin across editions, so one
+large edition cannot starve the others.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+from collections import OrderedDict, deque
+from enum import StrEnum
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Mapping
+
+logger = logging.getLogger(__name__)
+
+
+class Lane(StrEnum):
+    """Workload classes with separate concurrency pools."""
+
+    FEEDBACK = "feedback"
+    LINK = "link"
+    PUBLISH = "publish"
+
+
+class _LanePool:
+    """A counting semaphore that wakes waiters round-robin by edition."""
+
+    def __init__(self, lane: Lane, limit: int) -> None:
+        self.lane = lane
+        self.limit = max(limit, 1)
+        self.active = 0
+        self._waiting: OrderedDict[str, deque[asyncio.Future[None]]] = OrderedDict()
+
+    @property
+    def waiting(self) -> int:
+        return sum(len(queue) for queue in self._waiting.values())
+
+    async def acquire(self, edition_id: str) -> None:
+        if self.active < self.limit and not self._waiting:
+            self.active += 1
+            return
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._waiting.setdefault(edition_id, deque()).append(future)
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # The slot was granted as the waiter was cancelled — hand it on.
+                self.release()
+            else:
+                self._discard(edition_id, future)
+            raise
+
+    def release(self) -> None:
+        self.active -= 1
+        self._wake()
+
+    def _wake(self) -> None:
+        while self.active < self.limit and self._waiting:
+            edition_id, queue = self._waiting.popitem(last=False)
+            future = queue.popleft()
+            if queue:
+                # Rotate the edition to the back so others are served first.
+                self._waiting[edition_id] = queue
+            if not future.done():
+                self.active += 1
+                future.set_result(None)
+
+    def _discard(self, edition_id: str, future: asyncio.Future[None]) -> None:
+        queue = self._waiting.get(edition_id)
+        if queue is None:
+            return
+        with contextlib.suppress(ValueError):
+            queue.remove(future)
+        if not queue:
+            del self._waiting[edition_id]
+
+
+class LaneScheduler:
+    """Grants pipeline work a slot in its lane's concurrency pool."""
+
+    def __init__(self, limits: Mapping[Lane, int]) -> None:
+        """Initialize with the number of concurrent slots per lane."""
+        self._pools = {lane: _LanePool(lane, limits[lane]) for lane in Lane}
+
+    def active(self, lane: Lane) -> int:
+        """Return the number of slots in use for a lane."""
+        return self._pools[lane].active
+
+    def waiting(self, lane: Lane) -> int:
+        """Return the number of tasks queued for a lane."""
+        return self._pools[lane].waiting
+
+    @contextlib.asynccontextmanager
+    async def slot(self, lane: Lane, edition_id: str | None) -> AsyncIterator[None]:
+        """Hold a slot in ``lane`` for the body, queueing fairly by edition."""
+        pool = self._pools[lane]
+        await pool.acquire(edition_id or "")
+        try:
+            yield
+        finally:
+            pool.release()
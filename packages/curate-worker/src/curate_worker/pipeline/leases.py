@@ -0,0 +1,295 @@
+"""Feed-range leases for partition-parallel change feed consumption.
+
+Each container's change feed is split into feed ranges. Every range has a
+lease document in the ``metadata`` container recording its owner, expiry, and
+continuation token. Worker processes acquire and renew leases with ``_etag``
+optimistic concurrency and aim for an even share of ranges across all live
+owners, so adding or removing replicas rebalances the work.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import math
+import os
+import socket
+import time
+import uuid
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any, cast
+
+from azure.core import MatchConditions
+from azure.cosmos.exceptions import CosmosHttpResponseError
+
+if TYPE_CHECKING:
+    from azure.cosmos.aio import ContainerProxy
+
+logger = logging.getLogger(__name__)
+
+_HTTP_NOT_FOUND = 404
+_HTTP_CONFLICT = 409
+_HTTP_PRECONDITION_FAILED = 412
+_LEASE_PREFIX = "change-feed-lease-"
+_LEGACY_TOKEN_PREFIX = "change-feed-token-"  # noqa: S105
+_DEFAULT_LEASE_TTL = 30.0
+
+
+def new_owner_id() -> str:
+    """Return a unique identifier for this worker process."""
+    return f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:8]}"
+
+
+@dataclass
+class Lease:
+    """A feed-range lease as stored in the metadata container."""
+
+    id: str
+    container: str
+    feed_range: dict[str, Any]
+    owner: str | None = None
+    expires_at: float = 0.0
+    continuation: str | None = None
+    start_time: str | None = None
+    etag: str | None = None
+
+    @classmethod
+    def from_document(cls, doc: dict[str, Any]) -> Lease:
+        """Build a lease from its metadata document."""
+        return cls(
+            id=doc["id"],
+            container=doc["container"],
+            feed_range=doc["feed_range"],
+            owner=doc.get("owner"),
+            expires_at=float(doc.get("expires_at") or 0.0),
+            continuation=doc.get("continuation"),
+            start_time=doc.get("start_time"),
+            etag=doc.get("_etag"),
+        )
+
+    def to_document(self) -> dict[str, Any]:
+        """Return the metadata document body for this lease."""
+        return {
+            "id": self.id,
+            "type": "lease",
+            "container": self.container,
+            "feed_range": self.feed_range,
+            "owner": self.owner,
+            "expires_at": self.expires_at,
+            "continuation": self.continuation,
+            "start_time": self.start_time,
+        }
+
+    def refresh(self, other: Lease) -> Lease:
+        """Copy the stored state of ``other`` into this lease and return it."""
+        self.owner = other.owner
+        self.expires_at = other.expires_at
+        self.continuation = other.continuation
+        self.start_time = other.start_time
+        self.etag = other.etag
+        return self
+
+    def is_live(self, now: float) -> bool:
+        """Return True when the lease is held by an owner that is still renewing."""
+        return bool(self.owner) and self.expires_at > now
+
+
+def lease_id(container_name: str, feed_range: dict[str, Any]) -> str:
+    """Return the deterministic lease document id for a feed range."""
+    digest = hashlib.sha256(
+        json.dumps(feed_range, sort_keys=True).encode()
+    ).hexdigest()[:16]
+    return f"{_LEASE_PREFIX}{container_name}-{digest}"
+
+
+class LeaseManager:
+    """Acquires, renews, and checkpoints feed-range leases for one worker.
+
+    ``owned`` is called on every poll, and on a timer independent of polling
+    so leases stay renewed while dispatch is stalled on back-pressure; it
+    re-synchronises with the metadata container at most once per renewal
+    interval (a third of the lease TTL).
+    A sync renews held leases, takes expired or unowned ones up to this
+    worker's fair share, and steals at most one lease per sync from an owner
+    holding more than its share.
+    """
+
+    def __init__(
+        self,
+        metadata: ContainerProxy,
+        owner_id: str,
+        *,
+        ttl: float = _DEFAULT_LEASE_TTL,
+    ) -> None:
+        """Initialize with the metadata container and this worker's owner id."""
+        self._metadata = metadata
+        self._owner_id = owner_id
+        self._ttl = ttl
+        self._owned: dict[str, list[Lease]] = {}
+        self._synced_at: dict[str, float] = {}
+        self._sync_locks: dict[str, asyncio.Lock] = {}
+
+    @property
+    def owner_id(self) -> str:
+        """Return this worker's owner id."""
+        return self._owner_id
+
+    @property
+    def renew_interval(self) -> float:
+        """Return how often held leases are renewed."""
+        return self._ttl / 3
+
+    async def owned(self, container: ContainerProxy, name: str) -> list[Lease]:
+        """Return the leases this worker holds for a container, syncing if due."""
+        async with self._sync_locks.setdefault(name, asyncio.Lock()):
+            now = time.monotonic()
+            if now - self._synced_at.get(name, float("-inf")) >= self.renew_interval:
+                self._owned[name] = await self._sync(container, name)
+                self._synced_at[name] = now
+        return list(self._owned.get(name, []))
+
+    async def checkpoint(self, lease: Lease, continuation: str | None) -> bool:
+        """Persist a range's continuation token, renewing the lease.
+
+        Returns False when the lease was taken by another worker; the caller
+        must stop processing that range.
+        """
+        if lease.owner != self._owner_id:
+            self._drop(lease)
+            return False
+        if continuation:
+            lease.continuation = continuation
+        if not await self._write(lease, owner=self._owner_id):
+            self._drop(lease)
+            return False
+        return True
+
+    async def release_all(self) -> None:
+        """Release every held lease so other workers can take over immediately."""
+        for leases in self._owned.values():
+            for lease in leases:
+                await self._write(lease, owner=None)
+        self._owned.clear()
+        self._synced_at.clear()
+
+    async def _sync(self, container: ContainerProxy, name: str) -> list[Lease]:
+        """Reconcile lease documents with the container's current feed ranges."""
+        # Refresh held leases in place so callers keep a single object per range.
+        held = {lease.id: lease for lease in self._owned.get(name, [])}
+        leases = []
+        async for feed_range in container.read_feed_ranges():
+            stored = await self._load_or_create(name, feed_range)
+            current = held.get(stored.id)
+            leases.append(current.refresh(stored) if current else stored)
+        now = time.time()
+        owners = {lease.owner for lease in leases if lease.is_live(now)}
+        owners.add(self._owner_id)
+        target = math.ceil(len(leases) / len(owners))
+
+        mine = [
+            lease
+            for lease in leases
+            if lease.owner == self._owner_id
+            and lease.is_live(now)
+            and await self._write(lease, owner=self._owner_id)
+        ]
+
+        for lease in leases:
+            if len(mine) >= target:
+                break
+            if not lease.is_live(now) and await self._write(
+                lease, owner=self._owner_id
+            ):
+                logger.info("Acquired lease %s for %s", lease.id, name)
+                mine.append(lease)
+
+        if len(mine) < target:
+            victim = self._pick_steal(leases, target, now)
+            if victim and await self._write(victim, owner=self._owner_id):
+                logger.info("Stole lease %s for %s to rebalance", victim.id, name)
+                mine.append(victim)
+
+        return mine
+
+    def _pick_steal(self, leases: list[Lease], target: int, now: float) -> Lease | None:
+        """Return a lease from the most over-allocated live owner, if any."""
+        by_owner: dict[str, list[Lease]] = {}
+        for lease in leases:
+            if lease.is_live(now) and lease.owner and lease.owner != self._owner_id:
+                by_owner.setdefault(lease.owner, []).append(lease)
+        busiest: list[Lease] = []
+        for held in by_owner.values():
+            if len(held) > len(busiest):
+                busiest = held
+        return busiest[0] if len(busiest) > target else None
+
+    async def _load_or_create(self, name: str, feed_range: dict[str, Any]) -> Lease:
+        """Read a range's lease document, creating it on first sight."""
+        doc_id = lease_id(name, feed_range)
+        while True:
+            try:
+                doc = await self._metadata.read_item(doc_id, partition_key=doc_id)
+                return Lease.from_document(cast("dict[str, Any]", doc))
+            except CosmosHttpResponseError as exc:
+                if exc.status_code != _HTTP_NOT_FOUND:
+                    raise
+            lease = Lease(
+                id=doc_id,
+                container=name,
+                feed_range=feed_range,
+                start_time=await self._legacy_start_time(name),
+            )
+            try:
+                doc = await self._metadata.create_item(body=lease.to_document())
+            except CosmosHttpResponseError as exc:
+                # Another worker created the lease first — read theirs.
+                if exc.status_code != _HTTP_CONFLICT:
+                    raise
+                continue
+            return Lease.from_document(cast("dict[str, Any]", doc))
+
+    async def _legacy_start_time(self, name: str) -> str | None:
+        """Return when the single-token checkpoint was last written, if any.
+
+        New leases resume from that time so upgrading from the per-container
+        token does not skip changes made while the worker was down.
+        """
+        doc_id = f"{_LEGACY_TOKEN_PREFIX}{name}"
+        try:
+            doc = await self._metadata.read_item(doc_id, partition_key=doc_id)
+        except CosmosHttpResponseError as exc:
+            if exc.status_code != _HTTP_NOT_FOUND:
+                raise
+            return None
+        ts = cast("dict[str, Any]", doc).get("_ts")
+        return datetime.fromtimestamp(ts, UTC).isoformat() if ts else None
+
+    async def _write(self, lease: Lease, *, owner: str | None) -> bool:
+        """Write a lease with ``_etag`` concurrency, returning False on conflict."""
+        body = lease.to_document()
+        body["owner"] = owner
+        body["expires_at"] = time.time() + self._ttl if owner else 0.0
+        try:
+            doc = await self._metadata.replace_item(
+                item=lease.id,
+                body=body,
+                etag=lease.etag,
+                match_condition=MatchConditions.IfNotModified,
+            )
+        except CosmosHttpResponseError as exc:
+            if exc.status_code in {_HTTP_PRECONDITION_FAILED, _HTTP_NOT_FOUND}:
+                logger.info("Lost lease %s to another worker", lease.id)
+                return False
+            raise
+        lease.owner = owner
+        lease.expires_at = body["expires_at"]
+        lease.etag = cast("dict[str, Any]", doc).get("_etag")
+        return True
+
+    def _drop(self, lease: Lease) -> None:
+        """Forget a lease that another worker now holds."""
+        held = self._owned.get(lease.container, [])
+        self._owned[lease.container] = [item for item in held if item.id != lease.id]
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import logging
 import time
 from datetime import UTC, datetime
@@ -10,18 +11,24 @@ from typing import TYPE_CHECKING, Any
 
 from agent_framework import Agent
 
-from curate_common.models.agent_run import AgentRunStatus
+from curate_common.config import PipelineConfig
+from curate_common.database.telemetry import track_request_charges
+from curate_common.models.agent_run import AgentRunStatus, AgentStage
 from curate_common.models.link import LinkStatus
+from curate_worker.agents.deadlines import PipelineDeadline, StageDeadline
 from curate_worker.agents.draft import DraftAgent
 from curate_worker.agents.edit import EditAgent
 from curate_worker.agents.fetch import FetchAgent
+from curate_worker.agents.fused_review import FusedReviewAgent
 from curate_worker.agents.middleware import (
     TokenTrackingMiddleware,
     ToolLoggingMiddleware,
 )
-from curate_worker.agents.prompts import load_prompt
+from curate_worker.agents.prompts import load_prompt, prompt_version
 from curate_worker.agents.publish import PublishAgent
 from curate_worker.agents.review import ReviewAgent
+from curate_worker.pipeline.claims import ClaimHeartbeat
+from curate_worker.pipeline.leases import new_owner_id
 from curate_worker.pipeline.rendering import render_link_row
 from curate_worker.pipeline.runs import RunManager
 from curate_worker.pipeline.tools import OrchestratorToolsMixin, feedback_ctx
@@ -37,6 +44,7 @@ if TYPE_CHECKING:
     from curate_common.database.repositories.links import LinkRepository
     from curate_common.database.repositories.revisions import RevisionRepository
     from curate_common.events import EventPublisher
+    from curate_common.models.agent_run import AgentRun
     from curate_common.models.edition import Edition
     from curate_common.models.link import Link
 
@@ -46,6 +54,16 @@ _MAX_STAGE_RETRIES = 3
 _RETRY_BASE_DELAY = 2.0
 
 
+def _has_cached_review(link: Link) -> bool:
+    """Return True when a link carries a review from the current review prompt."""
+    return bool(
+        link.content
+        and link.review
+        and link.review.get("prompt_version")
+        in {prompt_version("review"), prompt_version("fused_review")}
+    )
+
+
 class PipelineOrchestrator(OrchestratorToolsMixin):
     """An Agent that coordinates the editorial pipeline via sub-agent tools."""
 
@@ -61,6 +79,8 @@ class PipelineOrchestrator(OrchestratorToolsMixin):
         upload_fn: Callable[[str, str], Awaitable[None]] | None = None,
         context_providers: list | None = None,
         revisions_repo: RevisionRepository | None = None,
+        pipeline_config: PipelineConfig | None = None,
+        owner_id: str | None = None,
     ) -> None:
         """Initialize the orchestrator with LLM client and all repositories."""
         self._client = client
@@ -70,14 +90,27 @@ class PipelineOrchestrator(OrchestratorToolsMixin):
         self._agent_runs_repo = agent_runs_repo
 
         self._events = event_publisher
-        self._runs = RunManager(agent_runs_repo, self._events)
+        self._owner_id = owner_id or new_owner_id()
+        self._runs = RunManager(agent_runs_repo, self._events, self._owner_id)
         self._last_stage_usage = None
+        config = pipeline_config or PipelineConfig()
+        self._tool_result_max_chars = config.tool_result_max_chars
+        self._claim_ttl = config.claim_ttl_seconds
+        self._stage_timeout = config.stage_timeout_seconds
+        self._run_timeout = config.run_timeout_seconds
 
         self._edition_locks: dict[str, asyncio.Lock] = {}
         self._edition_locks_guard = asyncio.Lock()
+        self._link_tasks: dict[str, asyncio.Task] = {}
+        self._cancel_reasons: dict[str, str] = {}
 
         self.fetch = FetchAgent(client, links_repo)
         self.review = ReviewAgent(client, links_repo)
+        self.fused_review = FusedReviewAgent(
+            client,
+            links_repo,
+            max_tokens=config.fused_review_max_tokens,
+        )
         self.draft = DraftAgent(
             client,
             links_repo,
@@ -131,6 +164,30 @@ class PipelineOrchestrator(OrchestratorToolsMixin):
         """Return the inner Agent framework instance."""
         return self._agent  # ty: ignore[invalid-return-type]
 
+    @property
+    def owner_id(self) -> str:
+        """Return the instance id recorded on this worker's claims."""
+        return self._owner_id
+
+    def cancel_link(self, link_id: str, reason: str) -> bool:
+        """Cancel the pipeline running for a link, if this worker is running one.
+
+        Used when the link is deleted, disassociated, or stopped by an editor,
+        so in-flight stages and their pending LLM calls stop immediately.
+        Returns True when a running pipeline was cancelled.
+        """
+        task = self._link_tasks.get(link_id)
+        if task is None or task.done() or link_id in self._cancel_reasons:
+            return False
+        self._cancel_reasons[link_id] = reason
+        task.cancel()
+        logger.info("Cancelling pipeline for link=%s reason=%s", link_id, reason)
+        return True
+
+    def _deadline(self) -> PipelineDeadline:
+        """Return a deadline for one pipeline run and the stages within it."""
+        return PipelineDeadline(self._run_timeout, stage_timeout=self._stage_timeout)
+
     async def _get_edition_lock(self, edition_id: str) -> asyncio.Lock:
         """Get or create a per-edition lock for serializing feedback processing."""
         async with self._edition_locks_guard:
@@ -148,23 +205,162 @@ class PipelineOrchestrator(OrchestratorToolsMixin):
             )
             return None
 
-        link = await self._links_repo.claim_submitted(link_id)
+        link = await self._links_repo.claim_submitted(link_id, owner_id=self._owner_id)
         if link is None:
             logger.debug("Link %s claim rejected, skipping", link_id)
         return link
 
-    async def handle_link_change(self, document: dict[str, Any]) -> None:
-        """Process a link document change by invoking the orchestrator agent."""
+    async def _try_fused_review(self, link: Link, edition_id: str) -> bool:
+        """Fetch and review a short article in one call, recording a review run.
+
+        Returns True when the link was saved as reviewed. Any failure is logged
+        and the link falls back to the full fetch and review stages, which
+        reuse the page text already extracted here instead of fetching again.
+        """
+        try:
+            extracted = await self.fused_review.extract(link)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning(
+                "Fused review fetch failed for link %s, "
+                "falling back to full pipeline: %s",
+                link.id,
+                exc,
+            )
+            return False
+        if extracted is None:
+            return False
+        self.fetch.remember_page(link.url, *extracted)
+        if not self.fused_review.fits(link, extracted[1]):
+            return False
+        run = await self._runs.create_stage_run(
+            AgentStage.REVIEW,
+            edition_id,
+            link.id,
+            {"stage": "fetch+review", "fused": True},
+        )
+        deadline = StageDeadline(AgentStage.REVIEW)
+        try:
+            async with deadline:
+                response = await self.fused_review.run(link, *extracted)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning(
+                "Fused review failed for link %s, falling back to full pipeline: %s",
+                link.id,
+                exc,
+            )
+            response = None
+            if deadline.expired:
+                run.status = AgentRunStatus.TIMED_OUT
+                run.output = {"error": "Stage deadline exceeded"}
+            else:
+                run.status = AgentRunStatus.FAILED
+                run.output = {"error": str(exc)}
+        else:
+            run.status = AgentRunStatus.COMPLETED
+            run.output = {"fused": response is not None}
+            run.usage = RunManager.normalize_usage(
+                dict(response.usage_details)
+                if response and response.usage_details
+                else None
+            )
+        run.completed_at = datetime.now(UTC)
+        RunManager.attach_request_charge(run)
+        await self._agent_runs_repo.complete(run)
+        await self._runs.publish_run_event(run)
+        return response is not None
+
+    async def handle_link_change(self, document: dict[str, Any]) -> bool:
+        """Process a link document change by invoking the orchestrator agent.
+
+        Returns True when this worker claimed the link and ran its pipeline.
+        """
         link_id = document.get("id", "")
         edition_id = document.get("edition_id")
         status = document.get("status", "")
 
         if not edition_id:
-            return
+            return False
 
         link = await self._claim_link(link_id, status)
         if link is None:
+            return False
+        await self._run_claimed_link(link, edition_id, status)
+        return True
+
+    async def process_claimed_link(self, link: Link) -> bool:
+        """Run the pipeline for a link this worker has already claimed.
+
+        Used by change feed replay, which claims a link in the same write
+        that resubmits it so live workers leave it alone.
+        """
+        if not link.edition_id:
+            return False
+        await self._run_claimed_link(link, link.edition_id, link.status)
+        return True
+
+    async def _run_claimed_link(self, link: Link, edition_id: str, status: str) -> None:
+        """Run a claimed link's pipeline, keeping its claim alive meanwhile."""
+        link_id = link.id
+        task = asyncio.current_task()
+        if task is not None:
+            self._link_tasks[link_id] = task
+        try:
+            async with ClaimHeartbeat(
+                self._links_repo,
+                link_id,
+                self._owner_id,
+                interval=self._claim_ttl / 3,
+                on_lost=functools.partial(self.cancel_link, link_id, "claim lost"),
+            ):
+                await self._process_link_with_deadline(link, edition_id, status)
+            await self._links_repo.clear_claim(link_id, self._owner_id)
+        except asyncio.CancelledError:
+            reason = self._cancel_reasons.get(link_id)
+            # Only a cancellation requested through cancel_link is absorbed;
+            # shutdown cancels the task again and the link is handed off.
+            if reason is None or (task is not None and task.uncancel() > 0):
+                await self._hand_off_link(link_id, edition_id)
+                raise
+            await self._abandon_link(link_id, edition_id, reason)
+        finally:
+            self.fetch.forget_page(link.url)
+            self._link_tasks.pop(link_id, None)
+            self._cancel_reasons.pop(link_id, None)
+
+    @track_request_charges("pipeline.link")
+    async def _process_link_with_deadline(
+        self, link: Link, edition_id: str, status: str
+    ) -> None:
+        """Run a claimed link's pipeline, failing it if the deadline passes."""
+        deadline = self._deadline()
+        try:
+            async with deadline:
+                await self._process_link(link, edition_id, status)
+        except TimeoutError:
+            if not deadline.expired:
+                raise
+            await self._expire_link(link.id, edition_id, deadline.timeout)
             return
+        if deadline.expired_stages:
+            await self._close_open_runs(
+                link.id,
+                edition_id,
+                {"error": "Stage deadline exceeded"},
+                status=AgentRunStatus.TIMED_OUT,
+            )
+
+    async def _process_link(self, link: Link, edition_id: str, status: str) -> None:
+        """Run a claimed link through the pipeline via the orchestrator agent."""
+        link_id = link.id
+        if _has_cached_review(link):
+            # Re-associated link: reuse the fetched content and review.
+            if not await self._advance_link(link_id, status, LinkStatus.REVIEWED):
+                logger.info("Link withdrawn before resuming — link=%s", link_id)
+                return
+            status = LinkStatus.REVIEWED
+            logger.info("Reusing cached review for link=%s, resuming at draft", link_id)
+        elif await self._try_fused_review(link, edition_id):
+            status = LinkStatus.REVIEWED
 
         logger.info("Orchestrator processing link=%s status=%s", link_id, status)
         run = await self._runs.create_orchestrator_run(
@@ -223,7 +419,8 @@ class PipelineOrchestrator(OrchestratorToolsMixin):
             }
 
         run.completed_at = datetime.now(UTC)
-        await self._agent_runs_repo.update(run, edition_id)
+        RunManager.attach_request_charge(run)
+        await self._agent_runs_repo.complete(run)
         await self._runs.publish_run_event(run)
         elapsed_ms = (time.monotonic() - t0) * 1000
         logger.info(
@@ -233,18 +430,132 @@ class PipelineOrchestrator(OrchestratorToolsMixin):
             pipeline_run_id,
         )
 
-        updated_link = await self._links_repo.get(link_id, link_id)
-        if updated_link and updated_link.status == status:
-            updated_link.status = LinkStatus.FAILED
-            await self._links_repo.update(updated_link, link_id)
-            runs = await self._agent_runs_repo.get_by_trigger(link_id)
+        # A link the pipeline left where it started is failed, unless an
+        # editor withdrew it in the meantime.
+        updated_link = await self._advance_link(link_id, status, LinkStatus.FAILED)
+        if updated_link:
+            runs = await self._agent_runs_repo.get_by_trigger(link_id, edition_id)
             await self._events.publish(
                 "link-update",
                 render_link_row(updated_link, runs),
             )
 
-    async def handle_feedback_change(self, document: dict[str, Any]) -> None:
-        """Process new feedback by invoking the orchestrator agent."""
+    async def _advance_link(
+        self, link_id: str, current: str, status: LinkStatus
+    ) -> Link | None:
+        """Move a link from ``current`` to ``status`` unless it was withdrawn.
+
+        The write is a conditional patch, so a link that has moved on, been
+        deleted or been stopped is left as it is. Returns the updated link,
+        or None when the condition did not hold.
+        """
+        return await self._links_repo.patch(
+            link_id,
+            link_id,
+            {"status": status},
+            condition=f"FROM c WHERE c.status = '{LinkStatus(current).value}'"
+            " AND NOT IS_DEFINED(c.deleted_at)"
+            " AND NOT IS_DEFINED(c.cancel_requested_at)",
+        )
+
+    async def _hand_off_link(self, link_id: str, edition_id: str) -> None:
+        """Release an interrupted link so another worker can resume it.
+
+        Called when a link pipeline is cancelled, typically by a draining
+        worker. The claim is released durably instead of waiting out its TTL,
+        and any runs left open record the stage the link had reached.
+        """
+        try:
+            stage = await self._links_repo.release_claim(link_id, self._owner_id)
+            await self._close_open_runs(
+                link_id,
+                edition_id,
+                {"error": "Interrupted before completion", "checkpoint_stage": stage},
+            )
+        except Exception:
+            logger.exception("Failed to hand off interrupted link %s", link_id)
+            return
+        logger.info("Handed off interrupted link=%s stage=%s", link_id, stage)
+
+    async def _abandon_link(self, link_id: str, edition_id: str, reason: str) -> None:
+        """Clean up after a pipeline cancelled because its link was withdrawn.
+
+        Unlike a hand-off the link is not resubmitted: its claim is dropped
+        and open runs are closed as failed with the cancellation reason.
+        """
+        try:
+            await self._links_repo.clear_claim(link_id, self._owner_id)
+            await self._close_open_runs(
+                link_id,
+                edition_id,
+                {"error": "Cancelled before completion", "reason": reason},
+            )
+        except Exception:
+            logger.exception("Failed to clean up cancelled link %s", link_id)
+            return
+        logger.info("Cancelled pipeline for link=%s reason=%s", link_id, reason)
+
+    async def _expire_link(
+        self, link_id: str, edition_id: str, timeout_seconds: float
+    ) -> None:
+        """Fail a link whose pipeline ran past its deadline.
+
+        The link is marked failed rather than resubmitted, so a link that
+        always hangs cannot loop; an editor can retry it. Open runs are
+        closed as timed out and the claim is then cleared as usual.
+        """
+        logger.warning(
+            "Pipeline deadline exceeded for link=%s timeout_s=%.0f",
+            link_id,
+            timeout_seconds,
+        )
+        try:
+            link = await self._links_repo.patch(
+                link_id,
+                link_id,
+                {"status": LinkStatus.FAILED},
+                condition="FROM c WHERE NOT IS_DEFINED(c.deleted_at)"
+                f" AND c.status != '{LinkStatus.DRAFTED.value}'",
+            ) or await self._links_repo.get(link_id, link_id)
+            await self._close_open_runs(
+                link_id,
+                edition_id,
+                {
+                    "error": "Pipeline deadline exceeded",
+                    "timeout_seconds": timeout_seconds,
+                },
+                status=AgentRunStatus.TIMED_OUT,
+            )
+            if link:
+                runs = await self._agent_runs_repo.get_by_trigger(link_id, edition_id)
+                await self._events.publish("link-update", render_link_row(link, runs))
+        except Exception:
+            logger.exception("Failed to record timeout for link %s", link_id)
+
+    async def _close_open_runs(
+        self,
+        trigger_id: str,
+        edition_id: str,
+        output: dict[str, Any],
+        *,
+        status: AgentRunStatus = AgentRunStatus.FAILED,
+    ) -> None:
+        """Close a trigger's still-running agent runs with ``status``."""
+        for run in await self._agent_runs_repo.get_by_trigger(trigger_id, edition_id):
+            if run.status != AgentRunStatus.RUNNING:
+                continue
+            run.status = status
+            run.output = output
+            run.completed_at = datetime.now(UTC)
+            await self._agent_runs_repo.complete(run)
+            await self._runs.publish_run_event(run)
+
+    @track_request_charges("pipeline.feedback")
+    async def handle_feedback_change(self, document: dict[str, Any]) -> bool:
+        """Process new feedback by invoking the orchestrator agent.
+
+        Returns False without doing anything when the feedback is resolved.
+        """
         edition_id = document.get("edition_id", "")
         feedback_id = document.get("id", "")
         learn_from_feedback = document.get("learn_from_feedback", True)
@@ -252,7 +563,7 @@ class PipelineOrchestrator(OrchestratorToolsMixin):
         comment = document.get("comment", "")
 
         if document.get("resolved", False):
-            return
+            return False
 
         edition_lock = await self._get_edition_lock(edition_id)
         async with edition_lock:
@@ -275,6 +586,7 @@ class PipelineOrchestrator(OrchestratorToolsMixin):
                     "comment": comment,
                 }
             )
+            deadline = self._deadline()
             try:
                 message = (
                     f"Editor feedback has been submitted and needs processing.\n"
@@ -288,7 +600,8 @@ class PipelineOrchestrator(OrchestratorToolsMixin):
                 session = self._agent.create_session()
                 if not learn_from_feedback:
                     session.state["skip_memory_capture"] = True
-                response = await self._agent.run(message, session=session)
+                async with deadline:
+                    response = await self._agent.run(message, session=session)
                 run.status = AgentRunStatus.COMPLETED
                 run.output = {"content": response.text if response else None}
                 run.usage = RunManager.normalize_usage(
@@ -302,12 +615,12 @@ class PipelineOrchestrator(OrchestratorToolsMixin):
                     feedback_id,
                     pipeline_run_id,
                 )
-                run.status = AgentRunStatus.FAILED
-                run.output = {"error": "Orchestrator failed"}
+                self._mark_failed(run, deadline)
             finally:
                 feedback_ctx.reset(ctx_token)
                 run.completed_at = datetime.now(UTC)
-                await self._agent_runs_repo.update(run, edition_id)
+                RunManager.attach_request_charge(run)
+                await self._agent_runs_repo.complete(run)
                 await self._runs.publish_run_event(run)
                 elapsed_ms = (time.monotonic() - t0) * 1000
                 logger.info(
@@ -317,7 +630,10 @@ class PipelineOrchestrator(OrchestratorToolsMixin):
                     elapsed_ms,
                     pipeline_run_id,
                 )
+            await self._close_timed_out_runs(feedback_id, edition_id, deadline)
+        return True
 
+    @track_request_charges("pipeline.publish")
     async def handle_publish(self, edition_id: str) -> None:
         """Process a publish approval by invoking the orchestrator agent."""
         logger.info("Orchestrator processing publish for edition=%s", edition_id)
@@ -326,13 +642,15 @@ class PipelineOrchestrator(OrchestratorToolsMixin):
         )
         pipeline_run_id = run.id
         t0 = time.monotonic()
+        deadline = self._deadline()
         try:
             message = (
                 f"The editor has approved this edition for publishing.\n"
                 f"Edition ID: {edition_id}\n"
                 f"Run the publish stage to render and upload it."
             )
-            response = await self._agent.run(message)
+            async with deadline:
+                response = await self._agent.run(message)
             run.status = AgentRunStatus.COMPLETED
             run.output = {"content": response.text if response else None}
             run.usage = RunManager.normalize_usage(
@@ -346,11 +664,11 @@ class PipelineOrchestrator(OrchestratorToolsMixin):
                 edition_id,
                 pipeline_run_id,
             )
-            run.status = AgentRunStatus.FAILED
-            run.output = {"error": "Orchestrator failed"}
+            self._mark_failed(run, deadline)
         finally:
             run.completed_at = datetime.now(UTC)
-            await self._agent_runs_repo.update(run, edition_id)
+            RunManager.attach_request_charge(run)
+            await self._agent_runs_repo.complete(run)
             await self._runs.publish_run_event(run)
             elapsed_ms = (time.monotonic() - t0) * 1000
             logger.info(
@@ -360,3 +678,33 @@ class PipelineOrchestrator(OrchestratorToolsMixin):
                 elapsed_ms,
                 pipeline_run_id,
             )
+        await self._close_timed_out_runs(edition_id, edition_id, deadline)
+
+    @staticmethod
+    def _mark_failed(run: AgentRun, deadline: PipelineDeadline) -> None:
+        """Record a failed orchestrator run, distinguishing a passed deadline."""
+        if deadline.expired:
+            run.status = AgentRunStatus.TIMED_OUT
+            run.output = {
+                "error": "Pipeline deadline exceeded",
+                "timeout_seconds": deadline.timeout,
+            }
+        else:
+            run.status = AgentRunStatus.FAILED
+            run.output = {"error": "Orchestrator failed"}
+
+    async def _close_timed_out_runs(
+        self, trigger_id: str, edition_id: str, deadline: PipelineDeadline
+    ) -> None:
+        """Close stage runs a passed deadline left open as timed out."""
+        if not (deadline.expired or deadline.expired_stages):
+            return
+        try:
+            await self._close_open_runs(
+                trigger_id,
+                edition_id,
+                {"error": "Deadline exceeded"},
+                status=AgentRunStatus.TIMED_OUT,
+            )
+        except Exception:
+            logger.exception("Failed to close timed out runs for %s", trigger_id)
@@ -0,0 +1,167 @@
+"""In-memory prefilter for change feed items.
+
+Every write the worker makes re-emits the document on the change feed. The
+prefilter drops items that no handler would act on before a task is created
+for them: documents in non-actionable states, versions already dispatched
+(by ``_lsn``), versions this worker wrote itself (by ``_etag``), and links
+another worker holds an unexpired claim on, which ``claim_submitted`` would
+reject anyway. Several versions of the same document within a page are
+coalesced to the latest.
+
+Link changes that withdraw a link from processing — a soft delete, a
+disassociation, or an editor stopping it — are reported separately so the
+pipeline still working on the link can be cancelled.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections import OrderedDict
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from curate_common.database.repositories.links import is_active_claim
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_CAPACITY = 10_000
+_DEFAULT_CLAIM_TTL = timedelta(seconds=60)
+
+
+def _is_actionable(container_name: str, item: dict[str, Any]) -> bool:
+    """Return True when the orchestrator handler for a container would act."""
+    if item.get("deleted_at") is not None:
+        return False
+    if container_name == "links":
+        return item.get("status") == "submitted" and bool(item.get("edition_id"))
+    if container_name == "feedback":
+        return not item.get("resolved", False)
+    return True
+
+
+def withdrawal_reason(container_name: str, item: dict[str, Any]) -> str | None:
+    """Return why a change withdraws a link from processing, if it does."""
+    if container_name != "links":
+        return None
+    if item.get("deleted_at") is not None:
+        return "deleted"
+    if not item.get("edition_id"):
+        return "disassociated"
+    if item.get("cancel_requested_at") and item.get("status") == "failed":
+        return "cancelled"
+    return None
+
+
+class _BoundedMap[K, V]:
+    """Insertion-ordered map that evicts its oldest entries past a capacity."""
+
+    def __init__(self, capacity: int) -> None:
+        self._capacity = capacity
+        self._items: OrderedDict[K, V] = OrderedDict()
+
+    def get(self, key: K) -> V | None:
+        return self._items.get(key)
+
+    def put(self, key: K, value: V) -> None:
+        self._items[key] = value
+        self._items.move_to_end(key)
+        while len(self._items) > self._capacity:
+            self._items.popitem(last=False)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._items
+
+
+class ChangeFilter:
+    """Selects the change feed items worth dispatching to a handler."""
+
+    def __init__(
+        self,
+        capacity: int = _DEFAULT_CAPACITY,
+        *,
+        owner_id: str | None = None,
+        claim_ttl: timedelta = _DEFAULT_CLAIM_TTL,
+    ) -> None:
+        """Initialize with the number of ids and writes to remember.
+
+        ``owner_id`` is this worker's claim owner; links claimed by anyone
+        else within ``claim_ttl`` are dropped.
+        """
+        self._owner_id = owner_id
+        self._claim_ttl = claim_ttl
+        self._own_writes: _BoundedMap[tuple[str, str, str], None] = _BoundedMap(
+            capacity
+        )
+        self._seen_lsn: _BoundedMap[tuple[str, str], int] = _BoundedMap(capacity)
+        self.dropped = 0
+
+    def record_write(self, container_name: str, document: dict[str, Any]) -> None:
+        """Remember a document version written by this worker.
+
+        Registered as a repository write listener so the echo of the write on
+        the change feed can be recognised and skipped.
+        """
+        item_id = document.get("id")
+        etag = document.get("_etag")
+        if isinstance(item_id, str) and isinstance(etag, str):
+            self._own_writes.put((container_name, item_id, etag), None)
+
+    def select(
+        self, container_name: str, items: list[dict[str, Any]]
+    ) -> list[dict[str, Any]]:
+        """Return the items from one page that should be dispatched."""
+        latest: dict[str, dict[str, Any]] = {}
+        for item in items:
+            latest[item.get("id", "")] = item
+        selected = [
+            item for item in latest.values() if self._accept(container_name, item)
+        ]
+        dropped = len(items) - len(selected)
+        if dropped:
+            self.dropped += dropped
+            logger.debug(
+                "Change feed prefilter dropped %d of %d items container=%s",
+                dropped,
+                len(items),
+                container_name,
+            )
+        return selected
+
+    def withdrawn(
+        self, container_name: str, items: list[dict[str, Any]]
+    ) -> list[tuple[str, str]]:
+        """Return ``(id, reason)`` for each item in a page withdrawn from processing."""
+        latest: dict[str, dict[str, Any]] = {}
+        for item in items:
+            latest[item.get("id", "")] = item
+        withdrawn = []
+        for item_id, item in latest.items():
+            reason = withdrawal_reason(container_name, item)
+            if reason is not None:
+                withdrawn.append((item_id, reason))
+        return withdrawn
+
+    def _accept(self, container_name: str, item: dict[str, Any]) -> bool:
+        item_id = item.get("id", "")
+        if (container_name, item_id, item.get("_etag")) in self._own_writes:
+            return False
+        lsn = item.get("_lsn")
+        if isinstance(lsn, int):
+            seen = self._seen_lsn.get((container_name, item_id))
+            if seen is not None and lsn <= seen:
+                return False
+            self._seen_lsn.put((container_name, item_id), lsn)
+        if container_name == "links" and self._claimed_elsewhere(item):
+            return False
+        return _is_actionable(container_name, item)
+
+    def _claimed_elsewhere(self, item: dict[str, Any]) -> bool:
+        """Return True when another worker holds an unexpired claim on a link."""
+        owner = item.get("processing_owner")
+        if not owner or owner == self._owner_id:
+            return False
+        return is_active_claim(
+            item.get("processing_claimed_at"),
+            now=datetime.now(UTC),
+            ttl=self._claim_ttl,
+        )
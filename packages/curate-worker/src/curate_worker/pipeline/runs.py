@@ -5,6 +5,7 @@ from __future__ import annotations
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING
 
+from curate_common.database.telemetry import current_request_charge
 from curate_common.models.agent_run import AgentRun, AgentStage
 
 if TYPE_CHECKING:
@@ -19,21 +20,32 @@ class RunManager:
         self,
         agent_runs_repo: AgentRunRepository,
         events: EventPublisher,
+        worker_id: str | None = None,
     ) -> None:
-        """Initialize with repository and event publisher."""
+        """Initialize with repository, event publisher, and this worker's id."""
         self._agent_runs_repo = agent_runs_repo
         self._events = events
+        self._worker_id = worker_id
 
     async def create_orchestrator_run(
         self, edition_id: str, trigger_id: str, input_data: dict
     ) -> AgentRun:
         """Create an agent run record for the orchestrator itself."""
+        return await self.create_stage_run(
+            AgentStage.ORCHESTRATOR, edition_id, trigger_id, input_data
+        )
+
+    async def create_stage_run(
+        self, stage: AgentStage, edition_id: str, trigger_id: str, input_data: dict
+    ) -> AgentRun:
+        """Create an agent run record for a stage and publish its start event."""
         run = AgentRun(
-            stage=AgentStage.ORCHESTRATOR,
+            stage=stage,
             edition_id=edition_id,
             trigger_id=trigger_id,
             input=input_data,
             started_at=datetime.now(UTC),
+            worker_id=self._worker_id,
         )
         await self._agent_runs_repo.create(run)
         await self._events.publish(
@@ -67,6 +79,18 @@ class RunManager:
             },
         )
 
+    @staticmethod
+    def attach_request_charge(run: AgentRun) -> None:
+        """Add the RU consumed in the current charge-tracking scope to usage."""
+        charge = current_request_charge()
+        if charge is None or not charge.operations:
+            return
+        run.usage = {
+            **(run.usage or {}),
+            "request_charge": round(charge.request_charge, 2),
+            "db_operations": charge.operations,
+        }
+
     @staticmethod
     def normalize_usage(usage: dict | None) -> dict | None:
         """Normalize framework usage_details to a consistent schema."""
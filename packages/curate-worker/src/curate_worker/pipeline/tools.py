@@ -4,16 +4,20 @@ from __future__ import annotations
 
 import contextvars
 import json
+import logging
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Annotated, Any
 
 from agent_framework import tool
 
 from curate_common.models.agent_run import AgentRun, AgentRunStatus, AgentStage
+from curate_worker.agents.deadlines import StageDeadline
 from curate_worker.pipeline.rendering import render_link_row
 from curate_worker.pipeline.runs import RunManager
 
 if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
     from curate_common.database.repositories.agent_runs import AgentRunRepository
     from curate_common.database.repositories.editions import EditionRepository
     from curate_common.database.repositories.links import LinkRepository
@@ -24,6 +28,13 @@ if TYPE_CHECKING:
     from curate_worker.agents.publish import PublishAgent
     from curate_worker.agents.review import ReviewAgent
 
+logger = logging.getLogger(__name__)
+
+_COMPLETION_STATUSES = {
+    "completed": AgentRunStatus.COMPLETED,
+    "timed_out": AgentRunStatus.TIMED_OUT,
+}
+
 # Carries feedback metadata from handle_feedback_change to _edit_tool so the
 # memory provider on the edit agent can access the skip flag and original
 # feedback content.  ContextVar is per-asyncio-task, so concurrent edition
@@ -33,6 +44,26 @@ feedback_ctx: contextvars.ContextVar[dict[str, Any] | None] = contextvars.Contex
 )
 
 
+def compact_tool_result(text: str, max_chars: int) -> str:
+    """Return a compact status payload for a sub-agent's response text.
+
+    Sub-agents persist their work to Cosmos DB, so the orchestrator only needs
+    to know that a stage finished and roughly what it reported. Returning the
+    full text would grow the orchestrator conversation with every stage. A
+    ``max_chars`` of zero or less passes the full text through unchanged.
+    """
+    if max_chars <= 0:
+        return text
+    summary = " ".join(text.split())
+    truncated = len(summary) > max_chars
+    if truncated:
+        summary = summary[: max_chars - 1].rstrip() + "…"
+    payload: dict[str, Any] = {"status": "completed", "summary": summary}
+    if truncated:
+        payload["truncated"] = True
+    return json.dumps(payload)
+
+
 class OrchestratorToolsMixin:
     """Mixin providing @tool-decorated methods for the orchestrator agent."""
 
@@ -41,6 +72,8 @@ class OrchestratorToolsMixin:
     _agent_runs_repo: AgentRunRepository
     _events: EventPublisher
     _last_stage_usage: dict | None
+    _tool_result_max_chars: int
+    _owner_id: str
 
     fetch: FetchAgent
     review: ReviewAgent
@@ -49,13 +82,42 @@ class OrchestratorToolsMixin:
     publish: PublishAgent
 
     def _capture_usage(self, response: object) -> str:
-        """Extract token usage from a sub-agent response and return its text."""
+        """Extract token usage from a sub-agent response and return its result.
+
+        The result is a compact status payload unless tool result compaction
+        is disabled, keeping the orchestrator's context flat across stages.
+        """
         usage_details = getattr(response, "usage_details", None) if response else None
         self._last_stage_usage = RunManager.normalize_usage(
             dict(usage_details) if usage_details else None
         )
         text = getattr(response, "text", None)
-        return text or ""
+        return compact_tool_result(text or "", self._tool_result_max_chars)
+
+    async def _run_stage(
+        self, stage: AgentStage, call: Callable[[], Awaitable[object]]
+    ) -> str:
+        """Run a sub-agent within its stage deadline and return the tool result.
+
+        A stage that times out is cancelled, including its pending LLM call,
+        and reported to the orchestrator as ``timed_out``.
+        """
+        deadline = StageDeadline(stage)
+        try:
+            async with deadline:
+                response = await call()
+        except TimeoutError:
+            if not deadline.expired:
+                raise
+            logger.warning("Stage %s exceeded its deadline, cancelled", stage)
+            self._last_stage_usage = None
+            return json.dumps(
+                {
+                    "status": "timed_out",
+                    "summary": f"The {stage} stage exceeded its deadline.",
+                }
+            )
+        return self._capture_usage(response)
 
     @tool(name="fetch")
     async def _fetch_tool(
@@ -63,8 +125,9 @@ class OrchestratorToolsMixin:
         task: Annotated[str, "Instructions including the URL, link ID, and edition ID"],
     ) -> str:
         """Fetch and extract content from a submitted URL."""
-        response = await self.fetch.agent.run(task)
-        return self._capture_usage(response)
+        return await self._run_stage(
+            AgentStage.FETCH, lambda: self.fetch.agent.run(task)
+        )
 
     @tool(name="review")
     async def _review_tool(
@@ -72,8 +135,9 @@ class OrchestratorToolsMixin:
         task: Annotated[str, "Instructions including the link ID and edition ID"],
     ) -> str:
         """Evaluate relevance, extract insights, categorize content."""
-        response = await self.review.agent.run(task)
-        return self._capture_usage(response)
+        return await self._run_stage(
+            AgentStage.REVIEW, lambda: self.review.agent.run(task)
+        )
 
     @tool(name="draft")
     async def _draft_tool(
@@ -81,8 +145,9 @@ class OrchestratorToolsMixin:
         task: Annotated[str, "Instructions including the link ID and edition ID"],
     ) -> str:
         """Compose newsletter content from reviewed material."""
-        response = await self.draft.run_guardrailed(task)
-        return self._capture_usage(response)
+        return await self._run_stage(
+            AgentStage.DRAFT, lambda: self.draft.run_guardrailed(task)
+        )
 
     @tool(name="edit")
     async def _edit_tool(
@@ -102,8 +167,9 @@ class OrchestratorToolsMixin:
                     f"\nSection: {ctx['section']}"
                     f"\nComment: {ctx['comment']}"
                 )
-        response = await self.edit.agent.run(task, session=session)
-        return self._capture_usage(response)
+        return await self._run_stage(
+            AgentStage.EDIT, lambda: self.edit.agent.run(task, session=session)
+        )
 
     @tool(name="publish")
     async def _publish_tool(
@@ -111,8 +177,9 @@ class OrchestratorToolsMixin:
         task: Annotated[str, "Instructions including the edition ID"],
     ) -> str:
         """Render HTML and upload to storage."""
-        response = await self.publish.agent.run(task)
-        return self._capture_usage(response)
+        return await self._run_stage(
+            AgentStage.PUBLISH, lambda: self.publish.agent.run(task)
+        )
 
     @tool
     async def get_link_status(
@@ -168,6 +235,7 @@ class OrchestratorToolsMixin:
             trigger_id=trigger_id,
             input={"stage": stage},
             started_at=datetime.now(UTC),
+            worker_id=self._owner_id,
         )
         await self._agent_runs_repo.create(run)
         await self._events.publish(
@@ -189,7 +257,7 @@ class OrchestratorToolsMixin:
         run_id: Annotated[str, "The run ID returned by record_stage_start"],
         trigger_id: Annotated[str, "ID of the document that triggered this run"],
         edition_id: Annotated[str, "ID of the edition this run belongs to"],
-        status: Annotated[str, "Completion status: completed or failed"],
+        status: Annotated[str, "Completion status: completed, failed, or timed_out"],
         error: Annotated[str, "Error message if failed, empty if completed"] = "",
         input_tokens: Annotated[int, "Input tokens consumed by this stage"] = 0,
         output_tokens: Annotated[int, "Output tokens consumed by this stage"] = 0,
@@ -199,9 +267,7 @@ class OrchestratorToolsMixin:
         run = await self._agent_runs_repo.get(run_id, edition_id)
         if not run:
             return json.dumps({"error": "Run not found"})
-        run.status = (
-            AgentRunStatus.COMPLETED if status == "completed" else AgentRunStatus.FAILED
-        )
+        run.status = _COMPLETION_STATUSES.get(status, AgentRunStatus.FAILED)
         run.completed_at = datetime.now(UTC)
         if error:
             run.output = {"error": error}
@@ -214,7 +280,7 @@ class OrchestratorToolsMixin:
         elif self._last_stage_usage:
             run.usage = self._last_stage_usage
         self._last_stage_usage = None
-        await self._agent_runs_repo.update(run, edition_id)
+        await self._agent_runs_repo.complete(run)
         await self._events.publish(
             "agent-run-complete",
             {
@@ -234,7 +300,7 @@ class OrchestratorToolsMixin:
 
         link = await self._links_repo.get(trigger_id, trigger_id)
         if link:
-            runs = await self._agent_runs_repo.get_by_trigger(trigger_id)
+            runs = await self._agent_runs_repo.get_by_trigger(trigger_id, edition_id)
             await self._events.publish("link-update", render_link_row(link, runs))
 
         return json.dumps(
@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 import logging
+from datetime import timedelta
 from typing import TYPE_CHECKING
 
+from curate_common.config import PipelineConfig
 from curate_common.database.client import CosmosClient
 from curate_common.database.repositories.agent_runs import AgentRunRepository
 from curate_common.database.repositories.feedback import FeedbackRepository
@@ -15,6 +17,9 @@ from curate_common.storage.renderer import StaticSiteRenderer
 from curate_worker.agents.llm import create_chat_client
 from curate_worker.agents.memory import FoundryMemoryProvider
 from curate_worker.pipeline.change_feed import ChangeFeedProcessor
+from curate_worker.pipeline.claims import ClaimSweeper
+from curate_worker.pipeline.heartbeat import WorkerHeartbeat
+from curate_worker.pipeline.leases import new_owner_id
 from curate_worker.pipeline.orchestrator import PipelineOrchestrator
 
 if TYPE_CHECKING:
@@ -115,34 +120,112 @@ async def init_memory(settings: Settings) -> list | None:
         return None
 
 
-async def init_pipeline(
+def create_orchestrator(  # noqa: PLR0913
     chat_client: BaseChatClient,
     cosmos: CosmosClient,
     editions_repo: EditionRepository,
     event_publisher: EventPublisher,
+    *,
+    links_repo: LinkRepository,
+    feedback_repo: FeedbackRepository,
+    owner_id: str,
     render_fn: Callable[..., Awaitable] | None = None,
     upload_fn: Callable[..., Awaitable] | None = None,
     context_providers: list | None = None,
-) -> ChangeFeedProcessor:
-    """Create the orchestrator, recover orphaned runs, and start the change feed."""
-    orchestrator = PipelineOrchestrator(
+    pipeline_config: PipelineConfig | None = None,
+) -> PipelineOrchestrator:
+    """Create the pipeline orchestrator for a worker instance."""
+    return PipelineOrchestrator(
         client=chat_client,
-        links_repo=LinkRepository(cosmos.database),
+        links_repo=links_repo,
         editions_repo=editions_repo,
-        feedback_repo=FeedbackRepository(cosmos.database),
+        feedback_repo=feedback_repo,
         agent_runs_repo=AgentRunRepository(cosmos.database),
         event_publisher=event_publisher,
         render_fn=render_fn,
         upload_fn=upload_fn,
         context_providers=context_providers,
         revisions_repo=RevisionRepository(cosmos.database),
+        pipeline_config=pipeline_config,
+        owner_id=owner_id,
     )
 
-    agent_runs_repo = AgentRunRepository(cosmos.database)
-    recovered = await agent_runs_repo.recover_orphaned_runs()
-    if recovered:
-        logger.info("Recovered %d orphaned agent runs from prior crash", recovered)
 
-    processor = ChangeFeedProcessor(cosmos.database, orchestrator)
+def create_links_repo(
+    cosmos: CosmosClient, pipeline_config: PipelineConfig | None = None
+) -> LinkRepository:
+    """Create the links repository with the configured claim TTL."""
+    config = pipeline_config or PipelineConfig()
+    return LinkRepository(
+        cosmos.database, claim_ttl=timedelta(seconds=config.claim_ttl_seconds)
+    )
+
+
+def create_heartbeat(
+    cosmos: CosmosClient, owner_id: str, pipeline_config: PipelineConfig | None = None
+) -> WorkerHeartbeat:
+    """Create the liveness heartbeat for a worker instance."""
+    config = pipeline_config or PipelineConfig()
+    return WorkerHeartbeat(
+        cosmos.database.get_container_client("metadata"),
+        owner_id,
+        ttl=config.worker_heartbeat_ttl_seconds,
+    )
+
+
+async def init_pipeline(
+    chat_client: BaseChatClient,
+    cosmos: CosmosClient,
+    editions_repo: EditionRepository,
+    event_publisher: EventPublisher,
+    render_fn: Callable[..., Awaitable] | None = None,
+    upload_fn: Callable[..., Awaitable] | None = None,
+    context_providers: list | None = None,
+    pipeline_config: PipelineConfig | None = None,
+) -> ChangeFeedProcessor:
+    """Create the orchestrator, recover orphaned runs, and start the change feed."""
+    config = pipeline_config or PipelineConfig()
+    owner_id = new_owner_id()
+    links_repo = create_links_repo(cosmos, config)
+    feedback_repo = FeedbackRepository(cosmos.database)
+    orchestrator = create_orchestrator(
+        chat_client,
+        cosmos,
+        editions_repo,
+        event_publisher,
+        links_repo=links_repo,
+        feedback_repo=feedback_repo,
+        owner_id=owner_id,
+        render_fn=render_fn,
+        upload_fn=upload_fn,
+        context_providers=context_providers,
+        pipeline_config=pipeline_config,
+    )
+
+    heartbeat = create_heartbeat(cosmos, owner_id, config)
+    await heartbeat.beat()
+    # Peers that died moments ago still look live here; the sweeper recovers
+    # their runs once their heartbeats expire.
+    claim_sweeper = ClaimSweeper(
+        links_repo,
+        interval=config.claim_ttl_seconds / 2,
+        runs_repo=AgentRunRepository(cosmos.database),
+        heartbeat=heartbeat,
+    )
+    recovered = await claim_sweeper.recover_runs()
+    if recovered:
+        logger.info("Recovered %d orphaned agent runs from stopped workers", recovered)
+
+    processor = ChangeFeedProcessor(
+        cosmos.database,
+        orchestrator,
+        owner_id=owner_id,
+        config=pipeline_config,
+        claim_sweeper=claim_sweeper,
+        heartbeat=heartbeat,
+    )
+    # Let the prefilter recognise the worker's own writes on the change feed.
+    links_repo.add_write_listener(processor.change_filter.record_write)
+    feedback_repo.add_write_listener(processor.change_filter.record_write)
     await processor.start()
     return processor
@@ -6,9 +6,11 @@ from unittest.mock import AsyncMock, MagicMock
 import pytest
 
 from curate_common.database.repositories.agent_runs import AgentRunRepository
+from curate_common.database.repositories.base import BulkResult
 from curate_common.models.agent_run import AgentRun, AgentRunStatus, AgentStage
 
 _EXPECTED_TRIGGER_COUNT = 2
+_ORPHAN_COUNT = 2
 
 
 class TestAgentRunRepository:
@@ -32,16 +34,36 @@ class TestAgentRunRepository:
         )
         repo.query = AsyncMock(return_value=[run])
 
-        result = await repo.get_by_trigger("link-1")
+        result = await repo.get_by_trigger("link-1", "ed-1")
 
         assert len(result) == 1
         assert result[0].trigger_id == "link-1"
 
+    async def test_complete_patches_outcome_while_running(
+        self, repo: AgentRunRepository
+    ) -> None:
+        """Verify complete writes only the outcome, guarded on running status."""
+        run = AgentRun(
+            stage=AgentStage.FETCH,
+            edition_id="ed-1",
+            trigger_id="link-1",
+            status=AgentRunStatus.COMPLETED,
+            output={"ok": True},
+        )
+        repo.patch = AsyncMock(return_value=run)
+
+        assert await repo.complete(run) is run
+
+        item_id, partition_key, changes = repo.patch.call_args.args
+        assert (item_id, partition_key) == (run.id, "ed-1")
+        assert set(changes) == {"status", "completed_at", "output"}
+        assert '"running"' in repo.patch.call_args.kwargs["condition"]
+
     async def test_get_by_stage(self, repo: AgentRunRepository) -> None:
         """Verify get by stage."""
         repo.query = AsyncMock(return_value=[])
 
-        result = await repo.get_by_stage("link-1", AgentStage.REVIEW)
+        result = await repo.get_by_stage("link-1", AgentStage.REVIEW, "ed-1")
 
         assert result == []
         call_args = repo.query.call_args
@@ -49,7 +71,7 @@ class TestAgentRunRepository:
 
     async def test_get_by_triggers_empty_list(self, repo: AgentRunRepository) -> None:
         """Verify get by triggers empty list."""
-        result = await repo.get_by_triggers([])
+        result = await repo.get_by_triggers([], "ed-1")
 
         assert result == []
 
@@ -73,7 +95,7 @@ class TestAgentRunRepository:
         )
         repo.query = AsyncMock(return_value=[run1, run2])
 
-        result = await repo.get_by_triggers(["link-1", "link-2"])
+        result = await repo.get_by_triggers(["link-1", "link-2"], "ed-1")
 
         assert len(result) == _EXPECTED_TRIGGER_COUNT
         assert result[0].trigger_id == "link-2"
@@ -104,21 +126,40 @@ class TestAgentRunRepository:
         assert "@stage" in call_args[0][0]
 
     async def test_recover_orphaned_runs(self, repo: AgentRunRepository) -> None:
-        """Verify recover_orphaned_runs transitions RUNNING runs to FAILED."""
-        orphan = AgentRun(
-            id="run-orphan",
-            stage=AgentStage.FETCH,
-            edition_id="ed-1",
-            trigger_id="link-1",
-            status=AgentRunStatus.RUNNING,
-        )
-        repo.query = AsyncMock(return_value=[orphan])
-        repo.update = AsyncMock()
+        """Verify recover_orphaned_runs bulk-fails RUNNING runs still running."""
+        repo.bulk_patch = AsyncMock(return_value=BulkResult(succeeded=_ORPHAN_COUNT))
 
         count = await repo.recover_orphaned_runs()
 
-        assert count == 1
-        assert orphan.status == AgentRunStatus.FAILED
-        assert orphan.completed_at is not None
-        assert orphan.output == {"error": "Recovered after process restart"}
-        repo.update.assert_called_once_with(orphan, "ed-1")
+        assert count == _ORPHAN_COUNT
+        where, _params, changes = repo.bulk_patch.call_args.args
+        assert "c.status = @status" in where
+        assert changes["status"] == AgentRunStatus.FAILED
+        assert '"running"' in repo.bulk_patch.call_args.kwargs["condition"]
+
+    async def test_recover_orphaned_runs_spares_live_workers(
+        self, repo: AgentRunRepository
+    ) -> None:
+        """Verify runs owned by live workers are excluded from recovery."""
+        repo.bulk_patch = AsyncMock(return_value=BulkResult())
+
+        count = await repo.recover_orphaned_runs(live_workers={"worker-a"})
+
+        assert count == 0
+        where, params, _changes = repo.bulk_patch.call_args.args
+        assert "ARRAY_CONTAINS(@live_workers, c.worker_id)" in where
+        assert {"name": "@live_workers", "value": ["worker-a"]} in params
+
+    async def test_clear_all_soft_deletes_in_bulk(
+        self, repo: AgentRunRepository
+    ) -> None:
+        """Verify clear_all soft-deletes through one bulk patch."""
+        repo.bulk_patch = AsyncMock(
+            return_value=BulkResult(succeeded=_ORPHAN_COUNT, failed_ids=["run-x"])
+        )
+
+        count = await repo.clear_all()
+
+        assert count == _ORPHAN_COUNT
+        _where, _params, changes = repo.bulk_patch.call_args.args
+        assert set(changes) == {"deleted_at"}
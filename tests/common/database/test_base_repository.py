@@ -1,13 +1,21 @@
 """Tests for BaseRepository with mocked Cosmos DB container."""
 
+import logging
+from collections.abc import AsyncIterator, Awaitable, Callable
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from azure.cosmos.exceptions import CosmosHttpResponseError
 
-from curate_common.database.repositories.base import BaseRepository
-from curate_common.models.link import Link
+from curate_common.database.repositories.base import (
+    BaseRepository,
+    decode_cursor,
+    encode_cursor,
+    projection,
+)
+from curate_common.database.telemetry import track_request_charge
+from curate_common.models.link import Link, LinkStatus, LinkSummary
 
 
 class ConcreteRepo(BaseRepository[Link]):
@@ -72,6 +80,76 @@ async def test_get_returns_none_on_exception(
     assert result is None
 
 
+def _error(
+    status_code: int, retry_after_ms: str | None = None
+) -> CosmosHttpResponseError:
+    exc = CosmosHttpResponseError(status_code=status_code, message="error")
+    if retry_after_ms is not None:
+        exc.headers = {"x-ms-retry-after-ms": retry_after_ms}
+    return exc
+
+
+async def test_get_raises_on_errors_other_than_not_found(
+    repo: ConcreteRepo, mock_container: AsyncMock
+) -> None:
+    """Verify a server error is raised rather than reported as missing."""
+    mock_container.read_item.side_effect = _error(500)
+
+    with pytest.raises(CosmosHttpResponseError):
+        await repo.get("link-1", "link-1")
+
+
+async def test_get_retries_throttled_read_after_retry_after(
+    repo: ConcreteRepo, mock_container: AsyncMock
+) -> None:
+    """Verify a 429 is retried after the delay the service asks for."""
+    mock_container.read_item.side_effect = [
+        _error(429, retry_after_ms="40"),
+        {"id": "link-1", "url": "https://example.com", "edition_id": "ed-1"},
+    ]
+
+    with patch("curate_common.database.repositories.base.asyncio.sleep") as mock_sleep:
+        result = await repo.get("link-1", "link-1")
+
+    assert result is not None
+    mock_sleep.assert_awaited_once_with(0.04)
+
+
+async def test_retry_gives_up_when_budget_is_spent(
+    mock_container: AsyncMock, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Verify throttling past the retry budget raises the last error."""
+    monkeypatch.setenv("APP_REPOSITORY_RETRY_BUDGET_MS", "100")
+    db = MagicMock()
+    db.get_container_client.return_value = mock_container
+    repo = ConcreteRepo(db)
+    mock_container.read_item.side_effect = _error(503, retry_after_ms="500")
+
+    with pytest.raises(CosmosHttpResponseError) as raised:
+        await repo.get("link-1", "link-1")
+
+    assert raised.value.status_code == 503  # noqa: PLR2004
+    mock_container.read_item.assert_awaited_once()
+
+
+async def test_get_records_request_charge(
+    repo: ConcreteRepo, mock_container: AsyncMock
+) -> None:
+    """Verify the read's request charge reaches the enclosing charge scope."""
+
+    async def read_item(**kwargs: Any) -> dict[str, Any]:
+        kwargs["response_hook"]({"x-ms-request-charge": "1.5"}, {})
+        return {"id": "link-1", "url": "https://example.com", "edition_id": "ed-1"}
+
+    mock_container.read_item.side_effect = read_item
+
+    with track_request_charge() as charge:
+        await repo.get("link-1", "link-1")
+
+    assert charge.request_charge == 1.5  # noqa: PLR2004
+    assert charge.operations == 1
+
+
 async def test_get_returns_none_for_soft_deleted(
     repo: ConcreteRepo, mock_container: AsyncMock
 ) -> None:
@@ -101,6 +179,207 @@ async def test_update_sets_updated_at(
     assert "partition_key" not in call_kwargs
 
 
+async def test_update_notifies_write_listeners(
+    repo: ConcreteRepo, mock_container: AsyncMock
+) -> None:
+    """Verify write listeners receive the stored document version."""
+    stored = {"id": "l-1", "_etag": "etag-1"}
+    mock_container.replace_item.return_value = stored
+    listener = MagicMock()
+    repo.add_write_listener(listener)
+
+    await repo.update(Link(id="l-1", url="https://example.com"), "l-1")
+
+    listener.assert_called_once_with("links", stored)
+
+
+async def test_patch_sends_only_changed_fields(
+    repo: ConcreteRepo, mock_container: AsyncMock
+) -> None:
+    """Verify patch compiles changes into set/remove operations."""
+    mock_container.patch_item.return_value = {
+        "id": "link-1",
+        "url": "https://a.com",
+        "status": "drafted",
+        "created_at": "2026-01-01T00:00:00+00:00",
+        "updated_at": "2026-01-02T00:00:00+00:00",
+    }
+
+    result = await repo.patch(
+        "link-1",
+        "link-1",
+        {"status": LinkStatus.DRAFTED, "title": None},
+        condition="FROM c WHERE NOT IS_DEFINED(c.deleted_at)",
+    )
+
+    assert result is not None
+    assert result.status == LinkStatus.DRAFTED
+    kwargs = mock_container.patch_item.call_args.kwargs
+    assert kwargs["filter_predicate"] == "FROM c WHERE NOT IS_DEFINED(c.deleted_at)"
+    operations = {op["path"]: op for op in kwargs["patch_operations"]}
+    assert operations["/status"] == {"op": "set", "path": "/status", "value": "drafted"}
+    assert operations["/title"] == {"op": "remove", "path": "/title"}
+    assert operations["/updated_at"]["op"] == "set"
+
+
+async def test_patch_returns_none_when_condition_fails(
+    repo: ConcreteRepo, mock_container: AsyncMock
+) -> None:
+    """Verify a failed predicate is reported as None, not raised."""
+    mock_container.patch_item.side_effect = CosmosHttpResponseError(
+        status_code=412, message="Precondition failed"
+    )
+
+    result = await repo.patch(
+        "link-1", "link-1", {"status": LinkStatus.DRAFTED}, condition="FROM c WHERE 1=0"
+    )
+
+    assert result is None
+
+
+async def test_patch_rejects_unknown_fields(repo: ConcreteRepo) -> None:
+    """Verify field names are checked against the model."""
+    with pytest.raises(ValueError, match="Unknown Link fields"):
+        await repo.patch("link-1", "link-1", {"stauts": "drafted"})
+
+
+def _rows(
+    rows: list[dict[str, str]],
+) -> Callable[..., AsyncIterator[dict[str, str]]]:
+    async def query_items(**_kwargs: Any) -> AsyncIterator[dict[str, str]]:
+        for row in rows:
+            yield row
+
+    return query_items
+
+
+def _charged(charge: float) -> Callable[..., Awaitable[dict[str, Any]]]:
+    async def write(**kwargs: Any) -> dict[str, Any]:
+        kwargs["response_hook"]({"x-ms-request-charge": str(charge)}, None)
+        return {}
+
+    return write
+
+
+async def test_bulk_patch_batches_by_partition(
+    repo: ConcreteRepo, mock_container: AsyncMock
+) -> None:
+    """Verify items sharing a partition go in one batch and RU is summed."""
+    mock_container.query_items = _rows(
+        [
+            {"id": "link-1", "pk": "p-1"},
+            {"id": "link-2", "pk": "p-1"},
+            {"id": "link-3", "pk": "p-2"},
+        ]
+    )
+    mock_container.execute_item_batch.side_effect = _charged(10.0)
+    mock_container.patch_item.side_effect = _charged(2.5)
+
+    result = await repo.bulk_patch("c.status = 'failed'", [], {"title": "x"})
+
+    assert result.succeeded == 3  # noqa: PLR2004
+    assert result.failed == 0
+    assert result.request_charge == 12.5  # noqa: PLR2004
+    batch = mock_container.execute_item_batch.call_args.kwargs
+    assert batch["partition_key"] == "p-1"
+    assert [op[1][0] for op in batch["batch_operations"]] == ["link-1", "link-2"]
+    assert mock_container.patch_item.call_args.kwargs["item"] == "link-3"
+
+
+async def test_bulk_patch_retries_failed_batch_individually(
+    repo: ConcreteRepo, mock_container: AsyncMock
+) -> None:
+    """Verify one failing document does not fail the rest of its batch."""
+    mock_container.query_items = _rows(
+        [
+            {"id": "link-1", "pk": "p-1"},
+            {"id": "link-2", "pk": "p-1"},
+            {"id": "link-3", "pk": "p-1"},
+        ]
+    )
+    mock_container.execute_item_batch.side_effect = CosmosHttpResponseError(
+        status_code=412, message="Precondition failed"
+    )
+    mock_container.patch_item.side_effect = [
+        {},
+        CosmosHttpResponseError(status_code=412, message="Precondition failed"),
+        CosmosHttpResponseError(status_code=500, message="Internal error"),
+    ]
+
+    result = await repo.bulk_patch(
+        "true", [], {"title": "x"}, condition="FROM c WHERE c.title = 'y'"
+    )
+
+    assert result.succeeded == 1
+    assert result.skipped == 1
+    assert result.failed_ids == ["link-3"]
+    kwargs = mock_container.patch_item.call_args.kwargs
+    assert kwargs["filter_predicate"] == "FROM c WHERE c.title = 'y'"
+
+
+async def test_bulk_patch_condition_misses_are_not_failures(
+    repo: ConcreteRepo,
+    mock_container: AsyncMock,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Verify documents that no longer match the condition are skipped quietly."""
+    mock_container.query_items = _rows([{"id": "link-1", "pk": "p-1"}])
+    mock_container.patch_item.side_effect = CosmosHttpResponseError(
+        status_code=412, message="Precondition failed"
+    )
+
+    with caplog.at_level(logging.DEBUG):
+        result = await repo.bulk_patch(
+            "true", [], {"title": "x"}, condition="FROM c WHERE c.title = 'y'"
+        )
+
+    assert result.skipped == 1
+    assert result.failed == 0
+    assert "Bulk patch failed" not in caplog.text
+    assert "outcome=partial" not in caplog.text
+
+
+class _ThrottledRows:
+    """Query results whose first page fetch is throttled."""
+
+    def __init__(self, rows: list[dict[str, str]]) -> None:
+        self._rows = iter(rows)
+        self._throttled = False
+
+    def __aiter__(self) -> "_ThrottledRows":
+        return self
+
+    async def __anext__(self) -> dict[str, str]:
+        if not self._throttled:
+            self._throttled = True
+            raise _error(429, retry_after_ms="0")
+        try:
+            return next(self._rows)
+        except StopIteration:
+            raise StopAsyncIteration from None
+
+
+async def test_bulk_patch_retries_throttled_query_page(
+    repo: ConcreteRepo, mock_container: AsyncMock
+) -> None:
+    """Verify a throttled query page is fetched again without repeating rows."""
+    mock_container.query_items = MagicMock(
+        return_value=_ThrottledRows(
+            [{"id": "link-1", "pk": "p-1"}, {"id": "link-2", "pk": "p-2"}]
+        )
+    )
+    mock_container.patch_item.side_effect = _charged(1.0)
+
+    with patch(
+        "curate_common.database.repositories.base.record_throttled_retry"
+    ) as record:
+        result = await repo.bulk_patch("c.status = 'failed'", [], {"title": "x"})
+
+    assert result.succeeded == 2  # noqa: PLR2004
+    assert mock_container.patch_item.await_count == 2  # noqa: PLR2004
+    record.assert_called_once_with("links", "bulk_patch", 429)
+
+
 async def test_soft_delete_sets_deleted_at(
     repo: ConcreteRepo, mock_container: AsyncMock
 ) -> None:
@@ -146,6 +425,124 @@ async def test_query_filters_soft_deleted(
     assert results[0].id == "link-1"
 
 
+def test_projection_selects_model_fields() -> None:
+    """Verify projection lists each field, honouring expression overrides."""
+    fields = projection(LinkSummary, title="c.meta.title")
+
+    assert fields.startswith("c.id, c.url, c.meta.title AS title, c.status")
+    assert "c.content" not in fields
+
+
+async def test_query_projection_returns_summary_models(
+    repo: ConcreteRepo, mock_container: AsyncMock
+) -> None:
+    """Verify projection rows validate as the requested model."""
+
+    async def mock_query_items(**_kwargs: Any) -> None:
+        yield {
+            "id": "link-1",
+            "url": "https://a.com",
+            "status": "drafted",
+            "created_at": "2026-01-01T00:00:00+00:00",
+            "updated_at": "2026-01-01T00:00:00+00:00",
+        }
+
+    mock_container.query_items = mock_query_items
+    results = await repo.query_projection(LinkSummary, "SELECT c.id FROM c")
+
+    assert results == [
+        LinkSummary.model_validate(
+            {
+                "id": "link-1",
+                "url": "https://a.com",
+                "status": "drafted",
+                "created_at": "2026-01-01T00:00:00+00:00",
+                "updated_at": "2026-01-01T00:00:00+00:00",
+            }
+        )
+    ]
+
+
+def _summary(item_id: str, created_at: str) -> dict[str, Any]:
+    return {
+        "id": item_id,
+        "url": f"https://{item_id}.com",
+        "created_at": created_at,
+        "updated_at": created_at,
+    }
+
+
+async def test_query_page_returns_keyset_cursor_when_more_rows(
+    repo: ConcreteRepo, mock_container: AsyncMock
+) -> None:
+    """Verify one extra row is read and the cursor encodes the last returned row."""
+    rows = [
+        _summary("link-3", "2026-01-03T00:00:00+00:00"),
+        _summary("link-2", "2026-01-02T00:00:00+00:00"),
+        _summary("link-1", "2026-01-01T00:00:00+00:00"),
+    ]
+    mock_container.query_items = MagicMock(side_effect=_rows(rows))
+
+    page = await repo.query_page(
+        LinkSummary, "SELECT * FROM c WHERE c.x = 1", page_size=2
+    )
+
+    assert [item.id for item in page.items] == ["link-3", "link-2"]
+    assert page.continuation is not None
+    assert decode_cursor(page.continuation) == ("2026-01-02T00:00:00+00:00", "link-2")
+    kwargs = mock_container.query_items.call_args.kwargs
+    assert kwargs["query"] == (
+        "SELECT * FROM c WHERE c.x = 1"
+        " ORDER BY c.created_at DESC, c.id DESC OFFSET 0 LIMIT @page_limit"
+    )
+    assert kwargs["parameters"] == [{"name": "@page_limit", "value": 3}]
+
+
+async def test_query_page_resumes_after_cursor(
+    repo: ConcreteRepo, mock_container: AsyncMock
+) -> None:
+    """Verify a cursor filters to rows after it and the last page has none."""
+    mock_container.query_items = MagicMock(
+        side_effect=_rows([_summary("link-1", "2026-01-01T00:00:00+00:00")])
+    )
+    cursor = encode_cursor("2026-01-02T00:00:00+00:00", "link-2")
+
+    page = await repo.query_page(
+        LinkSummary,
+        "SELECT * FROM c WHERE c.x = 1",
+        order_by="started_at",
+        page_size=2,
+        continuation=cursor,
+    )
+
+    assert [item.id for item in page.items] == ["link-1"]
+    assert page.continuation is None
+    kwargs = mock_container.query_items.call_args.kwargs
+    assert (
+        " AND (c.started_at < @cursor_value"
+        " OR (c.started_at = @cursor_value AND c.id < @cursor_id))"
+        " ORDER BY c.started_at DESC, c.id DESC"
+    ) in kwargs["query"]
+    assert {"name": "@cursor_value", "value": "2026-01-02T00:00:00+00:00"} in kwargs[
+        "parameters"
+    ]
+    assert {"name": "@cursor_id", "value": "link-2"} in kwargs["parameters"]
+
+
+async def test_query_page_ignores_malformed_cursor(
+    repo: ConcreteRepo, mock_container: AsyncMock
+) -> None:
+    """Verify a cursor not made by encode_cursor restarts from the first page."""
+    mock_container.query_items = MagicMock(side_effect=_rows([]))
+
+    page = await repo.query_page(
+        LinkSummary, "SELECT * FROM c WHERE c.x = 1", continuation="not-a-cursor"
+    )
+
+    assert page.items == []
+    assert "@cursor_value" not in mock_container.query_items.call_args.kwargs["query"]
+
+
 async def test_query_logs_warning_when_slow(
     mock_container: AsyncMock, monkeypatch: pytest.MonkeyPatch
 ) -> None:
@@ -1,5 +1,6 @@
 """Tests for the Cosmos DB client."""
 
+from typing import Any
 from unittest.mock import AsyncMock, patch
 
 import pytest
@@ -7,10 +8,25 @@ from azure.core.exceptions import ServiceRequestError
 
 from curate_common.config import CosmosConfig
 from curate_common.database.client import CosmosClient
+from curate_common.database.indexing import INDEXING_POLICIES, policy_matches
 
 _EXPECTED_CONTAINER_COUNT = 6
 
 
+def _database(policies: dict[str, dict[str, Any]]) -> AsyncMock:
+    """Return a database whose containers report the given indexing policies."""
+    mock_db = AsyncMock()
+
+    async def create(*, id: str, **_kwargs: Any) -> AsyncMock:  # noqa: A002
+        container = AsyncMock()
+        container.id = id
+        container.read.return_value = {"indexingPolicy": policies.get(id)}
+        return container
+
+    mock_db.create_container_if_not_exists.side_effect = create
+    return mock_db
+
+
 class TestCosmosClient:
     """Test the Cosmos Client."""
 
@@ -30,7 +46,7 @@ class TestCosmosClient:
         """Verify initialize creates db and containers."""
         with patch("curate_common.database.client.AzureCosmosClient") as mock_azure_cls:
             mock_azure = AsyncMock()
-            mock_db = AsyncMock()
+            mock_db = _database(INDEXING_POLICIES)
             mock_azure.create_database_if_not_exists.return_value = mock_db
             mock_azure_cls.return_value = mock_azure
 
@@ -42,11 +58,46 @@ class TestCosmosClient:
                 == _EXPECTED_CONTAINER_COUNT
             )
 
+    async def test_initialize_applies_declared_indexing_policies(
+        self, client: CosmosClient
+    ) -> None:
+        """Verify containers are created with their policy and left alone."""
+        with patch("curate_common.database.client.AzureCosmosClient") as mock_azure_cls:
+            mock_azure = AsyncMock()
+            mock_db = _database(INDEXING_POLICIES)
+            mock_azure.create_database_if_not_exists.return_value = mock_db
+            mock_azure_cls.return_value = mock_azure
+
+            await client.initialize()
+
+            for call in mock_db.create_container_if_not_exists.call_args_list:
+                name = call.kwargs["id"]
+                assert call.kwargs["indexing_policy"] == INDEXING_POLICIES[name]
+            mock_db.replace_container.assert_not_awaited()
+
+    async def test_initialize_reconciles_drifted_policy(
+        self, client: CosmosClient
+    ) -> None:
+        """Verify a container whose policy drifted has it replaced."""
+        drifted = {**INDEXING_POLICIES, "links": {"indexingMode": "consistent"}}
+        with patch("curate_common.database.client.AzureCosmosClient") as mock_azure_cls:
+            mock_azure = AsyncMock()
+            mock_db = _database(drifted)
+            mock_azure.create_database_if_not_exists.return_value = mock_db
+            mock_azure_cls.return_value = mock_azure
+
+            await client.initialize()
+
+            mock_db.replace_container.assert_awaited_once()
+            call = mock_db.replace_container.call_args
+            assert call.args[0].id == "links"
+            assert call.kwargs["indexing_policy"] == INDEXING_POLICIES["links"]
+
     async def test_close_cleans_up(self, client: CosmosClient) -> None:
         """Verify close cleans up."""
         with patch("curate_common.database.client.AzureCosmosClient") as mock_azure_cls:
             mock_azure = AsyncMock()
-            mock_db = AsyncMock()
+            mock_db = _database(INDEXING_POLICIES)
             mock_azure.create_database_if_not_exists.return_value = mock_db
             mock_azure_cls.return_value = mock_azure
 
@@ -74,7 +125,7 @@ class TestCosmosClient:
         """Verify database property returns after init."""
         with patch("curate_common.database.client.AzureCosmosClient") as mock_azure_cls:
             mock_azure = AsyncMock()
-            mock_db = AsyncMock()
+            mock_db = _database(INDEXING_POLICIES)
             mock_azure.create_database_if_not_exists.return_value = mock_db
             mock_azure_cls.return_value = mock_azure
 
@@ -95,3 +146,32 @@ class TestCosmosClient:
 
             with pytest.raises(ConnectionError, match="Unable to reach Cosmos DB"):
                 await client.initialize()
+
+
+class TestPolicyMatches:
+    """Test indexing policy comparison."""
+
+    def test_ignores_order_and_server_defaults(self) -> None:
+        """Verify path order and the system _etag exclusion do not count."""
+        declared = INDEXING_POLICIES["agent_runs"]
+        current = {
+            "indexingMode": "Consistent",
+            "automatic": True,
+            "includedPaths": list(reversed(declared["includedPaths"])),
+            "excludedPaths": [
+                path
+                for path in reversed(declared["excludedPaths"])
+                if path["path"] != '/"_etag"/?'
+            ],
+            "compositeIndexes": list(reversed(declared["compositeIndexes"])),
+        }
+
+        assert policy_matches(current, declared)
+
+    def test_detects_missing_composite(self) -> None:
+        """Verify a policy without the declared composites does not match."""
+        declared = INDEXING_POLICIES["editions"]
+        current = {**declared, "compositeIndexes": []}
+
+        assert not policy_matches(current, declared)
+        assert not policy_matches(None, declared)
@@ -1,11 +1,13 @@
 """Tests for EditionRepository custom query methods."""
 
+from datetime import UTC, datetime
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from curate_common.database.repositories.base import Page
 from curate_common.database.repositories.editions import EditionRepository
-from curate_common.models.edition import Edition, EditionStatus
+from curate_common.models.edition import Edition, EditionStatus, EditionSummary
 
 _EXPECTED_EDITION_COUNT = 2
 
@@ -43,15 +45,24 @@ class TestEditionRepository:
 
         assert result is None
 
-    async def test_list_all(self, repo: EditionRepository) -> None:
-        """Verify list all."""
-        editions = [Edition(id="ed-1", content={}), Edition(id="ed-2", content={})]
-        repo.query = AsyncMock(return_value=editions)
-
-        result = await repo.list_all()
-
-        assert len(result) == _EXPECTED_EDITION_COUNT
-        repo.query.assert_called_once()
+    async def test_list_page(self, repo: EditionRepository) -> None:
+        """Verify list page projects summaries without edition content."""
+        now = datetime.now(UTC)
+        editions = [
+            EditionSummary(id="ed-1", created_at=now, updated_at=now),
+            EditionSummary(id="ed-2", created_at=now, updated_at=now),
+        ]
+        repo.query_page = AsyncMock(return_value=Page(editions, "next"))
+
+        result = await repo.list_page()
+
+        assert len(result.items) == _EXPECTED_EDITION_COUNT
+        assert result.continuation == "next"
+        model, query = repo.query_page.call_args.args
+        assert model is EditionSummary
+        assert "c.content.title AS title" in query
+        assert "ARRAY_LENGTH(c.link_ids) AS link_count" in query
+        assert "SELECT *" not in query
 
     async def test_list_unpublished(self, repo: EditionRepository) -> None:
         """Verify list unpublished."""
@@ -1,14 +1,31 @@
 """Tests for LinkRepository custom query methods."""
 
 from datetime import UTC, datetime, timedelta
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from azure.core import MatchConditions
 from azure.cosmos.exceptions import CosmosHttpResponseError
 
+from curate_common.database.repositories.base import Page
 from curate_common.database.repositories.links import LinkRepository
-from curate_common.models.link import Link, LinkStatus
+from curate_common.models.link import Link, LinkStatus, LinkSummary
+
+
+class _AsyncItems:
+    """Async iterator over query results."""
+
+    def __init__(self, items: list[dict[str, str]]) -> None:
+        self._items = iter(items)
+
+    def __aiter__(self) -> "_AsyncItems":
+        return self
+
+    async def __anext__(self) -> dict[str, str]:
+        try:
+            return next(self._items)
+        except StopIteration:
+            raise StopAsyncIteration from None
 
 
 class TestLinkRepository:
@@ -70,6 +87,25 @@ class TestLinkRepository:
 
         assert result == []
 
+    async def test_list_unattached_projects_summaries(
+        self, repo: LinkRepository
+    ) -> None:
+        """Verify unattached links are listed as summaries, without content."""
+        repo.query_page = AsyncMock(return_value=Page())
+
+        result = await repo.list_unattached(page_size=10, continuation="token")
+
+        assert result == Page()
+        model, query = repo.query_page.call_args.args
+        assert repo.query_page.call_args.kwargs == {
+            "page_size": 10,
+            "continuation": "token",
+        }
+        assert model is LinkSummary
+        assert "NOT IS_DEFINED(c.edition_id)" in query
+        assert "c.content" not in query
+        assert "SELECT *" not in query
+
     async def test_claim_submitted_uses_etag_match(self, repo: LinkRepository) -> None:
         """Verify submitted-link claims use optimistic concurrency."""
         repo._container.read_item.return_value = {  # noqa: SLF001
@@ -91,6 +127,54 @@ class TestLinkRepository:
         assert kwargs["match_condition"] is MatchConditions.IfNotModified
         assert kwargs["body"]["processing_claimed_at"]
 
+    async def test_claim_submitted_retries_throttled_requests(
+        self, repo: LinkRepository
+    ) -> None:
+        """Verify a 429 on the claim path is retried rather than read as a miss."""
+        throttled = CosmosHttpResponseError(status_code=429, message="Too many")
+        throttled.headers = {"x-ms-retry-after-ms": "10"}
+        repo._container.read_item.side_effect = [  # noqa: SLF001
+            throttled,
+            {
+                "id": "link-1",
+                "url": "https://example.com",
+                "edition_id": "ed-1",
+                "status": "submitted",
+                "_etag": "etag-1",
+                "created_at": "2026-01-01T00:00:00+00:00",
+                "updated_at": "2026-01-01T00:00:00+00:00",
+            },
+        ]
+        repo._container.replace_item.side_effect = [throttled, {}]  # noqa: SLF001
+
+        with patch("curate_common.database.repositories.base.asyncio.sleep"):
+            claimed = await repo.claim_submitted("link-1", owner_id="worker-1")
+
+        assert claimed is not None
+        assert repo._container.read_item.await_count == 2  # noqa: PLR2004, SLF001
+        assert repo._container.replace_item.await_count == 2  # noqa: PLR2004, SLF001
+
+    async def test_claim_submitted_raises_unexpected_read_errors(
+        self, repo: LinkRepository
+    ) -> None:
+        """Verify only a missing link is a claim miss; other errors surface."""
+        repo._container.read_item.side_effect = CosmosHttpResponseError(  # noqa: SLF001
+            status_code=500, message="Internal"
+        )
+
+        with pytest.raises(CosmosHttpResponseError):
+            await repo.claim_submitted("link-1")
+
+    async def test_renew_claim_retries_throttled_patch(
+        self, repo: LinkRepository
+    ) -> None:
+        """Verify a throttled heartbeat is retried instead of losing the claim."""
+        throttled = CosmosHttpResponseError(status_code=429, message="Too many")
+        repo._container.patch_item.side_effect = [throttled, {}]  # noqa: SLF001
+
+        with patch("curate_common.database.repositories.base.asyncio.sleep"):
+            assert await repo.renew_claim("link-1", "worker-1")
+
     async def test_claim_submitted_returns_none_on_status_mismatch(
         self, repo: LinkRepository
     ) -> None:
@@ -168,3 +252,191 @@ class TestLinkRepository:
         claimed = await repo.claim_submitted("link-1")
 
         assert claimed is None
+
+    async def test_release_claim_resubmits_unfinished_link(
+        self, repo: LinkRepository
+    ) -> None:
+        """Verify a released claim keeps artifacts and returns the link to submitted."""
+        repo._container.read_item.return_value = {  # noqa: SLF001
+            "id": "link-1",
+            "url": "https://example.com",
+            "edition_id": "ed-1",
+            "status": "reviewed",
+            "content": "Body",
+            "review": {"category": "AI"},
+            "_etag": "etag-1",
+            "processing_claimed_at": datetime.now(UTC).isoformat(),
+        }
+
+        stage = await repo.release_claim("link-1")
+
+        assert stage == LinkStatus.REVIEWED
+        kwargs = repo._container.replace_item.call_args.kwargs  # noqa: SLF001
+        assert kwargs["etag"] == "etag-1"
+        assert kwargs["body"]["status"] == "submitted"
+        assert kwargs["body"]["content"] == "Body"
+        assert "processing_claimed_at" not in kwargs["body"]
+
+    async def test_release_claim_skips_unclaimed_link(
+        self, repo: LinkRepository
+    ) -> None:
+        """Verify links without a claim marker are left untouched."""
+        repo._container.read_item.return_value = {  # noqa: SLF001
+            "id": "link-1",
+            "url": "https://example.com",
+            "status": "submitted",
+            "_etag": "etag-1",
+        }
+
+        assert await repo.release_claim("link-1") is None
+        repo._container.replace_item.assert_not_called()  # noqa: SLF001
+
+    async def test_claim_submitted_records_owner(self, repo: LinkRepository) -> None:
+        """Verify claims carry the claiming worker's instance id."""
+        repo._container.read_item.return_value = {  # noqa: SLF001
+            "id": "link-1",
+            "url": "https://example.com",
+            "edition_id": "ed-1",
+            "status": "submitted",
+            "_etag": "etag-1",
+        }
+
+        await repo.claim_submitted("link-1", owner_id="worker-a")
+
+        body = repo._container.replace_item.call_args.kwargs["body"]  # noqa: SLF001
+        assert body["processing_owner"] == "worker-a"
+
+    async def test_renew_claim_is_conditional_on_owner(
+        self, repo: LinkRepository
+    ) -> None:
+        """Verify renewals only apply to live claims still held by the caller."""
+        renewed = await repo.renew_claim("link-1", "worker-a")
+
+        assert renewed is True
+        kwargs = repo._container.patch_item.call_args.kwargs  # noqa: SLF001
+        predicate = kwargs["filter_predicate"]
+        assert predicate.startswith('FROM c WHERE c.processing_owner = "worker-a"')
+        assert "NOT IS_DEFINED(c.deleted_at)" in predicate
+        assert "IS_STRING(c.edition_id)" in predicate
+        assert "NOT IS_DEFINED(c.cancel_requested_at)" in predicate
+        assert kwargs["patch_operations"][0]["path"] == "/processing_claimed_at"
+
+    async def test_renew_claim_reports_lost_claim(self, repo: LinkRepository) -> None:
+        """Verify a failed owner predicate is reported as a lost claim."""
+        repo._container.patch_item.side_effect = CosmosHttpResponseError(  # noqa: SLF001
+            status_code=412,
+            message="Precondition failed",
+        )
+
+        assert await repo.renew_claim("link-1", "worker-a") is False
+
+    async def test_request_cancel_marks_in_progress_link_failed(
+        self, repo: LinkRepository
+    ) -> None:
+        """Verify stopping a link fails it only while it is still in progress."""
+        assert await repo.request_cancel("link-1") is True
+
+        kwargs = repo._container.patch_item.call_args.kwargs  # noqa: SLF001
+        assert {"op": "set", "path": "/status", "value": "failed"} in kwargs[
+            "patch_operations"
+        ]
+        assert "ARRAY_CONTAINS" in kwargs["filter_predicate"]
+        assert "NOT IS_DEFINED(c.deleted_at)" in kwargs["filter_predicate"]
+
+    async def test_request_cancel_rejects_finished_link(
+        self, repo: LinkRepository
+    ) -> None:
+        """Verify a link that is no longer in progress cannot be stopped."""
+        repo._container.patch_item.side_effect = CosmosHttpResponseError(  # noqa: SLF001
+            status_code=412,
+            message="Precondition failed",
+        )
+
+        assert await repo.request_cancel("link-1") is False
+
+    async def test_release_claim_leaves_other_owners_claim(
+        self, repo: LinkRepository
+    ) -> None:
+        """Verify a worker cannot release a claim another worker holds."""
+        repo._container.read_item.return_value = {  # noqa: SLF001
+            "id": "link-1",
+            "url": "https://example.com",
+            "status": "submitted",
+            "_etag": "etag-1",
+            "processing_claimed_at": datetime.now(UTC).isoformat(),
+            "processing_owner": "worker-b",
+        }
+
+        assert await repo.release_claim("link-1", "worker-a") is None
+        repo._container.replace_item.assert_not_called()  # noqa: SLF001
+
+    async def test_requeue_expired_claims_filters_and_patches(
+        self, repo: LinkRepository
+    ) -> None:
+        """Verify expiry is filtered in the query and claims are released by patch."""
+        expired = (datetime.now(UTC) - timedelta(minutes=5)).isoformat()
+        repo._container.query_items = MagicMock(  # noqa: SLF001
+            return_value=_AsyncItems(
+                [
+                    {
+                        "id": "link-1",
+                        "_etag": "etag-1",
+                        "status": "fetching",
+                        "edition_id": "ed-1",
+                        "processing_owner": "worker-a",
+                        "processing_claimed_at": expired,
+                    }
+                ]
+            )
+        )
+
+        requeued = await repo.requeue_expired_claims()
+
+        assert requeued == 1
+        query = repo._container.query_items.call_args.args[0]  # noqa: SLF001
+        assert query.startswith("SELECT c.id, c._etag, c.status")
+        assert "c.processing_claimed_at < @cutoff" in query
+        kwargs = repo._container.patch_item.call_args.kwargs  # noqa: SLF001
+        assert kwargs["item"] == "link-1"
+        assert kwargs["etag"] == "etag-1"
+        assert kwargs["match_condition"] == MatchConditions.IfNotModified
+        changes = {op["path"]: op["value"] for op in kwargs["patch_operations"]}
+        assert changes["/status"] == "submitted"
+        assert changes["/processing_claimed_at"] is None
+        assert changes["/processing_owner"] is None
+        repo._container.replace_item.assert_not_called()  # noqa: SLF001
+
+    async def test_requeue_expired_claims_skips_renewed_claims(
+        self, repo: LinkRepository
+    ) -> None:
+        """Verify a claim renewed after the query is not counted as requeued."""
+        repo._container.query_items = MagicMock(  # noqa: SLF001
+            return_value=_AsyncItems([{"id": "link-1", "_etag": "etag-1"}])
+        )
+        repo._container.patch_item.side_effect = CosmosHttpResponseError(  # noqa: SLF001
+            status_code=412, message="Precondition failed"
+        )
+
+        assert await repo.requeue_expired_claims() == 0
+
+    async def test_disassociate_preserves_fetched_and_reviewed_artifacts(
+        self, repo: LinkRepository
+    ) -> None:
+        """Verify disassociation keeps content and review for later reuse."""
+        link = Link(
+            id="link-1",
+            url="https://example.com",
+            edition_id="ed-1",
+            status=LinkStatus.DRAFTED,
+            title="Title",
+            content="Body",
+            review={"category": "AI"},
+        )
+
+        result = await repo.disassociate(link)
+
+        assert result.edition_id is None
+        assert result.status == LinkStatus.SUBMITTED
+        assert result.title == "Title"
+        assert result.content == "Body"
+        assert result.review == {"category": "AI"}
@@ -0,0 +1,87 @@
+"""Query-plan audit for repository lookups on hot paths.
+
+Every lookup made per stage completion, link update, or page render must
+be served from a single logical partition. A query without a partition key
+fans out to every physical partition, so its RU cost and latency grow with
+the container.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from curate_common.database.repositories.agent_runs import AgentRunRepository
+from curate_common.database.repositories.feedback import FeedbackRepository
+from curate_common.database.repositories.revisions import RevisionRepository
+from curate_common.models.agent_run import AgentStage
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Awaitable, Callable
+
+    from curate_common.database.repositories.base import BaseRepository
+
+_EDITION_ID = "ed-1"
+
+type Lookup = Callable[[Any], Awaitable[object]]
+
+_HOT_PATH_LOOKUPS: dict[str, tuple[type[BaseRepository[Any]], Lookup]] = {
+    "agent_runs.get_by_trigger": (
+        AgentRunRepository,
+        lambda repo: repo.get_by_trigger("link-1", _EDITION_ID),
+    ),
+    "agent_runs.get_by_triggers": (
+        AgentRunRepository,
+        lambda repo: repo.get_by_triggers(["link-1", "link-2"], _EDITION_ID),
+    ),
+    "agent_runs.get_by_stage": (
+        AgentRunRepository,
+        lambda repo: repo.get_by_stage("link-1", AgentStage.FETCH, _EDITION_ID),
+    ),
+    "agent_runs.list_by_edition": (
+        AgentRunRepository,
+        lambda repo: repo.list_by_edition(_EDITION_ID),
+    ),
+    "feedback.get_by_edition": (
+        FeedbackRepository,
+        lambda repo: repo.get_by_edition(_EDITION_ID),
+    ),
+    "feedback.get_unresolved": (
+        FeedbackRepository,
+        lambda repo: repo.get_unresolved(_EDITION_ID),
+    ),
+    "revisions.list_by_edition": (
+        RevisionRepository,
+        lambda repo: repo.list_by_edition(_EDITION_ID),
+    ),
+    "revisions.get_latest": (
+        RevisionRepository,
+        lambda repo: repo.get_latest(_EDITION_ID),
+    ),
+}
+
+
+async def _no_items(**_kwargs: Any) -> AsyncIterator[dict[str, Any]]:
+    for item in ():
+        yield item
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("name", sorted(_HOT_PATH_LOOKUPS))
+async def test_hot_path_lookup_is_single_partition(name: str) -> None:
+    """Verify a hot-path lookup scopes its query to the edition partition."""
+    repo_class, lookup = _HOT_PATH_LOOKUPS[name]
+    container = AsyncMock()
+    container.query_items = MagicMock(side_effect=_no_items)
+    database = MagicMock()
+    database.get_container_client.return_value = container
+
+    await lookup(repo_class(database))
+
+    container.query_items.assert_called_once()
+    kwargs = container.query_items.call_args.kwargs
+    assert kwargs.get("partition_key") == _EDITION_ID, (
+        f"{name} runs a cross-partition query"
+    )
@@ -1,13 +1,17 @@
 """Tests for RevisionRepository custom query methods."""
 
-from unittest.mock import AsyncMock, MagicMock
+from collections.abc import AsyncIterator
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from azure.cosmos.exceptions import CosmosHttpResponseError
 
 from curate_common.database.repositories.revisions import RevisionRepository
 from curate_common.models.revision import Revision, RevisionSource
 
 _EXPECTED_REVISION_COUNT = 2
+_EXPECTED_NEXT_SEQUENCE = 5
 
 
 class TestRevisionRepository:
@@ -55,3 +59,84 @@ class TestRevisionRepository:
         result = await repo.get_latest("ed-1")
 
         assert result is None
+
+    async def test_next_sequence_increments_counter(
+        self, repo: RevisionRepository
+    ) -> None:
+        """Verify sequence allocation is a single patch increment."""
+        counters = repo._counters  # noqa: SLF001
+        counters.patch_item.return_value = {"id": "c", "value": 5}
+
+        result = await repo.next_sequence("ed-1")
+
+        assert result == _EXPECTED_NEXT_SEQUENCE
+        kwargs = counters.patch_item.call_args.kwargs
+        assert kwargs["item"] == "revision-sequence-ed-1"
+        assert kwargs["patch_operations"] == [
+            {"op": "incr", "path": "/value", "value": 1}
+        ]
+        counters.create_item.assert_not_called()
+
+    async def test_next_sequence_seeds_missing_counter_from_max(
+        self, repo: RevisionRepository
+    ) -> None:
+        """Verify a missing counter is seeded from the highest stored sequence."""
+        counters = repo._counters  # noqa: SLF001
+        counters.patch_item.side_effect = CosmosHttpResponseError(
+            status_code=404, message="Not found"
+        )
+
+        async def _max_query(*_args: Any, **_kwargs: Any) -> AsyncIterator[int]:
+            yield 4
+
+        repo._container.query_items = _max_query  # noqa: SLF001
+
+        result = await repo.next_sequence("ed-1")
+
+        assert result == _EXPECTED_NEXT_SEQUENCE
+        body = counters.create_item.call_args.kwargs["body"]
+        assert body == {
+            "id": "revision-sequence-ed-1",
+            "edition_id": "ed-1",
+            "value": _EXPECTED_NEXT_SEQUENCE,
+        }
+
+    async def test_next_sequence_retries_increment_after_seed_conflict(
+        self, repo: RevisionRepository
+    ) -> None:
+        """Verify a concurrent seed falls back to incrementing the winner's counter."""
+        counters = repo._counters  # noqa: SLF001
+        counters.patch_item.side_effect = [
+            CosmosHttpResponseError(status_code=404, message="Not found"),
+            {"id": "c", "value": 5},
+        ]
+        counters.create_item.side_effect = CosmosHttpResponseError(
+            status_code=409, message="Conflict"
+        )
+
+        async def _empty_query(*_args: Any, **_kwargs: Any) -> AsyncIterator[int]:
+            for value in ():
+                yield value
+
+        repo._container.query_items = _empty_query  # noqa: SLF001
+
+        result = await repo.next_sequence("ed-1")
+
+        assert result == _EXPECTED_NEXT_SEQUENCE
+        assert counters.patch_item.call_count == 2  # noqa: PLR2004
+
+    async def test_next_sequence_retries_throttled_increment(
+        self, repo: RevisionRepository
+    ) -> None:
+        """Verify the counter increment shares the repository retry budget."""
+        counters = repo._counters  # noqa: SLF001
+        counters.patch_item.side_effect = [
+            CosmosHttpResponseError(status_code=429, message="Too many requests"),
+            {"id": "c", "value": 5},
+        ]
+
+        with patch("curate_common.database.repositories.base.asyncio.sleep"):
+            result = await repo.next_sequence("ed-1")
+
+        assert result == _EXPECTED_NEXT_SEQUENCE
+        assert counters.patch_item.call_count == 2  # noqa: PLR2004
@@ -0,0 +1,79 @@
+"""Tests for repository request charge telemetry."""
+
+from __future__ import annotations
+
+import pytest
+
+from curate_common.database.telemetry import (
+    UNATTRIBUTED,
+    OperationStats,
+    caller_scope,
+    current_caller,
+    current_request_charge,
+    record_operation,
+    track_request_charge,
+    track_request_charges,
+)
+
+_PAGE_CHARGE = 2.5
+_RETRIEVED = 7.0
+
+
+@pytest.mark.unit
+def test_operation_stats_sums_pages() -> None:
+    """Each response adds its charge and query metrics; the last id is kept."""
+    stats = OperationStats()
+    headers = {
+        "x-ms-request-charge": str(_PAGE_CHARGE),
+        "x-ms-documentdb-query-metrics": (
+            f"retrievedDocumentCount={_RETRIEVED:.0f};outputDocumentCount=3;x=abc"
+        ),
+    }
+
+    stats({**headers, "x-ms-activity-id": "first"}, {})
+    stats({**headers, "x-ms-activity-id": "second"}, {})
+
+    assert stats.request_charge == _PAGE_CHARGE * 2
+    assert stats.activity_id == "second"
+    assert stats.query_metrics["retrievedDocumentCount"] == _RETRIEVED * 2
+    assert "x" not in stats.query_metrics
+
+
+@pytest.mark.unit
+def test_record_operation_adds_to_every_enclosing_scope() -> None:
+    """Nested scopes each count an operation made inside them."""
+    with track_request_charge() as outer:
+        record_operation("links", "get", OperationStats(_PAGE_CHARGE), 1.0)
+        with track_request_charge() as inner:
+            record_operation("links", "get", OperationStats(_PAGE_CHARGE), 1.0)
+            assert current_request_charge() is inner
+
+    assert outer.request_charge == _PAGE_CHARGE * 2
+    assert inner.request_charge == _PAGE_CHARGE
+    assert inner.operations == 1
+    assert current_request_charge() is None
+
+
+@pytest.mark.unit
+async def test_track_request_charges_scopes_handler() -> None:
+    """The decorator attributes a handler's calls and tracks their charge."""
+    seen: list[str] = []
+
+    @track_request_charges("pipeline.publish")
+    async def handler() -> None:
+        seen.append(current_caller())
+        assert current_request_charge() is not None
+
+    await handler()
+
+    assert seen == ["pipeline.publish"]
+    assert current_caller() == UNATTRIBUTED
+
+
+@pytest.mark.unit
+def test_caller_scope_restores_previous_caller() -> None:
+    """Leaving a caller scope restores the enclosing attribution."""
+    with caller_scope("GET /editions"):
+        with caller_scope("pipeline.link"):
+            assert current_caller() == "pipeline.link"
+        assert current_caller() == "GET /editions"
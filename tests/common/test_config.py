@@ -7,12 +7,16 @@ from curate_common.config import (
     CosmosConfig,
     EntraConfig,
     FoundryConfig,
+    PipelineConfig,
     ServiceBusConfig,
     Settings,
     StorageConfig,
     _env,
 )
 
+_DEFAULT_FUSED_REVIEW_TOKENS = 2000
+_DEFAULT_TOOL_RESULT_CHARS = 280
+
 
 def test_env_returns_value(monkeypatch: pytest.MonkeyPatch) -> None:
     """Verify env returns value."""
@@ -81,6 +85,16 @@ def test_storage_config_default_container(monkeypatch: pytest.MonkeyPatch) -> No
     assert config.container == "$web"
 
 
+def test_pipeline_config_defaults(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Verify pipeline tuning defaults and env overrides."""
+    monkeypatch.delenv("PIPELINE_FUSED_REVIEW_MAX_TOKENS", raising=False)
+    monkeypatch.delenv("PIPELINE_TOOL_RESULT_MAX_CHARS", raising=False)
+    assert PipelineConfig().fused_review_max_tokens == _DEFAULT_FUSED_REVIEW_TOKENS
+    assert PipelineConfig().tool_result_max_chars == _DEFAULT_TOOL_RESULT_CHARS
+    monkeypatch.setenv("PIPELINE_FUSED_REVIEW_MAX_TOKENS", "0")
+    assert PipelineConfig().fused_review_max_tokens == 0
+
+
 def test_settings_creates_all_sub_configs(monkeypatch: pytest.MonkeyPatch) -> None:
     """Verify settings creates all sub configs."""
     for key in [
@@ -98,6 +112,7 @@ def test_settings_creates_all_sub_configs(monkeypatch: pytest.MonkeyPatch) -> No
     assert isinstance(settings.foundry, FoundryConfig)
     assert isinstance(settings.storage, StorageConfig)
     assert isinstance(settings.entra, EntraConfig)
+    assert isinstance(settings.pipeline, PipelineConfig)
     assert isinstance(settings.app, AppConfig)
 
 
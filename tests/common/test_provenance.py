@@ -0,0 +1,66 @@
+"""Tests for link provenance attribution and targeted content removal."""
+
+from curate_common.provenance import attribute_sections, remove_link_contribution
+
+_URL_A = "https://a.example.com/post"
+_URL_B = "https://b.example.com/post"
+
+
+def test_attribute_sections_matches_items_by_url() -> None:
+    """Verify item sections are attributed when they reference the link URL."""
+    current = {
+        "signals": [{"headline": "A", "url": _URL_A}],
+        "toolkit": [{"name": "B", "url": _URL_B}],
+    }
+
+    assert attribute_sections({}, current, _URL_A) == ["signals"]
+
+
+def test_attribute_sections_includes_changed_deep_dive() -> None:
+    """Verify the deep dive is attributed only when the draft changed it."""
+    previous = {"deep_dive": {"title": "Old"}}
+    changed = {"deep_dive": {"title": "New"}}
+
+    assert attribute_sections(previous, changed, _URL_A) == ["deep_dive"]
+    assert attribute_sections(previous, previous, _URL_A) == []
+
+
+def test_remove_link_contribution_strips_only_matching_items() -> None:
+    """Verify only the deleted link's items are removed."""
+    content = {
+        "title": "Issue #1",
+        "signals": [
+            {"headline": "A", "url": _URL_A},
+            {"headline": "B", "url": _URL_B},
+        ],
+    }
+    link_sections = {"link-a": ["signals"], "link-b": ["signals"]}
+
+    changed = remove_link_contribution(content, link_sections, "link-a", _URL_A)
+
+    assert changed == ["signals"]
+    assert content["signals"] == [{"headline": "B", "url": _URL_B}]
+    assert content["title"] == "Issue #1"
+    assert link_sections == {"link-b": ["signals"]}
+
+
+def test_remove_link_contribution_keeps_shared_deep_dive() -> None:
+    """Verify a deep dive attributed to another link is left in place."""
+    content = {"deep_dive": {"title": "Shared"}}
+    link_sections = {"link-a": ["deep_dive"], "link-b": ["deep_dive"]}
+
+    changed = remove_link_contribution(content, link_sections, "link-a", _URL_A)
+
+    assert changed == []
+    assert content == {"deep_dive": {"title": "Shared"}}
+
+
+def test_remove_link_contribution_drops_sole_deep_dive() -> None:
+    """Verify a deep dive contributed only by the deleted link is removed."""
+    content = {"deep_dive": {"title": "Solo"}, "editors_note": "Hi"}
+    link_sections = {"link-a": ["deep_dive"]}
+
+    changed = remove_link_contribution(content, link_sections, "link-a", _URL_A)
+
+    assert changed == ["deep_dive"]
+    assert content == {"editors_note": "Hi"}
@@ -2,9 +2,14 @@
 
 from unittest.mock import AsyncMock, MagicMock, patch
 
+from curate_common.database.repositories.base import Page
 from curate_web.routes.agent_runs import recent_runs
 from tests.web.routes.runtime_helpers import make_runtime
 
+_PAGE_SIZE = 20
+_CURSOR = "cursor-1"
+_NEXT_CURSOR = "cursor-2"
+
 
 class TestRecentRunsRoute:
     """Test the Recent Runs Route."""
@@ -20,16 +25,19 @@ class TestRecentRunsRoute:
         )
 
         mock_repo = AsyncMock()
-        mock_repo.list_recent.return_value = []
+        mock_repo.list_page.return_value = Page([], _NEXT_CURSOR)
 
         with patch(
             "curate_web.routes.agent_runs.get_agent_run_repository",
             return_value=mock_repo,
         ):
-            await recent_runs(request)
+            await recent_runs(request, page_size=_PAGE_SIZE, cursor=_CURSOR)
 
-        mock_repo.list_recent.assert_called_once_with(20)
+        mock_repo.list_page.assert_called_once_with(
+            page_size=_PAGE_SIZE, continuation=_CURSOR
+        )
         request.app.state.templates.TemplateResponse.assert_called_once()
         call_args = request.app.state.templates.TemplateResponse.call_args
         assert call_args[0][0] == "partials/agent_run_item.html"
-        assert "runs" in call_args[0][1]
+        assert call_args[0][1]["runs"] == []
+        assert call_args[0][1]["next_cursor"] == _NEXT_CURSOR
@@ -2,9 +2,12 @@
 
 from unittest.mock import AsyncMock, MagicMock, patch
 
+from curate_common.database.repositories.base import Page
 from curate_web.routes.dashboard import dashboard
 from tests.web.routes.runtime_helpers import make_runtime
 
+_PAGE_SIZE = 20
+
 
 async def test_dashboard_renders_template() -> None:
     """Verify dashboard renders template."""
@@ -19,7 +22,7 @@ async def test_dashboard_renders_template() -> None:
     )
 
     mock_ed_repo = AsyncMock()
-    mock_ed_repo.list_all.return_value = []
+    mock_ed_repo.list_page.return_value = Page()
     mock_ed_repo.get_active.return_value = None
     mock_runs_repo = AsyncMock()
     mock_runs_repo.list_recent.return_value = []
@@ -34,13 +37,16 @@ async def test_dashboard_renders_template() -> None:
             return_value=mock_runs_repo,
         ),
     ):
-        await dashboard(request)
+        await dashboard(request, page_size=_PAGE_SIZE, cursor=None)
 
     request.app.state.templates.TemplateResponse.assert_called_once_with(
         "dashboard.html",
         {
             "request": request,
+            "page_size": _PAGE_SIZE,
+            "cursor": None,
             "editions": [],
+            "next_cursor": None,
             "active_edition": None,
             "recent_runs": [],
         },
@@ -2,8 +2,10 @@
 
 from unittest.mock import AsyncMock, MagicMock, patch
 
+from curate_common.database.repositories.base import Page
 from curate_common.models.link import Link
 from curate_web.routes.links import (
+    cancel_link,
     delete_link,
     list_store,
     retry_link,
@@ -12,6 +14,7 @@ from curate_web.routes.links import (
 from tests.web.routes.runtime_helpers import make_runtime
 
 _EXPECTED_REDIRECT_STATUS = 303
+_PAGE_SIZE = 25
 
 
 def _make_request() -> None:
@@ -33,15 +36,18 @@ async def test_list_store_renders_all_links() -> None:
 
     with patch("curate_web.routes.links.get_link_repository") as mock_links_repo:
         links_repo = AsyncMock()
-        links_repo.list_all.return_value = links
+        links_repo.list_page.return_value = Page(links, "next-token")
         mock_links_repo.return_value = links_repo
 
-        await list_store(request)
+        await list_store(request, page_size=_PAGE_SIZE, cursor="token")
 
-        links_repo.list_all.assert_called_once()
+        links_repo.list_page.assert_called_once_with(
+            page_size=_PAGE_SIZE, continuation="token"
+        )
         request.app.state.templates.TemplateResponse.assert_called_once()
         ctx = request.app.state.templates.TemplateResponse.call_args[0][1]
         assert ctx["links"] == links
+        assert ctx["next_cursor"] == "next-token"
 
 
 async def test_list_store_empty() -> None:
@@ -50,10 +56,10 @@ async def test_list_store_empty() -> None:
 
     with patch("curate_web.routes.links.get_link_repository") as mock_links_repo:
         links_repo = AsyncMock()
-        links_repo.list_all.return_value = []
+        links_repo.list_page.return_value = Page()
         mock_links_repo.return_value = links_repo
 
-        await list_store(request)
+        await list_store(request, page_size=_PAGE_SIZE, cursor=None)
 
         ctx = request.app.state.templates.TemplateResponse.call_args[0][1]
         assert ctx["links"] == []
@@ -105,6 +111,22 @@ async def test_retry_link_ignores_non_failed() -> None:
         assert response.status_code == _EXPECTED_REDIRECT_STATUS
 
 
+async def test_cancel_link_stops_pipeline() -> None:
+    """Verify cancel link stops the pipeline and redirects back."""
+    request = _make_request()
+
+    with patch(
+        "curate_web.routes.links.link_svc.cancel_link", new_callable=AsyncMock
+    ) as mock_cancel:
+        mock_cancel.return_value = True
+
+        response = await cancel_link(request, link_id="link-1", next="/editions/e")
+
+        mock_cancel.assert_called_once()
+        assert response.status_code == _EXPECTED_REDIRECT_STATUS
+        assert response.headers["location"] == "/editions/e"
+
+
 async def test_delete_link_soft_deletes() -> None:
     """Verify delete link soft-deletes."""
     request = _make_request()
@@ -0,0 +1,54 @@
+"""Tests for link service — targeted removal on delete."""
+
+from unittest.mock import AsyncMock
+
+from curate_common.models.edition import Edition
+from curate_common.models.link import Link, LinkStatus
+from curate_web.services.links import delete_link
+
+
+async def test_delete_link_strips_only_its_contribution() -> None:
+    """Verify deleting a link keeps other drafted content and link statuses."""
+    links_repo, editions_repo = AsyncMock(), AsyncMock()
+    link = Link(
+        id="link-1",
+        url="https://a.example.com",
+        edition_id="ed-1",
+        status=LinkStatus.DRAFTED,
+    )
+    edition = Edition(
+        id="ed-1",
+        link_ids=["link-1", "link-2"],
+        content={
+            "title": "Issue #1",
+            "signals": [
+                {"headline": "A", "url": "https://a.example.com"},
+                {"headline": "B", "url": "https://b.example.com"},
+            ],
+        },
+        link_sections={"link-1": ["signals"], "link-2": ["signals"]},
+    )
+    links_repo.get.return_value = link
+    editions_repo.get.return_value = edition
+
+    result = await delete_link("link-1", links_repo, editions_repo)
+
+    assert result is edition
+    assert edition.link_ids == ["link-2"]
+    assert edition.content["signals"] == [
+        {"headline": "B", "url": "https://b.example.com"}
+    ]
+    assert "link-1" not in edition.link_sections
+    links_repo.soft_delete.assert_called_once_with(link, "link-1")
+    links_repo.get_by_status.assert_not_called()
+    links_repo.update.assert_not_called()
+    editions_repo.update.assert_called_once_with(edition, "ed-1")
+
+
+async def test_delete_link_returns_none_when_missing() -> None:
+    """Verify deleting an unknown link is a no-op."""
+    links_repo, editions_repo = AsyncMock(), AsyncMock()
+    links_repo.get.return_value = None
+
+    assert await delete_link("missing", links_repo, editions_repo) is None
+    editions_repo.update.assert_not_called()
@@ -6,12 +6,16 @@ import asyncio
 import logging
 from typing import TYPE_CHECKING
 
-from fastapi import FastAPI
+from fastapi import Depends, FastAPI
 from fastapi.responses import PlainTextResponse
 from fastapi.testclient import TestClient
 
 from curate_common.config import Settings
-from curate_web.app import _install_request_diagnostics_middleware
+from curate_common.database.telemetry import current_caller
+from curate_web.app import (
+    _attribute_repository_calls,
+    _install_request_diagnostics_middleware,
+)
 
 if TYPE_CHECKING:
     from _pytest.logging import LogCaptureFixture
@@ -86,3 +90,17 @@ def test_request_diagnostics_does_not_warn_for_events(
         client.get("/events")
 
     assert not caplog.records
+
+
+def test_repository_calls_are_attributed_to_route_template() -> None:
+    """Verify repository calls in a request are tagged with its route."""
+    app = FastAPI(dependencies=[Depends(_attribute_repository_calls)])
+
+    @app.get("/editions/{edition_id}")
+    async def edition(edition_id: str) -> dict[str, str]:
+        return {"id": edition_id, "caller": current_caller()}
+
+    with TestClient(app) as client:
+        response = client.get("/editions/ed-1")
+
+    assert response.json()["caller"] == "GET /editions/{edition_id}"
@@ -0,0 +1,65 @@
+"""Tests for pipeline and stage deadlines."""
+
+import asyncio
+
+import pytest
+
+from curate_worker.agents.deadlines import PipelineDeadline, StageDeadline, remaining
+
+_SHORT = 0.01
+_LONG = 60.0
+
+
+async def test_pipeline_deadline_cancels_work() -> None:
+    """Work running past the pipeline deadline is cancelled as a timeout."""
+    deadline = PipelineDeadline(_SHORT, stage_timeout=0)
+
+    with pytest.raises(TimeoutError):
+        async with deadline:
+            await asyncio.Event().wait()
+
+    assert deadline.expired is True
+
+
+async def test_stage_deadline_records_expired_stage() -> None:
+    """A stage past its own timeout fails without expiring the pipeline."""
+    deadline = PipelineDeadline(_LONG, stage_timeout=_SHORT)
+    stage = StageDeadline("fetch")
+
+    async with deadline:
+        with pytest.raises(TimeoutError):
+            async with stage:
+                await asyncio.Event().wait()
+
+    assert stage.expired is True
+    assert deadline.expired is False
+    assert deadline.expired_stages == ["fetch"]
+
+
+async def test_stage_defers_to_nearer_pipeline_deadline() -> None:
+    """The pipeline deadline wins when it falls before the stage timeout."""
+    deadline = PipelineDeadline(_SHORT, stage_timeout=_LONG)
+    stage = StageDeadline("draft")
+
+    with pytest.raises(TimeoutError):
+        async with deadline, stage:
+            await asyncio.Event().wait()
+
+    assert deadline.expired is True
+    assert stage.expired is False
+    assert deadline.expired_stages == []
+
+
+async def test_stage_without_pipeline_is_unbounded() -> None:
+    """Stages outside a pipeline deadline run without a timeout."""
+    async with StageDeadline("review") as stage:
+        await asyncio.sleep(0)
+
+    assert stage.expired is False
+
+
+async def test_remaining_caps_default_at_pipeline_deadline() -> None:
+    """Tool timeouts are capped at the time left in the pipeline."""
+    assert remaining(_LONG) == _LONG
+    async with PipelineDeadline(_SHORT, stage_timeout=0):
+        assert remaining(_LONG) <= _SHORT
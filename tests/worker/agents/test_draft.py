@@ -74,9 +74,33 @@ async def test_save_draft_updates_edition_and_link(
 
     assert result["status"] == "drafted"
     assert "link-1" in edition.link_ids
-    assert link.status == LinkStatus.DRAFTED
     editions_repo.update.assert_called_once()
-    links_repo.update.assert_called_once()
+    links_repo.update.assert_not_called()
+    links_repo.patch.assert_awaited_once()
+    assert links_repo.patch.call_args.args == (
+        "link-1",
+        "link-1",
+        {"status": LinkStatus.DRAFTED},
+    )
+
+
+async def test_save_draft_reports_withdrawn_link(
+    draft_agent: DraftAgent, repos: tuple[AsyncMock, AsyncMock]
+) -> None:
+    """Verify a link stopped or disassociated mid-draft is not marked drafted."""
+    links_repo, editions_repo = repos
+    editions_repo.get.return_value = Edition(id="ed-1", content={}, link_ids=[])
+    links_repo.get.return_value = Link(
+        id="link-1", url="https://example.com", edition_id="ed-1"
+    )
+    links_repo.patch.return_value = None
+
+    result = json.loads(await draft_agent.save_draft("ed-1", "link-1", "{}"))
+
+    assert result["status"] == "withdrawn"
+    condition = links_repo.patch.call_args.kwargs["condition"]
+    assert "NOT IS_DEFINED(c.cancel_requested_at)" in condition
+    assert "IS_STRING(c.edition_id)" in condition
 
 
 async def test_save_draft_deduplicates_link_ids(
@@ -143,3 +167,20 @@ async def test_run_retries_when_save_draft_not_called(
 
     assert call_count == _EXPECTED_RETRY_COUNT
     assert draft_agent._draft_saved is True  # noqa: SLF001
+
+
+async def test_save_draft_records_link_provenance(
+    draft_agent: DraftAgent, repos: tuple[AsyncMock, AsyncMock]
+) -> None:
+    """Verify save draft records which sections the link contributed to."""
+    links_repo, editions_repo = repos
+    edition = Edition(id="ed-1", content={}, link_ids=[])
+    editions_repo.get.return_value = edition
+    links_repo.get.return_value = Link(
+        id="link-1", url="https://example.com/a", edition_id="ed-1"
+    )
+
+    content = {"signals": [{"headline": "A", "url": "https://example.com/a"}]}
+    await draft_agent.save_draft("ed-1", "link-1", json.dumps(content))
+
+    assert edition.link_sections == {"link-1": ["signals"]}
@@ -81,13 +81,14 @@ async def test_resolve_feedback_marks_resolved(
     fb = Feedback(
         id="fb-1", edition_id="ed-1", section="intro", comment="Fix", resolved=False
     )
-    feedback_repo.get.return_value = fb
+    feedback_repo.patch.return_value = fb
 
     result = json.loads(await edit_agent.resolve_feedback("fb-1", "ed-1"))
 
     assert result["status"] == "resolved"
-    assert fb.resolved is True
-    feedback_repo.update.assert_called_once()
+    feedback_repo.patch.assert_awaited_once()
+    assert feedback_repo.patch.call_args.args == ("fb-1", "ed-1", {"resolved": True})
+    feedback_repo.update.assert_not_called()
 
 
 async def test_resolve_feedback_not_found(
@@ -95,7 +96,7 @@ async def test_resolve_feedback_not_found(
 ) -> None:
     """Verify resolve feedback not found."""
     _, feedback_repo = repos
-    feedback_repo.get.return_value = None
+    feedback_repo.patch.return_value = None
 
     result = json.loads(await edit_agent.resolve_feedback("missing", "ed-1"))
     assert "error" in result
@@ -1,13 +1,20 @@
 """Tests for FetchAgent tool methods."""
 
 import json
+from collections.abc import AsyncIterator
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import httpx
 import pytest
 
 from curate_common.models.link import Link, LinkStatus
-from curate_worker.agents.fetch import FetchAgent
+from curate_worker.agents.fetch import (
+    _MAX_PAGE_BYTES,
+    FetchAgent,
+    extract_page_text,
+    fetch_page,
+)
 
 
 @pytest.fixture
@@ -58,57 +65,69 @@ async def test_save_fetched_content_link_not_found(
     links_repo.update.assert_not_called()
 
 
-async def test_fetch_url_returns_error_on_connect_error() -> None:
+def _http_client(response: MagicMock | None = None, **stream: Any) -> AsyncMock:
+    """Return a mock ``httpx.AsyncClient`` whose ``stream`` yields ``response``."""
+    opened = MagicMock()
+    opened.__aenter__ = AsyncMock(return_value=response, **stream)
+    opened.__aexit__ = AsyncMock(return_value=False)
+    mock_client = AsyncMock()
+    mock_client.stream = MagicMock(return_value=opened)
+    mock_client.__aenter__ = AsyncMock(return_value=mock_client)
+    mock_client.__aexit__ = AsyncMock(return_value=False)
+    return mock_client
+
+
+def _response(*chunks: bytes) -> MagicMock:
+    """Return a mock streamed response with the given body chunks."""
+    response = MagicMock()
+    response.charset_encoding = "utf-8"
+
+    async def aiter_bytes() -> AsyncIterator[bytes]:
+        for chunk in chunks:
+            yield chunk
+
+    response.aiter_bytes = aiter_bytes
+    return response
+
+
+async def test_fetch_url_returns_error_on_connect_error(
+    fetch_agent: FetchAgent,
+) -> None:
     """Verify fetch url returns error on connect error."""
     with patch("curate_worker.agents.fetch.httpx.AsyncClient") as mock_client_cls:
-        mock_client = AsyncMock()
-        mock_client.get.side_effect = httpx.ConnectError("Connection refused")
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=False)
-        mock_client_cls.return_value = mock_client
-
-        result = json.loads(
-            await FetchAgent.fetch_url.func("http://unreachable.invalid")
+        mock_client_cls.return_value = _http_client(
+            side_effect=httpx.ConnectError("Connection refused")
         )
 
+        result = json.loads(await fetch_agent.fetch_url("http://unreachable.invalid"))
+
         assert result["unreachable"] is True
         assert "error" in result
 
 
-async def test_fetch_url_returns_error_on_http_status_error() -> None:
+async def test_fetch_url_returns_error_on_http_status_error(
+    fetch_agent: FetchAgent,
+) -> None:
     """Verify fetch url returns error on http status error."""
     with patch("curate_worker.agents.fetch.httpx.AsyncClient") as mock_client_cls:
         mock_response = MagicMock()
         mock_response.raise_for_status.side_effect = httpx.HTTPStatusError(
             "Not Found", request=MagicMock(), response=MagicMock(status_code=404)
         )
-        mock_client = AsyncMock()
-        mock_client.get.return_value = mock_response
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=False)
-        mock_client_cls.return_value = mock_client
-
-        result = json.loads(
-            await FetchAgent.fetch_url.func("https://example.com/missing")
-        )
+        mock_client_cls.return_value = _http_client(mock_response)
+
+        result = json.loads(await fetch_agent.fetch_url("https://example.com/missing"))
 
         assert result["unreachable"] is True
         assert "404" in result["error"]
 
 
-async def test_fetch_url_sets_user_agent_header() -> None:
+async def test_fetch_url_sets_user_agent_header(fetch_agent: FetchAgent) -> None:
     """Verify fetch_url sends a User-Agent header."""
     with patch("curate_worker.agents.fetch.httpx.AsyncClient") as mock_client_cls:
-        mock_response = MagicMock()
-        mock_response.text = "<html>OK</html>"
-        mock_response.raise_for_status = MagicMock()
-        mock_client = AsyncMock()
-        mock_client.get.return_value = mock_response
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=False)
-        mock_client_cls.return_value = mock_client
+        mock_client_cls.return_value = _http_client(_response(b"<html>OK</html>"))
 
-        await FetchAgent.fetch_url.func("https://example.com")
+        assert await fetch_agent.fetch_url("https://example.com") == "<html>OK</html>"
 
         call_kwargs = mock_client_cls.call_args
         headers = call_kwargs.kwargs.get("headers") or call_kwargs[1].get("headers", {})
@@ -116,6 +135,30 @@ async def test_fetch_url_sets_user_agent_header() -> None:
         assert "Curate" in headers["User-Agent"]
 
 
+async def test_fetch_page_truncates_large_bodies() -> None:
+    """Verify the body stops being read once the size cap is reached."""
+    chunk = b"x" * (_MAX_PAGE_BYTES // 2 + 1)
+    with patch("curate_worker.agents.fetch.httpx.AsyncClient") as mock_client_cls:
+        mock_client_cls.return_value = _http_client(_response(chunk, chunk, chunk))
+
+        body = await fetch_page("https://example.com/huge")
+
+    assert len(body) == _MAX_PAGE_BYTES
+
+
+async def test_fetch_url_serves_remembered_page(fetch_agent: FetchAgent) -> None:
+    """Verify text extracted earlier is returned once without a second fetch."""
+    fetch_agent.remember_page("https://example.com", "Agents 101", "Agents plan.")
+
+    with patch("curate_worker.agents.fetch.httpx.AsyncClient") as mock_client_cls:
+        result = await fetch_agent.fetch_url("https://example.com")
+        mock_client_cls.assert_not_called()
+        mock_client_cls.return_value = _http_client(_response(b"<html>OK</html>"))
+        assert await fetch_agent.fetch_url("https://example.com") == "<html>OK</html>"
+
+    assert result == "Title: Agents 101\n\nAgents plan."
+
+
 async def test_mark_link_failed_updates_status(
     fetch_agent: FetchAgent, links_repo: AsyncMock
 ) -> None:
@@ -146,3 +189,21 @@ async def test_mark_link_failed_link_not_found(
 
     assert "error" in result
     links_repo.update.assert_not_called()
+
+
+def test_extract_page_text_skips_chrome_and_scripts() -> None:
+    """Verify extract_page_text keeps the title and body text only."""
+    html = (
+        "<html><head><title> Agents 101 </title><script>var x;</script></head>"
+        "<body><nav>Home | About</nav><p>Agents plan.</p><p>Tools act.</p>"
+        "<footer>Copyright</footer></body></html>"
+    )
+
+    title, text = extract_page_text(html)
+
+    assert title == "Agents 101"
+    assert "Agents plan." in text
+    assert "Tools act." in text
+    assert "var x" not in text
+    assert "Home" not in text
+    assert "Copyright" not in text
@@ -0,0 +1,106 @@
+"""Tests for FusedReviewAgent."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+
+from curate_common.models.link import Link, LinkStatus
+from curate_worker.agents.fused_review import FusedReviewAgent, FusedReviewResult
+from curate_worker.agents.prompts import prompt_version
+
+_MAX_TOKENS = 50
+_EXPECTED_RELEVANCE_SCORE = 7
+
+
+@pytest.fixture
+def links_repo() -> AsyncMock:
+    """Create a links repo for testing."""
+    return AsyncMock()
+
+
+@pytest.fixture
+def fused_agent(links_repo: AsyncMock) -> FusedReviewAgent:
+    """Create a fused review agent for testing."""
+    client = MagicMock()
+    with patch("curate_worker.agents.fused_review.Agent"):
+        return FusedReviewAgent(client, links_repo, max_tokens=_MAX_TOKENS)
+
+
+def _link() -> Link:
+    return Link(id="link-1", url="https://example.com", edition_id="ed-1")
+
+
+async def test_extract_returns_page_text(fused_agent: FusedReviewAgent) -> None:
+    """Verify the page is fetched and parsed into title and text."""
+    html = "<title>Short</title><p>Agents plan and act.</p>"
+    with patch(
+        "curate_worker.agents.fetch.fetch_page",
+        AsyncMock(return_value=html),
+    ):
+        result = await fused_agent.extract(_link())
+
+    assert result == ("Short", "Agents plan and act.")
+
+
+def test_fits_only_short_text(fused_agent: FusedReviewAgent) -> None:
+    """Verify pages over the token threshold take the full pipeline."""
+    assert fused_agent.fits(_link(), "Agents plan and act.")
+    assert not fused_agent.fits(_link(), "word " * 200)
+    assert not fused_agent.fits(_link(), "")
+
+
+async def test_extract_skips_on_fetch_error(fused_agent: FusedReviewAgent) -> None:
+    """Verify fetch failures defer to the fetch agent's error handling."""
+    with patch(
+        "curate_worker.agents.fetch.fetch_page",
+        AsyncMock(side_effect=httpx.ConnectError("refused")),
+    ):
+        assert await fused_agent.extract(_link()) is None
+
+
+async def test_extract_disabled_does_not_fetch(links_repo: AsyncMock) -> None:
+    """Verify a zero threshold disables the fused path entirely."""
+    with patch("curate_worker.agents.fused_review.Agent"):
+        agent = FusedReviewAgent(MagicMock(), links_repo, max_tokens=0)
+    with patch("curate_worker.agents.fused_review.read_page") as read_page:
+        assert await agent.extract(_link()) is None
+    read_page.assert_not_called()
+
+
+async def test_run_saves_content_and_review_in_one_update(
+    fused_agent: FusedReviewAgent, links_repo: AsyncMock
+) -> None:
+    """Verify content, review, and status are written with a single update."""
+    link = _link()
+    response = MagicMock()
+    response.value = FusedReviewResult(
+        title="Agents 101",
+        content="Clean body",
+        insights=["a", "b"],
+        category="Tutorial",
+        relevance_score=_EXPECTED_RELEVANCE_SCORE,
+        justification="On topic",
+    )
+    fused_agent.agent.run = AsyncMock(return_value=response)
+
+    result = await fused_agent.run(link, "Page", "Body")
+
+    assert result is response
+    assert link.title == "Agents 101"
+    assert link.content == "Clean body"
+    assert link.status == LinkStatus.REVIEWED
+    assert link.review is not None
+    assert link.review["relevance_score"] == _EXPECTED_RELEVANCE_SCORE
+    assert link.review["prompt_version"] == prompt_version("fused_review")
+    links_repo.update.assert_called_once_with(link, "link-1")
+
+
+async def test_run_returns_none_without_structured_output(
+    fused_agent: FusedReviewAgent, links_repo: AsyncMock
+) -> None:
+    """Verify unusable output leaves the link untouched."""
+    fused_agent.agent.run = AsyncMock(return_value=MagicMock(value=None))
+
+    assert await fused_agent.run(_link(), "Page", "Body") is None
+    links_repo.update.assert_not_called()
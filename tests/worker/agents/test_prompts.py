@@ -1,8 +1,9 @@
 """Tests for the prompt loader."""
 
-from curate_worker.agents.prompts import PROMPTS_DIR, load_prompt
+from curate_worker.agents.prompts import PROMPTS_DIR, load_prompt, prompt_version
 
 _MIN_PROMPT_LENGTH = 50
+_PROMPT_VERSION_LENGTH = 12
 
 
 def test_prompts_dir_exists() -> None:
@@ -32,3 +33,11 @@ def test_prompt_files_exist() -> None:
     for stage in stages:
         path = PROMPTS_DIR / f"{stage}.md"
         assert path.exists(), f"Missing prompt file: {path}"
+
+
+def test_prompt_version_is_stable_hash() -> None:
+    """Verify prompt version is a short hash that is stable across calls."""
+    version = prompt_version("review")
+    assert len(version) == _PROMPT_VERSION_LENGTH
+    assert version == prompt_version("review")
+    assert version != prompt_version("fetch")
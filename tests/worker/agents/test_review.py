@@ -6,6 +6,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 
 from curate_common.models.link import Link, LinkStatus
+from curate_worker.agents.prompts import prompt_version
 from curate_worker.agents.review import ReviewAgent
 
 _EXPECTED_RELEVANCE_SCORE = 8
@@ -78,6 +79,7 @@ async def test_save_review_updates_link(
     assert link.review["category"] == "AI/ML"
     assert link.review["relevance_score"] == _EXPECTED_RELEVANCE_SCORE
     assert link.review["insights"] == ["insight1", "insight2"]
+    assert link.review["prompt_version"] == prompt_version("review")
     links_repo.update.assert_called_once()
 
 
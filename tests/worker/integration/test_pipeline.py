@@ -5,6 +5,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from curate_common.config import PipelineConfig
 from curate_common.models.link import Link, LinkStatus
 from curate_worker.pipeline.orchestrator import PipelineOrchestrator
 
@@ -17,6 +18,7 @@ _MockRepos = tuple[AsyncMock, AsyncMock, AsyncMock, AsyncMock]
 def mock_repos() -> _MockRepos:
     """Create mock repositories for integration testing."""
     links = AsyncMock()
+    links.patch.return_value = None
     editions = AsyncMock()
     feedback = AsyncMock()
     agent_runs = AsyncMock()
@@ -48,6 +50,7 @@ def orchestrator(
             feedback,
             agent_runs,
             event_publisher=mock_events,
+            pipeline_config=PipelineConfig(fused_review_max_tokens=0),
         )
         orch._agent = MagicMock()  # noqa: SLF001
         orch._agent.run = AsyncMock(  # noqa: SLF001
@@ -81,7 +84,8 @@ async def test_handle_link_change_submitted(
         }
     )
 
-    links.claim_submitted.assert_called_with("link-1")
+    links.claim_submitted.assert_called_with("link-1", owner_id=orchestrator.owner_id)
+    links.clear_claim.assert_awaited_once_with("link-1", orchestrator.owner_id)
     orchestrator.agent.run.assert_called_once()
     call_args = orchestrator.agent.run.call_args[0][0]
     assert "link-1" in call_args
@@ -219,8 +223,8 @@ async def test_handle_link_change_dispatches_to_orchestrator_agent(
 
     orchestrator._agent.run.assert_called_once()  # noqa: SLF001
     orchestrator._runs.create_orchestrator_run.assert_called_once()  # noqa: SLF001
-    runs.update.assert_called_once()
-    saved_run = runs.update.call_args[0][0]
+    runs.complete.assert_called_once()
+    saved_run = runs.complete.call_args[0][0]
     assert saved_run.status == "completed"
 
 
@@ -254,4 +258,4 @@ async def test_handle_link_change_concurrent_claim_conflict_runs_once(
 
     orchestrator._agent.run.assert_called_once()  # noqa: SLF001
     orchestrator._runs.create_orchestrator_run.assert_called_once()  # noqa: SLF001
-    runs.update.assert_called_once()
+    runs.complete.assert_called_once()
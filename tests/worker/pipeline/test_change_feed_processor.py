@@ -1,15 +1,25 @@
 """Tests for the ChangeFeedProcessor — poll loop and feed processing."""
 
 import asyncio
+from collections.abc import Callable
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from azure.core.exceptions import ServiceRequestError, ServiceResponseError
 
-from curate_worker.pipeline.change_feed import ChangeFeedProcessor
+from curate_common.config import PipelineConfig
+from curate_worker.pipeline.change_feed import ChangeFeedProcessor, RangeCursor
+from curate_worker.pipeline.checkpoints import CheckpointManager
+from curate_worker.pipeline.lanes import Lane
+from curate_worker.pipeline.leases import Lease
 
+_real_sleep = asyncio.sleep
 _TEST_CONTINUATION_TOKEN = "token-abc"  # noqa: S105
 _TEST_CONTINUATION_TOKEN_SHORT = "token"  # noqa: S105
+_FIRST_PAGE_TOKEN = "t1"  # noqa: S105
+_SECOND_PAGE_TOKEN = "t2"  # noqa: S105
+_RENEW_INTERVAL = 0.01
+_RENEWALS = 4
 
 
 class _SingleItemPage:
@@ -45,6 +55,27 @@ class _MockPageIterator:
             raise StopAsyncIteration from None
 
 
+async def _until(predicate: Callable[[], bool]) -> None:
+    """Yield to background tasks until ``predicate`` holds, failing after 1s."""
+    async with asyncio.timeout(1):
+        while not predicate():
+            await _real_sleep(_RENEW_INTERVAL)
+
+
+def _lease_manager() -> MagicMock:
+    """Return a lease manager stub holding one feed range per container."""
+    manager = MagicMock()
+    manager.owned = AsyncMock(
+        side_effect=lambda _container, name: [
+            Lease(id=f"lease-{name}", container=name, feed_range={"r": name})
+        ]
+    )
+    manager.checkpoint = AsyncMock(return_value=True)
+    manager.release_all = AsyncMock()
+    manager.renew_interval = _RENEW_INTERVAL
+    return manager
+
+
 class TestChangeFeedProcessor:
     """Test the Change Feed Processor."""
 
@@ -88,6 +119,41 @@ class TestChangeFeedProcessor:
 
             assert processor.running is False
 
+    async def test_stop_waits_for_handlers_within_drain_deadline(
+        self, processor: ChangeFeedProcessor
+    ) -> None:
+        """Verify handlers that finish before the deadline are not cancelled."""
+        finished = asyncio.Event()
+
+        async def _handler() -> None:
+            await _real_sleep(0)
+            finished.set()
+
+        with patch.object(processor, "_poll_loop", new_callable=AsyncMock):
+            await processor.start()
+            processor._handler_tasks.add(asyncio.create_task(_handler()))  # noqa: SLF001
+            await processor.stop()
+
+        assert finished.is_set()
+
+    async def test_stop_cancels_handlers_past_drain_deadline(
+        self, mock_database: MagicMock, mock_orchestrator: MagicMock
+    ) -> None:
+        """Verify handlers still running at the deadline are cancelled."""
+        processor = ChangeFeedProcessor(
+            mock_database,
+            mock_orchestrator,
+            config=PipelineConfig(drain_timeout_seconds=0.01),
+        )
+        stuck = asyncio.create_task(asyncio.Event().wait())
+
+        with patch.object(processor, "_poll_loop", new_callable=AsyncMock):
+            await processor.start()
+            processor._handler_tasks.add(stuck)  # noqa: SLF001
+            await processor.stop()
+
+        assert stuck.cancelled()
+
     async def test_process_feed_calls_handler(
         self, processor: ChangeFeedProcessor
     ) -> None:
@@ -111,6 +177,47 @@ class TestChangeFeedProcessor:
         handler.assert_awaited_once_with(item)
         assert result == _TEST_CONTINUATION_TOKEN
 
+    async def test_process_feed_skips_filtered_items(
+        self, processor: ChangeFeedProcessor
+    ) -> None:
+        """Verify non-actionable items never reach the handler."""
+        mock_container = MagicMock()
+        mock_container.id = "links"
+        items = [
+            {"id": "link-1", "status": "submitted", "edition_id": "ed-1"},
+            {"id": "link-2", "status": "drafted", "edition_id": "ed-1"},
+        ]
+        mock_response = MagicMock()
+        mock_response.by_page.return_value = _MockPageIterator(
+            [_SingleItemPage(items)], continuation_token=_TEST_CONTINUATION_TOKEN
+        )
+        mock_container.query_items_change_feed.return_value = mock_response
+
+        handler = AsyncMock()
+        await processor.process_feed(mock_container, None, handler)
+        await asyncio.sleep(0)
+
+        handler.assert_awaited_once_with(items[0])
+
+    async def test_process_feed_cancels_withdrawn_links(
+        self, processor: ChangeFeedProcessor, mock_orchestrator: MagicMock
+    ) -> None:
+        """Verify a deleted link cancels its in-flight pipeline."""
+        mock_container = MagicMock()
+        mock_container.id = "links"
+        item = {"id": "link-1", "status": "fetching", "deleted_at": "x"}
+        mock_response = MagicMock()
+        mock_response.by_page.return_value = _MockPageIterator(
+            [_SingleItemPage([item])], continuation_token=_TEST_CONTINUATION_TOKEN
+        )
+        mock_container.query_items_change_feed.return_value = mock_response
+
+        handler = AsyncMock()
+        await processor.process_feed(mock_container, None, handler)
+
+        mock_orchestrator.cancel_link.assert_called_once_with("link-1", "deleted")
+        handler.assert_not_awaited()
+
     async def test_process_feed_with_continuation_token(
         self, processor: ChangeFeedProcessor
     ) -> None:
@@ -185,11 +292,266 @@ class TestChangeFeedProcessor:
 
         assert result == "old-token"
 
+    async def test_process_feed_scopes_new_range_to_feed_range(
+        self, processor: ChangeFeedProcessor
+    ) -> None:
+        """Verify a range without a token is read from its feed range."""
+        mock_container = MagicMock()
+        mock_response = MagicMock()
+        mock_response.by_page.return_value = _MockPageIterator([], "t")
+        mock_container.query_items_change_feed.return_value = mock_response
+
+        await processor.process_feed(
+            mock_container, None, AsyncMock(), feed_range={"r": 1}
+        )
+
+        call_kwargs = mock_container.query_items_change_feed.call_args[1]
+        assert call_kwargs["feed_range"] == {"r": 1}
+        assert "continuation" not in call_kwargs
+
+    async def test_poll_loop_checkpoints_each_lease(
+        self, mock_database: MagicMock, mock_orchestrator: MagicMock
+    ) -> None:
+        """Verify each leased range polled is checkpointed on the next due flush."""
+        processor = ChangeFeedProcessor(mock_database, mock_orchestrator)
+        leases = _lease_manager()
+        processor._leases = leases  # noqa: SLF001
+        processor._checkpoints = CheckpointManager(leases, interval=0, max_items=1)  # noqa: SLF001
+
+        seen: set[str] = set()
+
+        async def _fake_process_feed(
+            *_args: object,
+            cursor: RangeCursor,
+            feed_range: dict[str, str],
+            **_kwargs: object,
+        ) -> str:
+            await _real_sleep(0)
+            seen.add(feed_range["r"])
+            if seen == {"links", "feedback"}:
+                processor._running = False  # noqa: SLF001
+            cursor.close_page(cursor.open_page(), "next-token")
+            return "next-token"
+
+        with (
+            patch.object(processor, "process_feed", side_effect=_fake_process_feed),
+            patch("asyncio.sleep", new_callable=AsyncMock),
+        ):
+            processor._running = True  # noqa: SLF001
+            await processor._poll_loop()  # noqa: SLF001
+        leases.checkpoint.assert_not_awaited()
+        await processor._flush_checkpoints(force=False)  # noqa: SLF001
+
+        checkpointed = {
+            (call.args[0].id, call.args[1]) for call in leases.checkpoint.call_args_list
+        }
+        assert checkpointed == {
+            ("lease-links", "next-token"),
+            ("lease-feedback", "next-token"),
+        }
+
+    async def test_process_feed_stops_paging_when_window_full(
+        self, mock_database: MagicMock, mock_orchestrator: MagicMock
+    ) -> None:
+        """Verify no further pages are read once the in-flight window fills."""
+        processor = ChangeFeedProcessor(
+            mock_database,
+            mock_orchestrator,
+            config=PipelineConfig(change_feed_max_in_flight=1),
+        )
+        mock_container = MagicMock()
+        pages = _MockPageIterator(
+            [_SingleItemPage([{"id": "a"}]), _SingleItemPage([{"id": "b"}])],
+            continuation_token=_FIRST_PAGE_TOKEN,
+        )
+        mock_response = MagicMock()
+        mock_response.by_page.return_value = pages
+        mock_container.query_items_change_feed.return_value = mock_response
+        release = asyncio.Event()
+
+        async def _blocked(_item: dict[str, str]) -> None:
+            await release.wait()
+
+        cursor = RangeCursor(None)
+        result = await processor.process_feed(
+            mock_container, None, _blocked, cursor=cursor
+        )
+
+        assert result == _FIRST_PAGE_TOKEN
+        assert processor.in_flight == 1
+        assert cursor.committed_token is None
+        release.set()
+        await asyncio.gather(*processor._handler_tasks)  # noqa: SLF001
+        assert cursor.committed_token == _FIRST_PAGE_TOKEN
+
+    async def test_full_links_window_does_not_block_feedback(
+        self, mock_database: MagicMock, mock_orchestrator: MagicMock
+    ) -> None:
+        """Verify each container pages against its own in-flight window."""
+        processor = ChangeFeedProcessor(
+            mock_database,
+            mock_orchestrator,
+            config=PipelineConfig(change_feed_max_in_flight=1),
+        )
+        processor._feed_in_flight["links"] = 1  # noqa: SLF001
+        mock_container = MagicMock()
+        mock_container.id = "feedback"
+        mock_response = MagicMock()
+        mock_response.by_page.return_value = _MockPageIterator(
+            [_SingleItemPage([{"id": "f1", "edition_id": "ed-1"}])]
+        )
+        mock_container.query_items_change_feed.return_value = mock_response
+        handler = AsyncMock()
+
+        await processor.process_feed(mock_container, None, handler)
+        await asyncio.gather(*processor._handler_tasks)  # noqa: SLF001
+
+        handler.assert_awaited_once()
+
+    async def test_handle_publish_runs_in_publish_lane(
+        self, processor: ChangeFeedProcessor
+    ) -> None:
+        """Verify publish approvals hold a publish lane slot while running."""
+        lanes = processor.lanes
+        active: list[int] = []
+
+        async def _publish(_edition_id: str) -> None:
+            active.append(lanes.active(Lane.PUBLISH))
+
+        processor.orchestrator.handle_publish = _publish
+
+        await processor.handle_publish("ed-1")
+
+        assert active == [1]
+        assert lanes.active(Lane.PUBLISH) == 0
+
+    async def test_poll_container_backs_off_while_idle(
+        self, processor: ChangeFeedProcessor
+    ) -> None:
+        """Verify an empty feed doubles the poll delay up to the ceiling."""
+        processor._leases = _lease_manager()  # noqa: SLF001
+        polls = 0
+
+        async def _empty(*_args: object, **_kwargs: object) -> None:
+            nonlocal polls
+            polls += 1
+            if polls > 5:  # noqa: PLR2004
+                processor._running = False  # noqa: SLF001
+
+        sleeps: list[float] = []
+        with (
+            patch.object(processor, "process_feed", side_effect=_empty),
+            patch("asyncio.sleep", AsyncMock(side_effect=sleeps.append)),
+        ):
+            processor._running = True  # noqa: SLF001
+            await processor._poll_container("links", AsyncMock())  # noqa: SLF001
+
+        assert sleeps == [1.0, 2.0, 4.0, 8.0, 10.0, 10.0]
+
+    async def test_poll_container_repolls_immediately_after_full_page(
+        self, processor: ChangeFeedProcessor
+    ) -> None:
+        """Verify a full page skips the idle delay."""
+        processor._leases = _lease_manager()  # noqa: SLF001
+        polls = 0
+
+        async def _full(*_args: object, cursor: RangeCursor, **_kwargs: object) -> None:
+            nonlocal polls
+            polls += 1
+            cursor.last_read = 100
+            cursor.saturated = polls == 1
+            if polls > 1:
+                processor._running = False  # noqa: SLF001
+
+        sleeps: list[float] = []
+        with (
+            patch.object(processor, "process_feed", side_effect=_full),
+            patch("asyncio.sleep", AsyncMock(side_effect=sleeps.append)),
+        ):
+            processor._running = True  # noqa: SLF001
+            await processor._poll_container("links", AsyncMock())  # noqa: SLF001
+
+        assert sleeps == [0, 1.0]
+
+    async def test_leases_renew_and_checkpoint_while_window_is_full(
+        self, mock_database: MagicMock, mock_orchestrator: MagicMock
+    ) -> None:
+        """Verify leases and checkpoints are kept up while polling is stalled."""
+        processor = ChangeFeedProcessor(
+            mock_database, mock_orchestrator, config=PipelineConfig()
+        )
+        processor._max_in_flight = 0  # noqa: SLF001
+        leases = _lease_manager()
+        processor._leases = leases  # noqa: SLF001
+        processor._running = True  # noqa: SLF001
+
+        stalled = asyncio.create_task(processor._wait_for_capacity("links"))  # noqa: SLF001
+        maintenance = asyncio.create_task(processor._maintenance_loop())  # noqa: SLF001
+        await _until(lambda: leases.owned.await_count >= _RENEWALS)
+
+        assert not stalled.done()
+        renewed = {call.args[1] for call in leases.owned.await_args_list}
+        assert renewed == {"links", "feedback"}
+        maintenance.cancel()
+
+        # Completed work is checkpointed while the poll loop is still stalled.
+        lease = Lease(id="lease-links", container="links", feed_range={"r": "links"})
+        cursor = processor._cursors[lease.id] = RangeCursor(None)  # noqa: SLF001
+        processor._range_leases[lease.id] = lease  # noqa: SLF001
+        cursor.close_page(cursor.open_page(), _FIRST_PAGE_TOKEN)
+        processor._checkpoint_interval = _RENEW_INTERVAL  # noqa: SLF001
+        processor._checkpoints = CheckpointManager(  # noqa: SLF001
+            leases, interval=_RENEW_INTERVAL, max_items=1000
+        )
+        maintenance = asyncio.create_task(processor._maintenance_loop())  # noqa: SLF001
+        await _until(lambda: leases.checkpoint.await_count > 0)
+
+        assert not stalled.done()
+        leases.checkpoint.assert_awaited_with(lease, _FIRST_PAGE_TOKEN)
+        processor._running = False  # noqa: SLF001
+        maintenance.cancel()
+        stalled.cancel()
+        await asyncio.gather(maintenance, stalled, return_exceptions=True)
+
+    async def test_stop_releases_leases(self, processor: ChangeFeedProcessor) -> None:
+        """Verify stop hands leases back for other workers."""
+        with patch.object(processor, "_poll_loop", new_callable=AsyncMock):
+            await processor.start()
+            leases = _lease_manager()
+            processor._leases = leases  # noqa: SLF001
+            await processor.stop()
+
+        leases.release_all.assert_awaited_once()
+
+    async def test_stop_flushes_buffered_checkpoints(
+        self, processor: ChangeFeedProcessor
+    ) -> None:
+        """Verify stop writes positions still waiting for the flush interval."""
+        with patch.object(processor, "_poll_loop", new_callable=AsyncMock):
+            await processor.start()
+            leases = _lease_manager()
+            processor._leases = leases  # noqa: SLF001
+            processor._checkpoints = CheckpointManager(  # noqa: SLF001
+                leases, interval=3600, max_items=1000
+            )
+            with patch.object(processor, "process_feed", new_callable=AsyncMock):
+                await processor._poll_leases(MagicMock(), AsyncMock(), "links")  # noqa: SLF001
+            cursor = processor._cursors["lease-links"]  # noqa: SLF001
+            cursor.close_page(cursor.open_page(), _FIRST_PAGE_TOKEN)
+            leases.checkpoint.assert_not_awaited()
+
+            await processor.stop()
+
+        lease, token = leases.checkpoint.await_args.args
+        assert lease.id == "lease-links"
+        assert token == _FIRST_PAGE_TOKEN
+
     async def test_poll_loop_processes_both_containers(
         self, mock_database: MagicMock, mock_orchestrator: MagicMock
     ) -> None:
         """Verify _poll_loop calls process_feed for links and feedback containers."""
         processor = ChangeFeedProcessor(mock_database, mock_orchestrator)
+        processor._leases = _lease_manager()  # noqa: SLF001
 
         call_count = 0
 
@@ -211,6 +573,7 @@ class TestChangeFeedProcessor:
     ) -> None:
         """Verify _poll_loop continues processing feedback even if links feed errors."""
         processor = ChangeFeedProcessor(mock_database, mock_orchestrator)
+        processor._leases = _lease_manager()  # noqa: SLF001
 
         call_count = 0
 
@@ -237,6 +600,7 @@ class TestChangeFeedProcessor:
     ) -> None:
         """Verify exponential backoff increases on consecutive errors."""
         processor = ChangeFeedProcessor(mock_database, mock_orchestrator)
+        processor._leases = _lease_manager()  # noqa: SLF001
 
         iteration = 0
 
@@ -267,6 +631,7 @@ class TestChangeFeedProcessor:
     ) -> None:
         """Verify connectivity errors log a single warning, not full tracebacks."""
         processor = ChangeFeedProcessor(mock_database, mock_orchestrator)
+        processor._leases = _lease_manager()  # noqa: SLF001
 
         iteration = 0
 
@@ -298,6 +663,7 @@ class TestChangeFeedProcessor:
     ) -> None:
         """Verify recovery is logged when connection is restored after errors."""
         processor = ChangeFeedProcessor(mock_database, mock_orchestrator)
+        processor._leases = _lease_manager()  # noqa: SLF001
 
         call_count = 0
 
@@ -323,3 +689,24 @@ class TestChangeFeedProcessor:
             c for c in mock_logger.info.call_args_list if "restored" in str(c)
         ]
         assert len(restored_calls) == 1
+
+
+class TestRangeCursor:
+    """Test checkpoint positions of a feed range."""
+
+    def test_commits_only_past_completed_pages_in_order(self) -> None:
+        """A later page cannot be committed while an earlier one is pending."""
+        cursor = RangeCursor(_TEST_CONTINUATION_TOKEN_SHORT)
+        first = cursor.open_page()
+        first.pending = 1
+        cursor.close_page(first, _FIRST_PAGE_TOKEN)
+        second = cursor.open_page()
+        second.pending = 1
+        cursor.close_page(second, _SECOND_PAGE_TOKEN)
+
+        cursor.item_done(second)
+        assert cursor.read_token == _SECOND_PAGE_TOKEN
+        assert cursor.committed_token == _TEST_CONTINUATION_TOKEN_SHORT
+
+        cursor.item_done(first)
+        assert cursor.committed_token == _SECOND_PAGE_TOKEN
@@ -0,0 +1,104 @@
+"""Tests for write-behind change feed checkpointing."""
+
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+from curate_worker.pipeline import checkpoints
+from curate_worker.pipeline.checkpoints import CheckpointManager
+from curate_worker.pipeline.leases import Lease
+
+_STORED_TOKEN = "stored"  # noqa: S105
+_NEW_TOKEN = "t1"  # noqa: S105
+_ITEM_THRESHOLD = 3
+_STALE_SECONDS = 60.0
+
+
+def _lease(continuation: str | None = _STORED_TOKEN) -> Lease:
+    return Lease(
+        id="lease-links",
+        container="links",
+        feed_range={"r": 1},
+        continuation=continuation,
+    )
+
+
+def _leases(*, ok: bool = True) -> MagicMock:
+    manager = MagicMock()
+    manager.checkpoint = AsyncMock(return_value=ok)
+    return manager
+
+
+async def test_unchanged_token_is_not_written() -> None:
+    """A position equal to the stored continuation never reaches the lease."""
+    leases = _leases()
+    manager = CheckpointManager(leases, interval=0, max_items=1)
+
+    manager.record(_lease(), _STORED_TOKEN)
+    await manager.maybe_flush()
+
+    leases.checkpoint.assert_not_awaited()
+    assert manager.last_checkpoint_age is None
+
+
+async def test_changed_token_waits_for_interval() -> None:
+    """A new token is buffered until the flush interval elapses."""
+    leases = _leases()
+    manager = CheckpointManager(leases, interval=3600, max_items=1000)
+
+    manager.record(_lease(), _NEW_TOKEN)
+    await manager.maybe_flush()
+    leases.checkpoint.assert_not_awaited()
+
+    await manager.flush()
+    leases.checkpoint.assert_awaited_once()
+    assert manager.last_checkpoint_age is not None
+
+
+async def test_item_threshold_triggers_flush() -> None:
+    """Completing enough items flushes before the interval elapses."""
+    leases = _leases()
+    manager = CheckpointManager(leases, interval=3600, max_items=_ITEM_THRESHOLD)
+    lease = _lease()
+
+    manager.record(lease, _NEW_TOKEN)
+    for _ in range(_ITEM_THRESHOLD):
+        manager.item_completed()
+    await manager.maybe_flush()
+
+    leases.checkpoint.assert_awaited_once_with(lease, _NEW_TOKEN)
+
+
+async def test_written_token_is_not_rewritten() -> None:
+    """Recording the same position again after a flush skips the write."""
+    leases = _leases()
+    manager = CheckpointManager(leases, interval=0, max_items=1)
+    lease = _lease()
+
+    manager.record(lease, _NEW_TOKEN)
+    await manager.flush()
+    manager.record(lease, _NEW_TOKEN)
+    await manager.flush()
+
+    leases.checkpoint.assert_awaited_once()
+
+
+async def test_flush_reports_lost_leases() -> None:
+    """Ranges whose checkpoint is rejected are returned so polling stops."""
+    manager = CheckpointManager(_leases(ok=False), interval=0, max_items=1)
+    lease = _lease()
+
+    manager.record(lease, _NEW_TOKEN)
+
+    assert await manager.flush() == {lease.id}
+
+
+def test_checkpoint_age_gauge_reports_oldest_live_manager() -> None:
+    """One gauge is shared by every manager and reports the oldest checkpoint."""
+    fresh = CheckpointManager(_leases(), interval=0, max_items=1)
+    stale = CheckpointManager(_leases(), interval=0, max_items=1)
+    fresh._last_checkpoint_at = time.monotonic()  # noqa: SLF001
+    stale._last_checkpoint_at = time.monotonic() - _STALE_SECONDS  # noqa: SLF001
+
+    (observation,) = checkpoints._observe_age(MagicMock())  # noqa: SLF001
+
+    assert observation.value >= _STALE_SECONDS
@@ -0,0 +1,94 @@
+"""Tests for link claim heartbeats and the expired-claim sweeper."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+from curate_worker.pipeline.claims import ClaimHeartbeat, ClaimSweeper
+
+_INTERVAL = 0.01
+_REQUEUED = 2
+
+
+async def test_heartbeat_renews_claim_while_running() -> None:
+    """The claim is renewed on each interval until the body finishes."""
+    links = AsyncMock()
+    links.renew_claim.return_value = True
+
+    async with ClaimHeartbeat(links, "l-1", "worker-a", interval=_INTERVAL):
+        await asyncio.sleep(_INTERVAL * 5)
+
+    links.renew_claim.assert_awaited_with("l-1", "worker-a")
+    calls = links.renew_claim.await_count
+    await asyncio.sleep(_INTERVAL * 3)
+    assert links.renew_claim.await_count == calls
+
+
+async def test_heartbeat_stops_when_claim_is_lost() -> None:
+    """A rejected renewal marks the claim lost and stops renewing."""
+    links = AsyncMock()
+    links.renew_claim.return_value = False
+
+    async with ClaimHeartbeat(links, "l-1", "worker-a", interval=_INTERVAL) as beat:
+        await asyncio.sleep(_INTERVAL * 5)
+
+    assert beat.lost is True
+    links.renew_claim.assert_awaited_once()
+
+
+async def test_heartbeat_reports_lost_claim() -> None:
+    """The lost-claim callback fires once so the pipeline can be cancelled."""
+    links = AsyncMock()
+    links.renew_claim.return_value = False
+    on_lost = MagicMock()
+
+    async with ClaimHeartbeat(
+        links, "l-1", "worker-a", interval=_INTERVAL, on_lost=on_lost
+    ):
+        await asyncio.sleep(_INTERVAL * 5)
+
+    on_lost.assert_called_once_with()
+
+
+async def test_sweeper_requeues_expired_claims() -> None:
+    """The sweeper asks the repository to requeue lapsed claims."""
+    links = AsyncMock()
+    links.requeue_expired_claims.return_value = _REQUEUED
+    sweeper = ClaimSweeper(links, interval=_INTERVAL)
+
+    sweeper.start()
+    await asyncio.sleep(_INTERVAL * 3)
+    await sweeper.stop()
+
+    links.requeue_expired_claims.assert_awaited()
+
+
+async def test_sweeper_recovers_runs_once_dead_peer_heartbeat_expires() -> None:
+    """Runs of a peer that looked live at startup are failed once it expires."""
+    links = AsyncMock()
+    links.requeue_expired_claims.return_value = 0
+    runs = AsyncMock()
+    runs.recover_orphaned_runs.return_value = 0
+    heartbeat = AsyncMock()
+    # The dead peer's heartbeat is still fresh when this worker starts.
+    heartbeat.live_workers.side_effect = [{"self", "dead"}, {"self"}, {"self"}]
+    sweeper = ClaimSweeper(
+        links, interval=_INTERVAL, runs_repo=runs, heartbeat=heartbeat
+    )
+
+    await sweeper.recover_runs()
+    sweeper.start()
+    await asyncio.sleep(_INTERVAL * 3)
+    await sweeper.stop()
+
+    calls = runs.recover_orphaned_runs.await_args_list
+    assert calls[0].kwargs == {"live_workers": {"self", "dead"}}
+    assert calls[1].kwargs == {"live_workers": {"self"}}
+
+
+async def test_sweeper_without_heartbeat_does_not_recover_runs() -> None:
+    """Run recovery needs the live worker list; without it nothing is failed."""
+    runs = AsyncMock()
+    sweeper = ClaimSweeper(AsyncMock(), interval=_INTERVAL, runs_repo=runs)
+
+    assert await sweeper.recover_runs() == 0
+    runs.recover_orphaned_runs.assert_not_awaited()
@@ -0,0 +1,61 @@
+"""Tests for worker liveness heartbeats."""
+
+import time
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+from curate_worker.pipeline.heartbeat import WorkerHeartbeat
+
+_TTL = 60.0
+
+
+class _Rows:
+    """Async iterable over query rows."""
+
+    def __init__(self, rows: list[dict[str, Any]]) -> None:
+        self._rows = iter(rows)
+
+    def __aiter__(self) -> "_Rows":
+        return self
+
+    async def __anext__(self) -> dict[str, Any]:
+        try:
+            return next(self._rows)
+        except StopIteration:
+            raise StopAsyncIteration from None
+
+
+async def test_beat_writes_expiring_document() -> None:
+    """A heartbeat records the owner and an expiry one TTL ahead."""
+    metadata = AsyncMock()
+    heartbeat = WorkerHeartbeat(metadata, "worker-a", ttl=_TTL)
+
+    await heartbeat.beat()
+
+    body = metadata.upsert_item.call_args.kwargs["body"]
+    assert body["id"] == "worker-heartbeat-worker-a"
+    assert body["owner"] == "worker-a"
+    assert body["expires_at"] > time.time() + _TTL / 2
+
+
+async def test_live_workers_returns_owners_of_unexpired_heartbeats() -> None:
+    """Live workers are read from heartbeats that have not expired."""
+    metadata = MagicMock()
+    metadata.query_items.return_value = _Rows([{"owner": "a"}, {"owner": "b"}])
+    heartbeat = WorkerHeartbeat(metadata, "worker-a", ttl=_TTL)
+
+    assert await heartbeat.live_workers() == {"a", "b"}
+    assert "c.expires_at > @now" in metadata.query_items.call_args.args[0]
+
+
+async def test_stop_removes_heartbeat() -> None:
+    """Stopping deletes the heartbeat so peers can recover runs at once."""
+    metadata = AsyncMock()
+    heartbeat = WorkerHeartbeat(metadata, "worker-a", ttl=_TTL)
+    heartbeat.start()
+
+    await heartbeat.stop()
+
+    metadata.delete_item.assert_awaited_once_with(
+        "worker-heartbeat-worker-a", partition_key="worker-heartbeat-worker-a"
+    )
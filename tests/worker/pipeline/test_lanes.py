@@ -0,0 +1,76 @@
+"""Tests for priority lane scheduling."""
+
+import asyncio
+
+from curate_worker.pipeline.lanes import Lane, LaneScheduler
+
+_LIMITS = {Lane.LINK: 1, Lane.FEEDBACK: 1, Lane.PUBLISH: 1}
+
+
+async def _hold(
+    scheduler: LaneScheduler,
+    lane: Lane,
+    edition_id: str,
+    release: asyncio.Event,
+    order: list[str],
+) -> None:
+    async with scheduler.slot(lane, edition_id):
+        order.append(edition_id)
+        await release.wait()
+
+
+async def test_full_link_lane_does_not_block_feedback() -> None:
+    """Feedback gets a slot while every link slot is taken."""
+    scheduler = LaneScheduler(_LIMITS)
+    release = asyncio.Event()
+    order: list[str] = []
+    link = asyncio.create_task(_hold(scheduler, Lane.LINK, "ed-1", release, order))
+    await asyncio.sleep(0)
+
+    async with scheduler.slot(Lane.FEEDBACK, "ed-1"):
+        assert scheduler.active(Lane.LINK) == 1
+        assert scheduler.active(Lane.FEEDBACK) == 1
+
+    release.set()
+    await link
+
+
+async def test_waiters_are_served_round_robin_by_edition() -> None:
+    """A large edition's backlog does not starve a smaller edition."""
+    scheduler = LaneScheduler(_LIMITS)
+    gate = asyncio.Event()
+    release = asyncio.Event()
+    release.set()
+    order: list[str] = []
+    first = asyncio.create_task(_hold(scheduler, Lane.LINK, "busy", gate, order))
+    await asyncio.sleep(0)
+    queued = [
+        asyncio.create_task(_hold(scheduler, Lane.LINK, edition, release, order))
+        for edition in ("busy", "busy", "busy", "small")
+    ]
+    await asyncio.sleep(0)
+
+    gate.set()
+    await asyncio.gather(first, *queued)
+
+    assert order == ["busy", "busy", "small", "busy", "busy"]
+
+
+async def test_cancelled_waiter_does_not_leak_slot() -> None:
+    """Cancelling a queued task leaves the lane's slot count intact."""
+    scheduler = LaneScheduler(_LIMITS)
+    release = asyncio.Event()
+    order: list[str] = []
+    holder = asyncio.create_task(_hold(scheduler, Lane.LINK, "ed-1", release, order))
+    await asyncio.sleep(0)
+    waiter = asyncio.create_task(_hold(scheduler, Lane.LINK, "ed-2", release, order))
+    await asyncio.sleep(0)
+
+    waiter.cancel()
+    await asyncio.gather(waiter, return_exceptions=True)
+    release.set()
+    await holder
+
+    assert scheduler.active(Lane.LINK) == 0
+    assert scheduler.waiting(Lane.LINK) == 0
+    assert order == ["ed-1"]
@@ -0,0 +1,170 @@
+"""Tests for feed-range lease acquisition, renewal, and rebalancing."""
+
+import asyncio
+import time
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+from azure.cosmos.exceptions import CosmosHttpResponseError
+
+from curate_worker.pipeline.leases import LeaseManager, lease_id
+
+_RANGES = [{"range": str(i)} for i in range(4)]
+_HALF = 2
+
+
+class _FakeMetadata:
+    """In-memory metadata container honouring ``_etag`` preconditions."""
+
+    def __init__(self) -> None:
+        self.docs: dict[str, dict[str, Any]] = {}
+        self._version = 0
+
+    def _stamp(self, body: dict[str, Any]) -> dict[str, Any]:
+        self._version += 1
+        doc = {**body, "_etag": str(self._version), "_ts": 1_700_000_000}
+        self.docs[body["id"]] = doc
+        return dict(doc)
+
+    async def read_item(self, item: str, partition_key: str) -> dict[str, Any]:  # noqa: ARG002
+        if item not in self.docs:
+            raise CosmosHttpResponseError(status_code=404, message="missing")
+        return dict(self.docs[item])
+
+    async def create_item(self, body: dict[str, Any]) -> dict[str, Any]:
+        if body["id"] in self.docs:
+            raise CosmosHttpResponseError(status_code=409, message="exists")
+        return self._stamp(body)
+
+    async def replace_item(
+        self, item: str, body: dict[str, Any], etag: str | None, **_kwargs: object
+    ) -> dict[str, Any]:
+        if self.docs.get(item, {}).get("_etag") != etag:
+            raise CosmosHttpResponseError(status_code=412, message="etag")
+        return self._stamp(body)
+
+
+class _Ranges:
+    """Async iterable over a fixed list of feed ranges."""
+
+    def __init__(self) -> None:
+        self._items = iter(_RANGES)
+
+    def __aiter__(self) -> "_Ranges":
+        return self
+
+    async def __anext__(self) -> dict[str, str]:
+        try:
+            return next(self._items)
+        except StopIteration:
+            raise StopAsyncIteration from None
+
+
+@pytest.fixture
+def metadata() -> _FakeMetadata:
+    """Create an in-memory metadata container."""
+    return _FakeMetadata()
+
+
+@pytest.fixture
+def container() -> MagicMock:
+    """Create a container exposing four feed ranges."""
+    mock = MagicMock()
+    mock.read_feed_ranges.side_effect = _Ranges
+    return mock
+
+
+async def test_single_worker_acquires_every_range(
+    metadata: _FakeMetadata, container: MagicMock
+) -> None:
+    """A lone worker takes all ranges and records itself as owner."""
+    manager = LeaseManager(metadata, "worker-a")  # type: ignore[arg-type]
+
+    leases = await manager.owned(container, "links")
+
+    assert len(leases) == len(_RANGES)
+    assert {doc["owner"] for doc in metadata.docs.values()} == {"worker-a"}
+
+
+async def test_concurrent_owned_calls_sync_once(
+    metadata: _FakeMetadata, container: MagicMock
+) -> None:
+    """The poll loop and the renewal timer never sync a container concurrently."""
+    manager = LeaseManager(metadata, "worker-a")  # type: ignore[arg-type]
+
+    first, second = await asyncio.gather(
+        manager.owned(container, "links"), manager.owned(container, "links")
+    )
+
+    assert container.read_feed_ranges.call_count == 1
+    assert [lease.id for lease in first] == [lease.id for lease in second]
+
+
+async def test_second_worker_rebalances_by_stealing(
+    metadata: _FakeMetadata, container: MagicMock
+) -> None:
+    """A joining worker steals one range per sync until shares are even."""
+    first = LeaseManager(metadata, "worker-a")  # type: ignore[arg-type]
+    second = LeaseManager(metadata, "worker-b")  # type: ignore[arg-type]
+    await first.owned(container, "links")
+
+    for _ in range(_HALF):
+        second._synced_at.clear()  # noqa: SLF001
+        await second.owned(container, "links")
+
+    owners = [doc["owner"] for doc in metadata.docs.values()]
+    assert owners.count("worker-a") == _HALF
+    assert owners.count("worker-b") == _HALF
+
+
+async def test_expired_lease_is_taken_over(
+    metadata: _FakeMetadata, container: MagicMock
+) -> None:
+    """Ranges held by a worker that stopped renewing move to a live worker."""
+    first = LeaseManager(metadata, "worker-a")  # type: ignore[arg-type]
+    await first.owned(container, "links")
+    for doc in metadata.docs.values():
+        doc["expires_at"] = time.time() - 1
+
+    leases = await LeaseManager(metadata, "worker-b").owned(container, "links")  # type: ignore[arg-type]
+
+    assert len(leases) == len(_RANGES)
+
+
+async def test_checkpoint_fails_after_lease_is_stolen(
+    metadata: _FakeMetadata, container: MagicMock
+) -> None:
+    """A worker whose lease was taken cannot checkpoint that range."""
+    manager = LeaseManager(metadata, "worker-a")  # type: ignore[arg-type]
+    lease = (await manager.owned(container, "links"))[0]
+    metadata.docs[lease.id]["_etag"] = "stolen"
+
+    assert await manager.checkpoint(lease, "token-1") is False
+    assert lease not in manager._owned["links"]  # noqa: SLF001
+
+
+async def test_new_lease_resumes_from_legacy_checkpoint(
+    metadata: _FakeMetadata, container: MagicMock
+) -> None:
+    """Upgrading from a single-token checkpoint starts ranges at its timestamp."""
+    await metadata.create_item({"id": "change-feed-token-links", "token": "t"})
+    manager = LeaseManager(metadata, "worker-a")  # type: ignore[arg-type]
+
+    await manager.owned(container, "links")
+
+    doc = metadata.docs[lease_id("links", _RANGES[0])]
+    assert doc["start_time"] is not None
+    assert doc["start_time"].startswith("2023-11-14")
+
+
+async def test_release_all_clears_ownership(
+    metadata: _FakeMetadata, container: MagicMock
+) -> None:
+    """Released leases are immediately available to other workers."""
+    manager = LeaseManager(metadata, "worker-a")  # type: ignore[arg-type]
+    await manager.owned(container, "links")
+
+    await manager.release_all()
+
+    assert all(doc["owner"] is None for doc in metadata.docs.values())
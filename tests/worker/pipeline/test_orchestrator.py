@@ -7,23 +7,30 @@ import json
 from typing import TYPE_CHECKING
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
 import pytest
 
+from curate_common.config import PipelineConfig
+from curate_common.models.agent_run import AgentRun, AgentRunStatus, AgentStage
 from curate_common.models.link import LinkStatus
+from curate_worker.agents.deadlines import PipelineDeadline
+from curate_worker.agents.prompts import prompt_version
 from curate_worker.pipeline.orchestrator import PipelineOrchestrator
 from curate_worker.pipeline.runs import RunManager
 
 if TYPE_CHECKING:
     from collections.abc import Callable
 
-    from curate_common.models.agent_run import AgentRun
     from curate_common.models.link import Link
 
 
 @pytest.fixture
 def mock_repos() -> tuple[AsyncMock, AsyncMock, AsyncMock, AsyncMock]:
     """Return (links, editions, feedback, agent_runs) mock repos."""
-    return AsyncMock(), AsyncMock(), AsyncMock(), AsyncMock()
+    links = AsyncMock()
+    # Conditional patches miss unless a test says otherwise.
+    links.patch.return_value = None
+    return links, AsyncMock(), AsyncMock(), AsyncMock()
 
 
 @pytest.fixture
@@ -36,6 +43,7 @@ def orchestrator(
     with (
         patch("curate_worker.pipeline.orchestrator.Agent"),
         patch("curate_worker.pipeline.orchestrator.FetchAgent"),
+        patch("curate_worker.pipeline.orchestrator.FusedReviewAgent"),
         patch("curate_worker.pipeline.orchestrator.ReviewAgent"),
         patch("curate_worker.pipeline.orchestrator.DraftAgent"),
         patch("curate_worker.pipeline.orchestrator.EditAgent"),
@@ -55,9 +63,11 @@ def orchestrator(
         orch._runs = MagicMock()  # noqa: SLF001
         orch._runs.create_orchestrator_run = AsyncMock()  # noqa: SLF001
         orch._runs.publish_run_event = AsyncMock()  # noqa: SLF001
+        orch.fused_review.extract = AsyncMock(return_value=None)
         return orch
 
 
+_SHORT_TIMEOUT = 0.01
 _START_EVENT_KEYS = {"id", "stage", "trigger_id", "edition_id", "status", "started_at"}
 
 
@@ -115,6 +125,16 @@ class TestStartEventPayloads:
         assert payload["edition_id"] == run.edition_id
         assert payload["status"] == run.status
 
+    async def test_run_manager_records_worker_id(self) -> None:
+        """RunManager tags runs with the id of the worker that started them."""
+        events = MagicMock()
+        events.publish = AsyncMock()
+        manager = RunManager(AsyncMock(), events, "worker-a")
+
+        run = await manager.create_orchestrator_run("ed-1", "l-1", {})
+
+        assert run.worker_id == "worker-a"
+
     async def test_record_stage_start_emits_same_schema(
         self,
         orchestrator: PipelineOrchestrator,
@@ -164,7 +184,7 @@ class TestHandleLinkChangeUsage:
             {"id": "l-1", "edition_id": "ed-1", "status": "submitted"}
         )
 
-        saved_run = runs.update.call_args[0][0]
+        saved_run = runs.complete.call_args[0][0]
         assert saved_run.usage is not None
         expected = {"input_tokens": 200, "output_tokens": 80, "total_tokens": 280}
         assert saved_run.usage == expected
@@ -190,7 +210,7 @@ class TestHandleLinkChangeUsage:
             {"id": "l-2", "edition_id": "ed-1", "status": "submitted"}
         )
 
-        saved_run = runs.update.call_args[0][0]
+        saved_run = runs.complete.call_args[0][0]
         assert saved_run.usage is None
 
 
@@ -371,7 +391,7 @@ class TestHandleLinkChangeRetry:
                 {"id": "l-retry", "edition_id": "ed-1", "status": "submitted"}
             )
 
-        saved_run = runs.update.call_args[0][0]
+        saved_run = runs.complete.call_args[0][0]
         assert saved_run.status == "completed"
 
     async def test_marks_failed_after_max_retries(
@@ -384,7 +404,7 @@ class TestHandleLinkChangeRetry:
         links, _editions, _feedback, runs = mock_repos
         link = make_link(id="l-fail", status="submitted")
         links.claim_submitted.return_value = link
-        links.get.return_value = link
+        links.patch.return_value = make_link(id="l-fail", status=LinkStatus.FAILED)
 
         orchestrator._agent.run = AsyncMock(  # noqa: SLF001
             side_effect=RuntimeError("persistent error"),
@@ -396,8 +416,393 @@ class TestHandleLinkChangeRetry:
                 {"id": "l-fail", "edition_id": "ed-1", "status": "submitted"}
             )
 
-        saved_run = runs.update.call_args[0][0]
+        saved_run = runs.complete.call_args[0][0]
         assert saved_run.status == "failed"
+        args, kwargs = links.patch.call_args
+        assert args == ("l-fail", "l-fail", {"status": LinkStatus.FAILED})
+        assert "c.status = 'submitted'" in kwargs["condition"]
+        assert "NOT IS_DEFINED(c.deleted_at)" in kwargs["condition"]
+        links.update.assert_not_called()
+        orchestrator._events.publish.assert_awaited_once()  # noqa: SLF001
+
+
+class TestHandleLinkChangeInterrupted:
+    """Tests for handing off a link whose pipeline is cancelled."""
+
+    async def test_cancel_releases_claim_and_closes_runs(
+        self,
+        orchestrator: PipelineOrchestrator,
+        mock_repos: tuple[AsyncMock, AsyncMock, AsyncMock, AsyncMock],
+        make_link: Callable[..., Link],
+    ) -> None:
+        """Verify a cancelled pipeline releases its claim and records the stage."""
+        links, _editions, _feedback, runs = mock_repos
+        links.claim_submitted.return_value = make_link(id="l-1", status="submitted")
+        links.release_claim.return_value = LinkStatus.REVIEWED
+        open_run = AgentRun(
+            stage=AgentStage.ORCHESTRATOR, edition_id="ed-1", trigger_id="l-1"
+        )
+        runs.get_by_trigger.return_value = [open_run]
+        orchestrator._agent.run = AsyncMock(side_effect=asyncio.CancelledError)  # noqa: SLF001
+
+        with pytest.raises(asyncio.CancelledError):
+            await orchestrator.handle_link_change(
+                {"id": "l-1", "edition_id": "ed-1", "status": "submitted"}
+            )
+
+        links.release_claim.assert_awaited_once_with("l-1", orchestrator.owner_id)
+        assert open_run.status == AgentRunStatus.FAILED
+        assert open_run.output is not None
+        assert open_run.output["checkpoint_stage"] == LinkStatus.REVIEWED
+        runs.complete.assert_awaited_with(open_run)
+
+
+class TestCancelLink:
+    """Tests for cancelling a link's in-flight pipeline."""
+
+    async def _start(
+        self,
+        orchestrator: PipelineOrchestrator,
+        mock_repos: tuple[AsyncMock, AsyncMock, AsyncMock, AsyncMock],
+        make_link: Callable[..., Link],
+    ) -> tuple[asyncio.Task, AgentRun]:
+        links, _editions, _feedback, runs = mock_repos
+        links.claim_submitted.return_value = make_link(id="l-1", status="submitted")
+        open_run = AgentRun(
+            stage=AgentStage.ORCHESTRATOR, edition_id="ed-1", trigger_id="l-1"
+        )
+        runs.get_by_trigger.return_value = [open_run]
+        started = asyncio.Event()
+
+        async def _hang(_message: str) -> None:
+            started.set()
+            await asyncio.Event().wait()
+
+        orchestrator._agent.run = AsyncMock(side_effect=_hang)  # noqa: SLF001
+        task = asyncio.create_task(
+            orchestrator.handle_link_change(
+                {"id": "l-1", "edition_id": "ed-1", "status": "submitted"}
+            )
+        )
+        await started.wait()
+        return task, open_run
+
+    async def test_cancel_abandons_withdrawn_link(
+        self,
+        orchestrator: PipelineOrchestrator,
+        mock_repos: tuple[AsyncMock, AsyncMock, AsyncMock, AsyncMock],
+        make_link: Callable[..., Link],
+    ) -> None:
+        """Verify a withdrawn link's pipeline stops without being resubmitted."""
+        links = mock_repos[0]
+        task, open_run = await self._start(orchestrator, mock_repos, make_link)
+
+        assert orchestrator.cancel_link("l-1", "deleted") is True
+        await task
+
+        assert not task.cancelled()
+        links.clear_claim.assert_awaited_with("l-1", orchestrator.owner_id)
+        links.release_claim.assert_not_awaited()
+        assert open_run.status == AgentRunStatus.FAILED
+        assert open_run.output == {
+            "error": "Cancelled before completion",
+            "reason": "deleted",
+        }
+
+    async def test_shutdown_during_cancel_hands_off(
+        self,
+        orchestrator: PipelineOrchestrator,
+        mock_repos: tuple[AsyncMock, AsyncMock, AsyncMock, AsyncMock],
+        make_link: Callable[..., Link],
+    ) -> None:
+        """Verify a shutdown cancellation still propagates and hands off."""
+        links = mock_repos[0]
+        task, _open_run = await self._start(orchestrator, mock_repos, make_link)
+
+        orchestrator.cancel_link("l-1", "deleted")
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        links.release_claim.assert_awaited_once_with("l-1", orchestrator.owner_id)
+
+    def test_cancel_unknown_link_is_noop(
+        self, orchestrator: PipelineOrchestrator
+    ) -> None:
+        """Verify links without a running pipeline are ignored."""
+        assert orchestrator.cancel_link("missing", "deleted") is False
+
+
+async def _hang(*_args: object, **_kwargs: object) -> None:
+    """Block until cancelled, standing in for a stuck agent call."""
+    await asyncio.Event().wait()
+
+
+class TestDeadlines:
+    """Tests for pipeline and stage deadlines."""
+
+    async def test_link_pipeline_past_deadline_times_out(
+        self,
+        orchestrator: PipelineOrchestrator,
+        mock_repos: tuple[AsyncMock, AsyncMock, AsyncMock, AsyncMock],
+        make_link: Callable[..., Link],
+    ) -> None:
+        """Verify an expired link pipeline fails the link and times out its runs."""
+        links, _editions, _feedback, runs = mock_repos
+        links.claim_submitted.return_value = make_link(id="l-1", status="submitted")
+        links.patch.return_value = make_link(id="l-1", status=LinkStatus.FAILED)
+        open_run = AgentRun(
+            stage=AgentStage.ORCHESTRATOR, edition_id="ed-1", trigger_id="l-1"
+        )
+        runs.get_by_trigger.return_value = [open_run]
+        orchestrator._run_timeout = _SHORT_TIMEOUT  # noqa: SLF001
+        orchestrator._agent.run = AsyncMock(side_effect=_hang)  # noqa: SLF001
+
+        await orchestrator.handle_link_change(
+            {"id": "l-1", "edition_id": "ed-1", "status": "submitted"}
+        )
+
+        args, kwargs = links.patch.call_args
+        assert args == ("l-1", "l-1", {"status": LinkStatus.FAILED})
+        assert "NOT IS_DEFINED(c.deleted_at)" in kwargs["condition"]
+        assert "c.status != 'drafted'" in kwargs["condition"]
+        links.update.assert_not_awaited()
+        assert open_run.status == AgentRunStatus.TIMED_OUT
+        links.release_claim.assert_not_awaited()
+        links.clear_claim.assert_awaited_once_with("l-1", orchestrator.owner_id)
+
+    async def test_stage_past_deadline_reports_timed_out(
+        self,
+        orchestrator: PipelineOrchestrator,
+    ) -> None:
+        """Verify a stuck sub-agent is cancelled and reported as timed out."""
+        orchestrator.fetch.agent.run = AsyncMock(side_effect=_hang)
+
+        async with PipelineDeadline(60.0, stage_timeout=_SHORT_TIMEOUT) as deadline:
+            result = await orchestrator._fetch_tool(task="fetch")  # noqa: SLF001
+
+        assert json.loads(result)["status"] == "timed_out"
+        assert deadline.expired_stages == [AgentStage.FETCH]
+
+    async def test_record_stage_complete_accepts_timed_out(
+        self,
+        orchestrator: PipelineOrchestrator,
+        mock_repos: tuple[AsyncMock, AsyncMock, AsyncMock, AsyncMock],
+    ) -> None:
+        """Verify the orchestrator agent can record a stage as timed out."""
+        links, _editions, _feedback, runs = mock_repos
+        run = AgentRun(stage=AgentStage.FETCH, edition_id="ed-1", trigger_id="l-1")
+        runs.get.return_value = run
+        links.get.return_value = None
+
+        await orchestrator.record_stage_complete(
+            run_id=run.id, trigger_id="l-1", edition_id="ed-1", status="timed_out"
+        )
+
+        assert run.status == AgentRunStatus.TIMED_OUT
+
+
+class TestHandleLinkChangeCachedReview:
+    """Tests for resuming re-associated links from a cached review."""
+
+    async def test_resumes_at_draft_with_valid_cached_review(
+        self,
+        orchestrator: PipelineOrchestrator,
+        mock_repos: tuple[AsyncMock, AsyncMock, AsyncMock, AsyncMock],
+        make_link: Callable[..., Link],
+    ) -> None:
+        """A review from the current prompt moves the link straight to reviewed."""
+        links, *_ = mock_repos
+        link = make_link(
+            id="l-cached",
+            content="Body",
+            review={"category": "AI", "prompt_version": prompt_version("review")},
+        )
+        links.claim_submitted.return_value = link
+        links.patch.side_effect = [
+            make_link(id="l-cached", status=LinkStatus.REVIEWED),
+            None,
+        ]
+        response = MagicMock(text="ok", usage_details=None)
+        orchestrator._agent.run = AsyncMock(return_value=response)  # noqa: SLF001
+
+        await orchestrator.handle_link_change(
+            {"id": "l-cached", "edition_id": "ed-1", "status": "submitted"}
+        )
+
+        links.update.assert_not_called()
+        args, kwargs = links.patch.call_args_list[0]
+        assert args == ("l-cached", "l-cached", {"status": LinkStatus.REVIEWED})
+        assert "c.status = 'submitted'" in kwargs["condition"]
+        assert "NOT IS_DEFINED(c.cancel_requested_at)" in kwargs["condition"]
+        message = orchestrator._agent.run.call_args.args[0]  # noqa: SLF001
+        assert "Current status: reviewed" in message
+
+    async def test_withdrawn_link_is_not_resumed(
+        self,
+        orchestrator: PipelineOrchestrator,
+        mock_repos: tuple[AsyncMock, AsyncMock, AsyncMock, AsyncMock],
+        make_link: Callable[..., Link],
+    ) -> None:
+        """A link stopped before the cached review is reused is left alone."""
+        links, *_ = mock_repos
+        links.claim_submitted.return_value = make_link(
+            id="l-cached",
+            content="Body",
+            review={"category": "AI", "prompt_version": prompt_version("review")},
+        )
+        orchestrator._agent.run = AsyncMock()  # noqa: SLF001
+
+        await orchestrator.handle_link_change(
+            {"id": "l-cached", "edition_id": "ed-1", "status": "submitted"}
+        )
+
+        links.patch.assert_awaited_once()
+        orchestrator._agent.run.assert_not_awaited()  # noqa: SLF001
+        links.clear_claim.assert_awaited_once_with("l-cached", orchestrator.owner_id)
+
+    async def test_runs_full_pipeline_when_review_is_stale(
+        self,
+        orchestrator: PipelineOrchestrator,
+        mock_repos: tuple[AsyncMock, AsyncMock, AsyncMock, AsyncMock],
+        make_link: Callable[..., Link],
+    ) -> None:
+        """A review from an older prompt version is not reused."""
+        links, *_ = mock_repos
+        link = make_link(
+            id="l-stale",
+            content="Body",
+            review={"category": "AI", "prompt_version": "outdated"},
+        )
+        links.claim_submitted.return_value = link
+        links.get.return_value = make_link(id="l-stale", status=LinkStatus.DRAFTED)
+        response = MagicMock(text="ok", usage_details=None)
+        orchestrator._agent.run = AsyncMock(return_value=response)  # noqa: SLF001
+
+        await orchestrator.handle_link_change(
+            {"id": "l-stale", "edition_id": "ed-1", "status": "submitted"}
+        )
+
+        links.update.assert_not_called()
+        message = orchestrator._agent.run.call_args.args[0]  # noqa: SLF001
+        assert "Current status: submitted" in message
+
+
+class TestHandleLinkChangeFusedReview:
+    """Tests for the single-call fetch + review path for short articles."""
+
+    async def test_short_article_resumes_at_draft(
+        self,
+        orchestrator: PipelineOrchestrator,
+        mock_repos: tuple[AsyncMock, AsyncMock, AsyncMock, AsyncMock],
+        make_link: Callable[..., Link],
+    ) -> None:
+        """A successful fused review records a review run and skips to draft."""
+        links, _editions, _feedback, runs = mock_repos
+        link = make_link(id="l-short", status="submitted")
+        links.claim_submitted.return_value = link
+        links.get.return_value = make_link(id="l-short", status=LinkStatus.DRAFTED)
+        orchestrator._runs.create_stage_run = AsyncMock(  # noqa: SLF001
+            return_value=MagicMock()
+        )
+        orchestrator.fused_review.extract = AsyncMock(return_value=("T", "Body"))
+        orchestrator.fused_review.run = AsyncMock(
+            return_value=MagicMock(usage_details=None)
+        )
+        orchestrator._agent.run = AsyncMock(  # noqa: SLF001
+            return_value=MagicMock(text="ok", usage_details=None)
+        )
+
+        await orchestrator.handle_link_change(
+            {"id": "l-short", "edition_id": "ed-1", "status": "submitted"}
+        )
+
+        orchestrator.fused_review.run.assert_awaited_once_with(link, "T", "Body")
+        fused_run = runs.complete.call_args_list[0].args[0]
+        assert fused_run.status == AgentRunStatus.COMPLETED
+        message = orchestrator._agent.run.call_args.args[0]  # noqa: SLF001
+        assert "Current status: reviewed" in message
+
+    async def test_falls_back_when_fused_review_fails(
+        self,
+        orchestrator: PipelineOrchestrator,
+        mock_repos: tuple[AsyncMock, AsyncMock, AsyncMock, AsyncMock],
+        make_link: Callable[..., Link],
+    ) -> None:
+        """A failed fused call marks its run failed and runs the full pipeline."""
+        links, _editions, _feedback, runs = mock_repos
+        link = make_link(id="l-short", status="submitted")
+        links.claim_submitted.return_value = link
+        links.get.return_value = make_link(id="l-short", status=LinkStatus.DRAFTED)
+        orchestrator._runs.create_stage_run = AsyncMock(  # noqa: SLF001
+            return_value=MagicMock()
+        )
+        orchestrator.fused_review.extract = AsyncMock(return_value=("T", "Body"))
+        orchestrator.fused_review.run = AsyncMock(side_effect=RuntimeError("boom"))
+        orchestrator._agent.run = AsyncMock(  # noqa: SLF001
+            return_value=MagicMock(text="ok", usage_details=None)
+        )
+
+        await orchestrator.handle_link_change(
+            {"id": "l-short", "edition_id": "ed-1", "status": "submitted"}
+        )
+
+        fused_run = runs.complete.call_args_list[0].args[0]
+        assert fused_run.status == AgentRunStatus.FAILED
+        message = orchestrator._agent.run.call_args.args[0]  # noqa: SLF001
+        assert "Current status: submitted" in message
+
+    async def test_falls_back_when_extract_raises(
+        self,
+        orchestrator: PipelineOrchestrator,
+        mock_repos: tuple[AsyncMock, AsyncMock, AsyncMock, AsyncMock],
+        make_link: Callable[..., Link],
+    ) -> None:
+        """An unexpected fetch error still runs the pipeline and clears the claim."""
+        links, _editions, _feedback, _runs = mock_repos
+        links.claim_submitted.return_value = make_link(id="l-bad", status="submitted")
+        links.get.return_value = make_link(id="l-bad", status=LinkStatus.DRAFTED)
+        orchestrator.fused_review.extract = AsyncMock(
+            side_effect=httpx.InvalidURL("Invalid URL")
+        )
+        orchestrator._agent.run = AsyncMock(  # noqa: SLF001
+            return_value=MagicMock(text="ok", usage_details=None)
+        )
+
+        ran = await orchestrator.handle_link_change(
+            {"id": "l-bad", "edition_id": "ed-1", "status": "submitted"}
+        )
+
+        assert ran is True
+        message = orchestrator._agent.run.call_args.args[0]  # noqa: SLF001
+        assert "Current status: submitted" in message
+        links.clear_claim.assert_awaited_once()
+
+    async def test_long_article_hands_extracted_text_to_fetch(
+        self,
+        orchestrator: PipelineOrchestrator,
+        mock_repos: tuple[AsyncMock, AsyncMock, AsyncMock, AsyncMock],
+        make_link: Callable[..., Link],
+    ) -> None:
+        """A page too long for the fused call is not fetched a second time."""
+        links, _editions, _feedback, _runs = mock_repos
+        link = make_link(id="l-long", status="submitted")
+        links.claim_submitted.return_value = link
+        links.get.return_value = make_link(id="l-long", status=LinkStatus.DRAFTED)
+        orchestrator.fused_review.extract = AsyncMock(return_value=("T", "Long"))
+        orchestrator.fused_review.fits = MagicMock(return_value=False)
+        orchestrator.fused_review.run = AsyncMock()
+        orchestrator._agent.run = AsyncMock(  # noqa: SLF001
+            return_value=MagicMock(text="ok", usage_details=None)
+        )
+
+        await orchestrator.handle_link_change(
+            {"id": "l-long", "edition_id": "ed-1", "status": "submitted"}
+        )
+
+        orchestrator.fetch.remember_page.assert_called_once_with(link.url, "T", "Long")
+        orchestrator.fetch.forget_page.assert_called_once_with(link.url)
+        orchestrator.fused_review.run.assert_not_awaited()
 
 
 class TestGetEditionLock:
@@ -464,7 +869,7 @@ class TestHandlePublishFailure:
 
         await orchestrator.handle_publish("ed-1")
 
-        saved_run = runs.update.call_args[0][0]
+        saved_run = runs.complete.call_args[0][0]
         assert saved_run.status == "failed"
         assert saved_run.output == {"error": "Orchestrator failed"}
 
@@ -488,7 +893,10 @@ class TestSubAgentUsageCapture:
 
         result = await orchestrator._fetch_tool(task="fetch this url")  # noqa: SLF001
 
-        assert result == "fetched content"
+        assert json.loads(result) == {
+            "status": "completed",
+            "summary": "fetched content",
+        }
         expected = {"input_tokens": 100, "output_tokens": 40, "total_tokens": 140}
         assert orchestrator._last_stage_usage == expected  # noqa: SLF001
 
@@ -508,7 +916,7 @@ class TestSubAgentUsageCapture:
 
         result = await orchestrator._review_tool(task="review this")  # noqa: SLF001
 
-        assert result == "reviewed"
+        assert json.loads(result)["summary"] == "reviewed"
         expected = {"input_tokens": 200, "output_tokens": 80, "total_tokens": 280}
         assert orchestrator._last_stage_usage == expected  # noqa: SLF001
 
@@ -528,12 +936,39 @@ class TestSubAgentUsageCapture:
 
         result = await orchestrator._draft_tool(task="draft this")  # noqa: SLF001
 
-        assert result == "drafted"
+        assert json.loads(result)["summary"] == "drafted"
         expected = {"input_tokens": 120, "output_tokens": 30, "total_tokens": 150}
         assert orchestrator._last_stage_usage == expected  # noqa: SLF001
         orchestrator.draft.run_guardrailed.assert_called_once_with("draft this")
         orchestrator.draft.agent.run.assert_not_called()
 
+    async def test_tool_result_truncated_to_compact_summary(
+        self,
+        orchestrator: PipelineOrchestrator,
+    ) -> None:
+        """Long sub-agent output is collapsed into a capped summary."""
+        response = MagicMock(text="word " * 500, usage_details=None)
+        orchestrator.review.agent.run = AsyncMock(return_value=response)
+
+        result = json.loads(await orchestrator._review_tool(task="review"))  # noqa: SLF001
+
+        assert result["truncated"] is True
+        assert len(result["summary"]) == PipelineConfig().tool_result_max_chars
+        assert result["summary"].endswith("…")
+
+    async def test_tool_returns_full_text_when_compaction_disabled(
+        self,
+        orchestrator: PipelineOrchestrator,
+    ) -> None:
+        """A non-positive limit passes the sub-agent text through unchanged."""
+        orchestrator._tool_result_max_chars = 0  # noqa: SLF001
+        response = MagicMock(text="full\noutput", usage_details=None)
+        orchestrator.fetch.agent.run = AsyncMock(return_value=response)
+
+        result = await orchestrator._fetch_tool(task="fetch")  # noqa: SLF001
+
+        assert result == "full\noutput"
+
     async def test_tool_sets_none_when_no_usage(
         self,
         orchestrator: PipelineOrchestrator,
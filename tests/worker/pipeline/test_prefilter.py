@@ -0,0 +1,118 @@
+"""Tests for the change feed prefilter."""
+
+from datetime import UTC, datetime, timedelta
+
+from curate_worker.pipeline.prefilter import ChangeFilter
+
+_COALESCED_LSN = 12
+
+
+def test_drops_non_actionable_link_statuses() -> None:
+    """Only submitted links attached to an edition are dispatched."""
+    change_filter = ChangeFilter()
+    items = [
+        {"id": "a", "status": "submitted", "edition_id": "ed-1"},
+        {"id": "b", "status": "reviewed", "edition_id": "ed-1"},
+        {"id": "c", "status": "submitted", "edition_id": None},
+        {"id": "d", "status": "submitted", "edition_id": "ed-1", "deleted_at": "x"},
+    ]
+
+    selected = change_filter.select("links", items)
+
+    assert [item["id"] for item in selected] == ["a"]
+    assert change_filter.dropped == len(items) - 1
+
+
+def test_drops_resolved_feedback() -> None:
+    """Resolved feedback is not dispatched."""
+    change_filter = ChangeFilter()
+    items = [{"id": "f1", "resolved": True}, {"id": "f2", "resolved": False}]
+
+    assert [item["id"] for item in change_filter.select("feedback", items)] == ["f2"]
+
+
+def test_drops_echo_of_own_write() -> None:
+    """A version this worker wrote is recognised by its etag and skipped."""
+    change_filter = ChangeFilter()
+    claimed = {"id": "a", "status": "submitted", "edition_id": "ed-1", "_etag": "e2"}
+    change_filter.record_write("links", claimed)
+
+    assert change_filter.select("links", [claimed]) == []
+
+
+def test_drops_versions_already_seen_by_lsn() -> None:
+    """A re-delivered version with an older or equal _lsn is skipped."""
+    change_filter = ChangeFilter()
+    item = {"id": "a", "status": "submitted", "edition_id": "ed-1", "_lsn": 5}
+    change_filter.select("links", [item])
+
+    assert change_filter.select("links", [item]) == []
+    assert change_filter.select("links", [{**item, "_lsn": 6}]) != []
+
+
+def test_coalesces_versions_of_same_id_within_page() -> None:
+    """Only the latest version of a document in a page is dispatched."""
+    change_filter = ChangeFilter()
+    items = [
+        {"id": "a", "status": "submitted", "edition_id": "ed-1", "_lsn": 11},
+        {"id": "a", "status": "submitted", "edition_id": "ed-1", "_lsn": 12},
+    ]
+
+    selected = change_filter.select("links", items)
+
+    assert [item["_lsn"] for item in selected] == [_COALESCED_LSN]
+
+
+def test_reports_withdrawn_links() -> None:
+    """Deleted, disassociated, and editor-stopped links are reported."""
+    change_filter = ChangeFilter()
+    items = [
+        {"id": "a", "status": "fetching", "edition_id": "ed-1"},
+        {"id": "b", "status": "fetching", "edition_id": "ed-1", "deleted_at": "x"},
+        {"id": "c", "status": "submitted"},
+        {
+            "id": "d",
+            "status": "failed",
+            "edition_id": "ed-1",
+            "cancel_requested_at": "x",
+        },
+    ]
+
+    assert change_filter.withdrawn("links", items) == [
+        ("b", "deleted"),
+        ("c", "disassociated"),
+        ("d", "cancelled"),
+    ]
+    assert change_filter.withdrawn("feedback", [{"id": "f1", "deleted_at": "x"}]) == []
+
+
+def test_drops_links_claimed_by_another_worker() -> None:
+    """A link another worker holds a live claim on is left to that worker."""
+    change_filter = ChangeFilter(owner_id="me", claim_ttl=timedelta(seconds=60))
+    now = datetime.now(UTC)
+    base = {"status": "submitted", "edition_id": "ed-1"}
+    items = [
+        {
+            "id": "a",
+            **base,
+            "processing_owner": "other",
+            "processing_claimed_at": now.isoformat(),
+        },
+        {
+            "id": "b",
+            **base,
+            "processing_owner": "other",
+            "processing_claimed_at": (now - timedelta(minutes=5)).isoformat(),
+        },
+        {
+            "id": "c",
+            **base,
+            "processing_owner": "me",
+            "processing_claimed_at": now.isoformat(),
+        },
+        {"id": "d", **base},
+    ]
+
+    selected = change_filter.select("links", items)
+
+    assert [item["id"] for item in selected] == ["b", "c", "d"]
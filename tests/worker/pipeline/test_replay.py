@@ -0,0 +1,373 @@
+"""Tests for change feed replay."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from azure.cosmos.exceptions import CosmosHttpResponseError
+
+from curate_common.database.repositories.links import LinkRepository
+from curate_common.models.edition import Edition
+from curate_common.models.link import LinkStatus
+from curate_worker.pipeline.orchestrator import PipelineOrchestrator
+from curate_worker.pipeline.replay import (
+    ChangeFeedReplayer,
+    RateLimiter,
+    ReplayOptions,
+    item_status,
+    replay_handlers,
+)
+
+_START_TOKEN = "token-start"  # noqa: S105
+_END_TOKEN = "token-end"  # noqa: S105
+_SINCE = datetime(2026, 1, 1, tzinfo=UTC)
+_RATE = 2.0
+
+
+class _Pages:
+    """Async iterable over pages with a continuation token."""
+
+    def __init__(self, pages: list[list[dict[str, Any]]], token: str) -> None:
+        self._pages = iter(pages)
+        self.continuation_token = token
+
+    def __aiter__(self) -> _Pages:
+        return self
+
+    async def __anext__(self) -> _Items:
+        try:
+            return _Items(next(self._pages))
+        except StopIteration:
+            raise StopAsyncIteration from None
+
+
+class _Items:
+    """Async iterable over one page's items."""
+
+    def __init__(self, items: list[dict[str, Any]]) -> None:
+        self._items = iter(items)
+
+    def __aiter__(self) -> _Items:
+        return self
+
+    async def __anext__(self) -> dict[str, Any]:
+        try:
+            return next(self._items)
+        except StopIteration:
+            raise StopAsyncIteration from None
+
+
+def _database(items: list[dict[str, Any]]) -> tuple[MagicMock, MagicMock]:
+    """Return a database whose containers replay ``items`` in one page."""
+    container = MagicMock()
+    container.query_items_change_feed.return_value.by_page.side_effect = lambda: _Pages(
+        [items], _END_TOKEN
+    )
+    database = MagicMock()
+    database.get_container_client.return_value = container
+    return database, container
+
+
+_LINKS = [
+    {"id": "link-1", "status": "submitted", "edition_id": "ed-1"},
+    {"id": "link-2", "status": "failed", "edition_id": "ed-1"},
+    {"id": "link-3", "status": "failed", "deleted_at": "2026-01-01T00:00:00Z"},
+]
+
+
+@pytest.mark.unit
+def test_item_status_maps_feedback_resolution() -> None:
+    """Feedback is filtered as open or resolved; links by their status."""
+    assert item_status("feedback", {"resolved": True}) == "resolved"
+    assert item_status("feedback", {"resolved": False}) == "open"
+    assert item_status("links", {"status": "failed"}) == "failed"
+
+
+@pytest.mark.unit
+async def test_replay_filters_by_status_and_skips_deleted() -> None:
+    """Only live items in a requested status reach the handler."""
+    database, _ = _database(_LINKS)
+    handler = AsyncMock(return_value=True)
+    replayer = ChangeFeedReplayer(database, {"links": handler})
+
+    result = await replayer.run(
+        ReplayOptions(containers=("links",), statuses=frozenset({"failed"}), rate=0)
+    )
+
+    handler.assert_awaited_once_with(_LINKS[1])
+    assert result.scanned == len(_LINKS)
+    assert result.matched == 1
+    assert result.replayed == 1
+    assert result.continuations == {"links": _END_TOKEN}
+
+
+@pytest.mark.unit
+async def test_replay_dry_run_does_not_call_handlers() -> None:
+    """A dry run counts matches without processing them."""
+    database, _ = _database(_LINKS)
+    handler = AsyncMock()
+    replayer = ChangeFeedReplayer(database, {"links": handler})
+
+    result = await replayer.run(
+        ReplayOptions(containers=("links",), dry_run=True, rate=0)
+    )
+
+    handler.assert_not_awaited()
+    expected_matches = 2
+    assert result.matched == expected_matches
+    assert result.replayed == 0
+
+
+@pytest.mark.unit
+async def test_replay_reads_from_start_time() -> None:
+    """Without a continuation the feed is read from the given time."""
+    database, container = _database([])
+    replayer = ChangeFeedReplayer(database, {"links": AsyncMock()})
+
+    await replayer.run(ReplayOptions(containers=("links",), start_time=_SINCE))
+
+    kwargs = container.query_items_change_feed.call_args.kwargs
+    assert kwargs["start_time"] == _SINCE
+    assert "continuation" not in kwargs
+
+
+@pytest.mark.unit
+async def test_replay_resumes_from_continuation() -> None:
+    """A continuation token takes precedence over the start time."""
+    database, container = _database([])
+    replayer = ChangeFeedReplayer(database, {"links": AsyncMock()})
+
+    await replayer.run(
+        ReplayOptions(
+            containers=("links",), start_time=_SINCE, continuation=_START_TOKEN
+        )
+    )
+
+    kwargs = container.query_items_change_feed.call_args.kwargs
+    assert kwargs["continuation"] == _START_TOKEN
+    assert "start_time" not in kwargs
+
+
+@pytest.mark.unit
+async def test_replay_counts_handler_failures() -> None:
+    """A failing item is counted and does not stop the replay."""
+    database, _ = _database(_LINKS[:2])
+    handler = AsyncMock(side_effect=[RuntimeError("boom"), True])
+    replayer = ChangeFeedReplayer(database, {"links": handler})
+
+    result = await replayer.run(ReplayOptions(containers=("links",), rate=0))
+
+    assert result.failed == 1
+    assert result.replayed == 1
+
+
+@pytest.mark.unit
+async def test_rate_limiter_spaces_calls() -> None:
+    """Consecutive calls wait for the rate interval."""
+    limiter = RateLimiter(_RATE)
+    with (
+        patch("curate_worker.pipeline.replay.time.monotonic", return_value=10.0),
+        patch("curate_worker.pipeline.replay.asyncio.sleep") as mock_sleep,
+    ):
+        await limiter.wait()
+        await limiter.wait()
+
+    mock_sleep.assert_awaited_once_with(1 / _RATE)
+
+
+class _LinkStore:
+    """In-memory links container honouring etags on replace."""
+
+    def __init__(self, *docs: dict[str, Any]) -> None:
+        self.docs = {doc["id"]: {**doc, "_etag": "1"} for doc in docs}
+
+    async def read_item(self, item: str, **_kwargs: Any) -> dict[str, Any]:
+        if item not in self.docs:
+            raise CosmosHttpResponseError(status_code=404, message="Not found")
+        return dict(self.docs[item])
+
+    async def replace_item(
+        self, item: str, body: dict[str, Any], etag: str | None = None, **_kwargs: Any
+    ) -> dict[str, Any]:
+        current = self.docs[item]
+        if etag is not None and etag != current["_etag"]:
+            raise CosmosHttpResponseError(status_code=412, message="Changed")
+        self.docs[item] = {**body, "_etag": str(int(current["_etag"]) + 1)}
+        return dict(self.docs[item])
+
+    async def patch_item(
+        self, item: str, patch_operations: list[dict[str, Any]], **_kwargs: Any
+    ) -> dict[str, Any]:
+        doc = self.docs[item]
+        for operation in patch_operations:
+            doc[operation["path"].lstrip("/")] = operation.get("value")
+        return dict(doc)
+
+
+def _orchestrator(links: LinkRepository) -> PipelineOrchestrator:
+    """Return a real orchestrator over ``links`` whose pipeline body is mocked."""
+    with (
+        patch("curate_worker.pipeline.orchestrator.Agent"),
+        patch("curate_worker.pipeline.orchestrator.FetchAgent"),
+        patch("curate_worker.pipeline.orchestrator.FusedReviewAgent"),
+        patch("curate_worker.pipeline.orchestrator.ReviewAgent"),
+        patch("curate_worker.pipeline.orchestrator.DraftAgent"),
+        patch("curate_worker.pipeline.orchestrator.EditAgent"),
+        patch("curate_worker.pipeline.orchestrator.PublishAgent"),
+        patch("curate_worker.pipeline.orchestrator.load_prompt", return_value=""),
+    ):
+        publisher = MagicMock()
+        publisher.publish = AsyncMock()
+        orchestrator = PipelineOrchestrator(
+            MagicMock(),
+            links,
+            AsyncMock(),
+            AsyncMock(),
+            AsyncMock(),
+            event_publisher=publisher,
+        )
+    orchestrator._process_link_with_deadline = AsyncMock()  # noqa: SLF001
+    return orchestrator
+
+
+def _links_repo(store: _LinkStore) -> LinkRepository:
+    database = MagicMock()
+    database.get_container_client.return_value = store
+    return LinkRepository(database)
+
+
+@pytest.mark.unit
+async def test_replayed_failed_link_is_resubmitted_and_processed() -> None:
+    """A failed link passes the claim gate again and its pipeline runs."""
+    store = _LinkStore(
+        {
+            "id": "link-1",
+            "url": "https://example.com",
+            "edition_id": "ed-1",
+            "status": "failed",
+            "title": "Old title",
+            "cancel_requested_at": "2026-01-01T00:00:00Z",
+        }
+    )
+    links = _links_repo(store)
+    orchestrator = _orchestrator(links)
+    database, _ = _database([store.docs["link-1"]])
+    replayer = ChangeFeedReplayer(
+        database, replay_handlers(orchestrator, links, AsyncMock())
+    )
+
+    result = await replayer.run(
+        ReplayOptions(containers=("links",), statuses=frozenset({"failed"}), rate=0)
+    )
+
+    assert result.replayed == 1
+    orchestrator._process_link_with_deadline.assert_awaited_once()  # noqa: SLF001
+    stored = store.docs["link-1"]
+    assert stored["status"] == LinkStatus.SUBMITTED
+    assert "title" not in stored
+    assert "cancel_requested_at" not in stored
+
+
+@pytest.mark.unit
+async def test_replayed_link_is_claimed_in_the_resubmit_write() -> None:
+    """The resubmitted link already belongs to the replayer, so live workers skip it."""
+    store = _LinkStore(
+        {
+            "id": "link-1",
+            "url": "https://example.com",
+            "edition_id": "ed-1",
+            "status": "failed",
+        }
+    )
+    links = _links_repo(store)
+    orchestrator = _orchestrator(links)
+    claimed: dict[str, Any] = {}
+
+    async def _run(*_args: Any) -> None:
+        claimed.update(store.docs["link-1"])
+        assert await links.claim_submitted("link-1", "live-worker") is None
+
+    orchestrator._process_link_with_deadline.side_effect = _run  # noqa: SLF001
+    handler = replay_handlers(orchestrator, links, AsyncMock())["links"]
+
+    assert await handler({"id": "link-1"}) is True
+    assert claimed["status"] == LinkStatus.SUBMITTED
+    assert claimed["processing_owner"] == orchestrator.owner_id
+
+
+@pytest.mark.unit
+async def test_replayed_drafted_link_material_is_removed_first() -> None:
+    """A drafted link's sections are stripped before the pipeline redrafts it."""
+    url = "https://example.com"
+    store = _LinkStore(
+        {"id": "link-1", "url": url, "edition_id": "ed-1", "status": "drafted"}
+    )
+    links = _links_repo(store)
+    orchestrator = _orchestrator(links)
+    edition = Edition(
+        id="ed-1",
+        content={"signals": [{"headline": "A", "url": url}]},
+        link_ids=["link-1"],
+        link_sections={"link-1": ["signals"]},
+    )
+    editions = AsyncMock()
+    editions.get.return_value = edition
+    handler = replay_handlers(orchestrator, links, editions)["links"]
+
+    assert await handler({"id": "link-1"}) is True
+
+    editions.update.assert_awaited_once_with(edition, "ed-1")
+    assert edition.content["signals"] == []
+    assert "link-1" not in edition.link_sections
+    orchestrator._process_link_with_deadline.assert_awaited_once()  # noqa: SLF001
+
+
+@pytest.mark.unit
+async def test_replay_skips_link_claimed_by_a_live_worker() -> None:
+    """A link another worker is processing is left alone and not counted."""
+    store = _LinkStore(
+        {
+            "id": "link-1",
+            "url": "https://example.com",
+            "edition_id": "ed-1",
+            "status": "fetching",
+            "processing_claimed_at": datetime.now(UTC).isoformat(),
+            "processing_owner": "other-worker",
+        }
+    )
+    links = _links_repo(store)
+    orchestrator = _orchestrator(links)
+    database, _ = _database([store.docs["link-1"]])
+    replayer = ChangeFeedReplayer(
+        database, replay_handlers(orchestrator, links, AsyncMock())
+    )
+
+    result = await replayer.run(ReplayOptions(containers=("links",), rate=0))
+
+    assert result.replayed == 0
+    assert result.skipped == 1
+    orchestrator._process_link_with_deadline.assert_not_awaited()  # noqa: SLF001
+    assert store.docs["link-1"]["status"] == "fetching"
+
+
+@pytest.mark.unit
+async def test_replayed_resolved_feedback_is_processed() -> None:
+    """Resolved feedback is handed to the orchestrator as open."""
+    orchestrator = _orchestrator(_links_repo(_LinkStore()))
+    orchestrator._runs = MagicMock()  # noqa: SLF001
+    orchestrator._runs.create_orchestrator_run = AsyncMock()  # noqa: SLF001
+    orchestrator._runs.publish_run_event = AsyncMock()  # noqa: SLF001
+    orchestrator._agent.run = AsyncMock(  # noqa: SLF001
+        return_value=MagicMock(text="ok", usage_details=None)
+    )
+    handler = replay_handlers(orchestrator, AsyncMock(), AsyncMock())["feedback"]
+
+    ran = await handler(
+        {"id": "fb-1", "edition_id": "ed-1", "comment": "Tighten", "resolved": True}
+    )
+
+    assert ran is True
+    orchestrator._agent.run.assert_awaited_once()  # noqa: SLF001
@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
+from datetime import UTC, datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from curate_worker.app import run
+from curate_worker.app import parse_args, replay_options, run
 
 
 @pytest.mark.unit
@@ -77,7 +78,7 @@ async def test_run_wires_event_and_command_channels() -> None:
     renderer.render_edition = MagicMock()
     processor = MagicMock()
     processor.stop = AsyncMock()
-    processor.orchestrator.handle_publish = AsyncMock()
+    processor.handle_publish = AsyncMock()
     command_consumer = MagicMock()
     command_consumer.start = AsyncMock()
     command_consumer.stop = AsyncMock()
@@ -118,5 +119,42 @@ async def test_run_wires_event_and_command_channels() -> None:
     )
     command_consumer_cls.assert_called_once_with(
         settings.servicebus,
-        on_publish=processor.orchestrator.handle_publish,
+        on_publish=processor.handle_publish,
     )
+
+
+@pytest.mark.unit
+def test_parse_args_builds_replay_options() -> None:
+    """The replay subcommand maps its flags onto replay options."""
+    args = parse_args(
+        [
+            "replay",
+            "--since",
+            "2026-01-01T00:00:00",
+            "--container",
+            "links",
+            "--status",
+            "failed",
+            "--dry-run",
+        ]
+    )
+    options = replay_options(args)
+
+    assert args.command == "replay"
+    assert options.containers == ("links",)
+    assert options.start_time == datetime(2026, 1, 1, tzinfo=UTC)
+    assert options.statuses == frozenset({"failed"})
+    assert options.dry_run is True
+
+
+@pytest.mark.unit
+def test_parse_args_rejects_continuation_for_several_containers() -> None:
+    """A continuation token belongs to a single container's feed."""
+    with pytest.raises(SystemExit):
+        parse_args(["replay", "--continuation", "token"])
+
+
+@pytest.mark.unit
+def test_parse_args_without_command_runs_worker() -> None:
+    """No subcommand keeps the long-running worker behaviour."""
+    assert parse_args([]).command is None